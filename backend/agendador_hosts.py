@@ -0,0 +1,152 @@
+# agendador_hosts.py
+import threading
+import time
+from contextlib import contextmanager
+from urllib.parse import urlsplit
+
+import config
+
+def host_da_url(url):
+    """Host (em minúsculas) de uma URL; aceita também um host puro."""
+    if '://' not in url:
+        url = 'http://' + url
+    return (urlsplit(url).hostname or '').lower()
+
+class LimiteHost:
+    """Limites de um host: taxa do token bucket, rajada e concorrência máxima."""
+
+    def __init__(self, taxa, rajada, max_concorrentes):
+        """
+        Args:
+            taxa (float): Requisições por segundo (reposição do bucket)
+            rajada (int): Capacidade do bucket (requisições seguidas sem espera)
+            max_concorrentes (int): Requisições simultâneas permitidas
+        """
+        self.taxa = taxa
+        self.rajada = rajada
+        self.max_concorrentes = max_concorrentes
+
+class _EstadoHost:
+    def __init__(self, limite):
+        self.limite = limite
+        self.tokens = float(limite.rajada)
+        self.abastecido_em = time.monotonic()
+        self.condicao = threading.Condition()
+        self.em_andamento = 0
+        self.aguardando = 0
+        self.requisicoes = 0
+        self.espera_total = 0.0
+
+    def abastecer(self):
+        agora = time.monotonic()
+        self.tokens = min(self.limite.rajada, self.tokens + (agora - self.abastecido_em) * self.limite.taxa)
+        self.abastecido_em = agora
+
+class AgendadorHosts:
+    """
+    Agendador de requisições por host.
+
+    Cada host tem um token bucket (taxa e rajada) e um limite de requisições
+    simultâneas. Uma requisição só sai quando o seu host tem token e vaga;
+    enquanto isso espera sem bloquear as requisições de outros hosts, de modo
+    que a vazão total cresce com o número de hosts e cada host continua
+    dentro do seu limite.
+    """
+
+    def __init__(self, limites=None, limite_padrao=None):
+        """
+        Args:
+            limites (dict): Host (ou domínio pai) -> LimiteHost
+                (padrão: config.LIMITES_POR_HOST)
+            limite_padrao (LimiteHost): Limite dos demais hosts
+        """
+        if limites is None:
+            limites = {host: LimiteHost(**valores) for host, valores in config.LIMITES_POR_HOST.items()}
+        self.limites = limites
+        self.limite_padrao = limite_padrao or LimiteHost(
+            config.HOST_TAXA_PADRAO, config.HOST_RAJADA_PADRAO, config.HOST_MAX_CONCORRENTES_PADRAO
+        )
+        self._estados = {}
+        self._lock = threading.Lock()
+
+    def limite_de(self, host):
+        """Limite do host, procurando também pelos domínios pais (ex.: html.duckduckgo.com -> duckduckgo.com)."""
+        partes = host.split('.')
+        for i in range(len(partes)):
+            limite = self.limites.get('.'.join(partes[i:]))
+            if limite is not None:
+                return limite
+        return self.limite_padrao
+
+    def _estado(self, host):
+        with self._lock:
+            estado = self._estados.get(host)
+            if estado is None:
+                estado = _EstadoHost(self.limite_de(host))
+                self._estados[host] = estado
+            return estado
+
+    def adquirir(self, url):
+        """Bloqueia até o host da URL ter token e vaga; ocupa a vaga."""
+        estado = self._estado(host_da_url(url))
+        limite = estado.limite
+        inicio = time.monotonic()
+        with estado.condicao:
+            estado.aguardando += 1
+            try:
+                while True:
+                    estado.abastecer()
+                    if estado.em_andamento < limite.max_concorrentes:
+                        if estado.tokens >= 1:
+                            estado.tokens -= 1
+                            estado.em_andamento += 1
+                            estado.requisicoes += 1
+                            estado.espera_total += time.monotonic() - inicio
+                            return
+                        # Espera o próximo token
+                        estado.condicao.wait((1 - estado.tokens) / limite.taxa)
+                    else:
+                        # Espera alguma requisição do host terminar
+                        estado.condicao.wait()
+            finally:
+                estado.aguardando -= 1
+
+    def liberar(self, url):
+        """Devolve a vaga ocupada por adquirir()."""
+        estado = self._estado(host_da_url(url))
+        with estado.condicao:
+            estado.em_andamento -= 1
+            estado.condicao.notify_all()
+
+    @contextmanager
+    def reservar(self, url):
+        """Context manager: adquirir() na entrada, liberar() na saída."""
+        self.adquirir(url)
+        try:
+            yield
+        finally:
+            self.liberar(url)
+
+    def estatisticas(self):
+        """Requisições em andamento e em espera (profundidade da fila) por host."""
+        with self._lock:
+            estados = list(self._estados.items())
+        hosts = {}
+        for host, estado in estados:
+            with estado.condicao:
+                hosts[host] = {
+                    "em_andamento": estado.em_andamento,
+                    "aguardando": estado.aguardando,
+                    "requisicoes": estado.requisicoes,
+                    "espera_media_segundos": round(estado.espera_total / estado.requisicoes, 3) if estado.requisicoes else 0.0,
+                    "taxa": estado.limite.taxa,
+                    "max_concorrentes": estado.limite.max_concorrentes
+                }
+        return {
+            "aguardando_total": sum(h["aguardando"] for h in hosts.values()),
+            "em_andamento_total": sum(h["em_andamento"] for h in hosts.values()),
+            "hosts": hosts
+        }
+
+# Agendador compartilhado por todas as requisições do processo
+agendador = AgendadorHosts()
@@ -1,12 +1,31 @@
 # amazonas_portals.py
 import pandas as pd
 import os
+import re
 from unidecode import unidecode
 
+# Prefixos removidos do nome buscado antes da comparação
+PREFIXOS = ['prefeitura de ', 'prefeitura municipal de ', 'camara municipal de ', 'camara de ']
+
+# Tipos de URL da planilha
+TIPOS_URL = ('site_oficial', 'site_camara', 'portal_transparencia')
+
+TOKEN_RE = re.compile(r'\w+')
+PREFIXO_MINIMO = 3  # Palavras digitadas pela metade casam a partir deste tamanho
+
+# Resultado de resolver_url quando a linha não tem URL do tipo pedido
+# (a busca continua nas linhas seguintes)
+SEM_URL = object()
+
 class AmazonasPortals:
     def __init__(self):
         self.data = None
+        self.registros = []  # (nome normalizado, {tipo: URL}) de cada linha, na ordem da planilha
+        self.por_nome = {}  # Nome normalizado -> {tipo: URL} da primeira linha com aquele nome que tem a URL
+        self.por_token = {}  # Palavra do nome (ou seu início) -> índices em self.registros
+        self.municipios = []
         self.load_data()
+        self.indexar()
         
     def normalize(self, text):
         """Remove acentuação e converte para minúsculas."""
@@ -53,6 +72,82 @@ class AmazonasPortals:
             print(f"Erro ao carregar dados: {e}")
             self.data = pd.DataFrame()
     
+    def resolver_url(self, linha, tipo):
+        """
+        URL de um tipo numa linha da planilha, já com o https:// e sem os
+        parênteses; None se a URL é um placeholder como "(A ser determinado)";
+        SEM_URL se a linha não tem URL do tipo.
+        """
+        url = linha.get(tipo)
+        # Verifica se é uma URL válida
+        if isinstance(url, str) and url.strip() and not url.startswith('('):
+            # Se for um placeholder como "(A ser determinado)", retorna None
+            if '(a ser determinado)' in url.lower():
+                return None
+            # Adiciona https:// se não tiver
+            if not url.startswith(('http://', 'https://')):
+                url = 'https://' + url
+            return url
+        
+        # Se não encontrou na coluna específica, tenta outras colunas relevantes
+        if tipo == 'site_oficial':
+            url = linha.get('url_site_oficial')
+            if isinstance(url, str) and url.strip() and not url.startswith('('):
+                if not url.startswith(('http://', 'https://')):
+                    url = 'https://' + url
+                return url
+        
+        if tipo == 'portal_transparencia':
+            url = linha.get('portal_transparencia')
+            if isinstance(url, str) and url.strip():
+                # Extrai a URL de dentro de parênteses se necessário
+                if url.startswith('(') and url.endswith(')'):
+                    url = url[1:-1]
+                if not url.startswith(('http://', 'https://')):
+                    url = 'https://' + url
+                return url
+        
+        return SEM_URL
+    
+    def indexar(self):
+        """
+        Resolve as URLs de todas as linhas uma única vez e monta os índices
+        por nome (correspondência exata) e por palavra (correspondência parcial).
+        """
+        self.registros = []
+        self.por_nome = {}
+        self.por_token = {}
+        self.municipios = []
+        if self.data is None or self.data.empty or 'nome_municipio' not in self.data.columns:
+            return
+        
+        for linha in self.data.to_dict('records'):
+            nome = linha['nome_municipio']
+            if isinstance(nome, str) and nome.strip() and nome != 'Nome_Município':
+                self.municipios.append(nome)
+            
+            nome_norm = linha['nome_municipio_norm']
+            if not nome_norm:
+                continue
+            urls = {}
+            for tipo in TIPOS_URL:
+                url = self.resolver_url(linha, tipo)
+                if url is not SEM_URL:
+                    urls[tipo] = url
+            
+            indice = len(self.registros)
+            self.registros.append((nome_norm, urls))
+            # Linhas repetidas: vale a primeira que tem a URL de cada tipo
+            por_tipo = self.por_nome.setdefault(nome_norm, {})
+            for tipo, url in urls.items():
+                por_tipo.setdefault(tipo, url)
+            tokens = set()
+            for palavra in TOKEN_RE.findall(nome_norm):
+                tokens.add(palavra)
+                tokens.update(palavra[:i] for i in range(PREFIXO_MINIMO, len(palavra)))
+            for token in tokens:
+                self.por_token.setdefault(token, []).append(indice)
+    
     def get_url(self, orgao, tipo='site_oficial'):
         """
         Obtém a URL para um órgão específico.
@@ -64,7 +159,7 @@ class AmazonasPortals:
         Returns:
             str or None: URL se encontrada, None caso contrário
         """
-        if self.data is None or self.data.empty:
+        if not self.registros:
             return None
             
         # Normaliza o nome do órgão para comparação
@@ -72,103 +167,46 @@ class AmazonasPortals:
         
         # Remove prefixos comuns para melhorar a correspondência
         search_term = orgao_norm
-        for prefix in ['prefeitura de ', 'prefeitura municipal de ', 'camara municipal de ', 'camara de ']:
+        for prefix in PREFIXOS:
             if search_term.startswith(prefix):
                 search_term = search_term[len(prefix):]
                 break
         
         # Primeiro, tenta encontrar correspondência exata
-        for idx, row in self.data.iterrows():
-            if 'nome_municipio_norm' in row and row['nome_municipio_norm'] == search_term:
-                # Mapeia o tipo para a coluna correspondente
-                col_map = {
-                    'site_oficial': 'site_oficial',
-                    'site_camara': 'site_camara',
-                    'portal_transparencia': 'portal_transparencia'
-                }
-                
-                col = col_map.get(tipo)
-                if col and col in row:
-                    url = row[col]
-                    # Verifica se é uma URL válida
-                    if isinstance(url, str) and url.strip() and not url.startswith('('):
-                        # Se for um placeholder como "(A ser determinado)", retorna None
-                        if '(a ser determinado)' in url.lower():
-                            return None
-                        # Adiciona https:// se não tiver
-                        if not url.startswith(('http://', 'https://')):
-                            url = 'https://' + url
-                        return url
-                
-                # Se não encontrou na coluna específica, tenta outras colunas relevantes
-                if tipo == 'site_oficial' and 'url_site_oficial' in row:
-                    url = row['url_site_oficial']
-                    if isinstance(url, str) and url.strip() and not url.startswith('('):
-                        if not url.startswith(('http://', 'https://')):
-                            url = 'https://' + url
-                        return url
-                
-                if tipo == 'portal_transparencia' and 'portal_transparencia' in row:
-                    url = row['portal_transparencia']
-                    if isinstance(url, str) and url.strip():
-                        # Extrai a URL de dentro de parênteses se necessário
-                        if url.startswith('(') and url.endswith(')'):
-                            url = url[1:-1]
-                        if not url.startswith(('http://', 'https://')):
-                            url = 'https://' + url
-                        return url
+        urls = self.por_nome.get(search_term)
+        if urls is not None and tipo in urls:
+            return urls[tipo]
         
         # Se não encontrou correspondência exata, tenta correspondência parcial
-        for idx, row in self.data.iterrows():
-            if 'nome_municipio_norm' in row and (search_term in row['nome_municipio_norm'] or row['nome_municipio_norm'] in search_term):
-                # Mesma lógica de extração de URL que acima
-                col_map = {
-                    'site_oficial': 'site_oficial',
-                    'site_camara': 'site_camara',
-                    'portal_transparencia': 'portal_transparencia'
-                }
-                
-                col = col_map.get(tipo)
-                if col and col in row:
-                    url = row[col]
-                    if isinstance(url, str) and url.strip() and not url.startswith('('):
-                        if '(a ser determinado)' in url.lower():
-                            return None
-                        if not url.startswith(('http://', 'https://')):
-                            url = 'https://' + url
-                        return url
-                
-                if tipo == 'site_oficial' and 'url_site_oficial' in row:
-                    url = row['url_site_oficial']
-                    if isinstance(url, str) and url.strip() and not url.startswith('('):
-                        if not url.startswith(('http://', 'https://')):
-                            url = 'https://' + url
-                        return url
-                
-                if tipo == 'portal_transparencia' and 'portal_transparencia' in row:
-                    url = row['portal_transparencia']
-                    if isinstance(url, str) and url.strip():
-                        if url.startswith('(') and url.endswith(')'):
-                            url = url[1:-1]
-                        if not url.startswith(('http://', 'https://')):
-                            url = 'https://' + url
-                        return url
+        # entre as linhas que compartilham alguma palavra (ou início de
+        # palavra) com o nome buscado
+        candidatas = set()
+        for token in TOKEN_RE.findall(search_term):
+            candidatas.update(self.por_token.get(token, ()))
+        url = self._primeira_parcial(search_term, tipo, sorted(candidatas))
+        if url is SEM_URL:
+            # Trechos do meio de uma palavra ("abriel") não estão no índice:
+            # percorre todas as linhas, como a busca por substring original
+            url = self._primeira_parcial(search_term, tipo, range(len(self.registros)))
         
         # Se não encontrou nada, retorna None
-        return None
+        return None if url is SEM_URL else url
+    
+    def _primeira_parcial(self, search_term, tipo, indices):
+        """
+        URL da primeira linha (entre `indices`) cujo nome contém ou está
+        contido no buscado; SEM_URL se nenhuma linha corresponde.
+        """
+        for indice in indices:
+            nome_norm, urls = self.registros[indice]
+            if tipo in urls and (search_term in nome_norm or nome_norm in search_term):
+                return urls[tipo]
+        return SEM_URL
     
     def get_all_municipalities(self):
         """Retorna a lista de todos os municípios na planilha."""
-        if self.data is None or self.data.empty or 'nome_municipio' not in self.data.columns:
-            return []
-        
-        # Filtra apenas linhas que parecem ser municípios (não cabeçalhos ou linhas vazias)
-        municipios = []
-        for nome in self.data['nome_municipio']:
-            if isinstance(nome, str) and nome.strip() and nome != 'Nome_Município':
-                municipios.append(nome)
-        
-        return municipios
+        # Apenas linhas que parecem ser municípios (não cabeçalhos ou linhas vazias)
+        return list(self.municipios)
 
 # Instância global para uso em outros módulos
 amazonas_portals = AmazonasPortals()
@@ -2,16 +2,21 @@
 from flask import Flask, request, jsonify, Response
 from flask_cors import CORS
 import scraper
-import queue
-import threading
+import driver_pool
+import historico
+import config
+import http_client
+import criterios
+import reavaliacao
+import planilha_links
 import json
-import time
 import os
-import pandas as pd
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta, date
-from utils import save_criteria_json
-import requests
-from bs4 import BeautifulSoup
+from agendador_hosts import agendador
+from page_store import PageStore, downloads_em_andamento
+from jobs import JobRegistry
+from avaliacao import executar_scraping, montar_perguntas, verificar_disponibilidade_simples
 from known_urls import get_known_url
 from amazonas_portals import get_amazonas_url, get_all_amazonas_municipalities
 
@@ -19,104 +24,39 @@ from amazonas_portals import get_amazonas_url, get_all_amazonas_municipalities
 app = Flask(__name__, static_url_path='/static', static_folder='static')
 CORS(app)  # Importante para permitir requisições do frontend React
 
-# Caminho para o arquivo CSV
-CSV_PATH = 'lista_criterios.csv'
-df_transparencia = None
+# Avaliações em andamento, cada uma com seus eventos e seu cancelamento
+jobs = JobRegistry()
 
-# Fila para armazenar resultados
-resultados_queue = queue.Queue()
-scraping_em_andamento = False
-cancelamento_solicitado = False
+# Links da planilha lista_criterios.csv, recarregada quando o arquivo muda
+planilha = planilha_links.obter_planilha_links()
 
-# Carregar dados do CSV
-def carregar_dados_csv():
-    global df_transparencia
-    try:
-        if os.path.exists(CSV_PATH):
-            df_transparencia = pd.read_csv(CSV_PATH, delimiter=';')
-            print("Arquivo CSV carregado com sucesso.")
-        else:
-            print(f"Aviso: Arquivo CSV não encontrado em {CSV_PATH}. Será criado um arquivo vazio.")
-            # Criar um DataFrame vazio com as colunas necessárias
-            df_transparencia = pd.DataFrame(columns=['sigla_UG', 'ID_criterio', 'link'])
-            # Salvar o DataFrame vazio como CSV
-            df_transparencia.to_csv(CSV_PATH, sep=';', index=False)
-    except Exception as e:
-        df_transparencia = None
-        print(f"ERRO CRÍTICO: Falha ao carregar o CSV. {e}")
-
-# Carregar dados na inicialização
-carregar_dados_csv()
-
-# Load criteria on startup
-criteria_data = save_criteria_json()
+# Critérios carregados uma única vez de data/criterios.json
+registro_criterios = criterios.obter_registro()
 
 def normalizar_texto(texto):
     if texto is None:
         return ""
     return texto.strip().lower()
 
-def obter_link_da_planilha(sigla_UG, ID_criterio):
-    if df_transparencia is None:
-        return None
+def obter_links_da_planilha(sigla_UG):
+    """Links da planilha de uma UG, por ID do critério."""
+    return planilha.links_da_ug(sigla_UG)
 
-    # Normaliza a sigla da UG
-    ug_norm = sigla_UG.strip().lower()
-    
-    try:
-        # Filtra pela coluna de sigla
-        df_ug = df_transparencia[
-            df_transparencia['sigla_UG'].str.strip().str.lower() == ug_norm
-        ]
-        if df_ug.empty:
-            return None
-
-        # Filtra pela coluna de ID_criterio
-        df_crit = df_ug[df_ug['ID_criterio'].astype(str) == str(ID_criterio)]
-        if df_crit.empty:
-            return None
-
-        link = df_crit.iloc[0]['link']
-        if pd.isna(link) or not str(link).strip():
-            return None
-
-        return str(link).strip()
-    except Exception as e:
-        print(f"Erro ao obter link da planilha: {e}")
-        return None
-
-def verificar_disponibilidade_simples(url):
-    """Verifica se uma URL está disponível, com timeout reduzido e tratamento de erros melhorado"""
-    if not url: 
-        return False
-    try:
-        # Reduzir o timeout para 8 segundos para evitar esperas longas
-        response = requests.get(url, timeout=8, headers={
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        })
-        return response.status_code == 200
-    except requests.Timeout:
-        print(f"Timeout ao acessar {url}")
-        return False
-    except requests.ConnectionError:
-        print(f"Erro de conexão ao acessar {url}")
-        return False
-    except requests.RequestException as e:
-        print(f"Erro ao acessar {url}: {e}")
-        return False
-
-@app.route('/api/avaliar_criterio', methods=['POST'])
-def avaliar_criterio_endpoint():
-    dados_requisicao = request.get_json()
-    unidade_gestora = dados_requisicao.get('unidade_gestora')
-    criterio_descricao = dados_requisicao.get('criterio_descricao')
-    criterio_id = dados_requisicao.get('criterio_id') 
+def obter_link_da_planilha(sigla_UG, ID_criterio):
+    return planilha.obter(sigla_UG, ID_criterio)
 
-    if not unidade_gestora or not criterio_id:
-        return jsonify({"erro": "Nome da Unidade Gestora e ID do Critério são obrigatórios."}), 400
+def resolver_link_criterio(unidade_gestora, criterio_id, criterio_descricao, links_ug=None):
+    """
+    Link consultado para um critério: planilha, URL conhecida ou busca.
 
+    Args:
+        links_ug (dict): Links da planilha da UG já obtidos (avaliação em lote)
+    """
     # Primeiro, verificar se temos o link na planilha
-    link_consultado = obter_link_da_planilha(unidade_gestora, criterio_id)
+    if links_ug is None:
+        link_consultado = obter_link_da_planilha(unidade_gestora, criterio_id)
+    else:
+        link_consultado = links_ug.get(str(criterio_id))
     
     # Se não temos o link na planilha, tentar URL conhecida
     if not link_consultado:
@@ -137,40 +77,73 @@ def avaliar_criterio_endpoint():
             else:
                 query = f"{criterio_descricao} {unidade_gestora}"
                 
-            # Verificar cache primeiro
-            cached_results = scraper.get_cached_results(query)
-            if cached_results and cached_results[0]:
-                link_consultado = cached_results[0]
-            else:
-                # Se não estiver em cache, fazer busca
-                links = scraper.buscar_no_google(query, 3)
-                if links:
-                    link_consultado = links[0]
+            link_consultado = buscar_link(query)
+    
+    return link_consultado
 
-    resultados_verificacao = {}
-    # Defina quais itens de verificação são aplicáveis para cada critério.
-    itens_aplicaveis = []
-    if criterio_id == "1.1": # "Possui sitio oficial proprio na internet?"
-        itens_aplicaveis = ["disponibilidade"]
-    elif criterio_id == "1.2": # "Possui portal da transparência próprio ou compartilhado na internet?"
-        itens_aplicaveis = ["disponibilidade"]
-    elif criterio_id == "1.3": # "O acesso ao portal transparência está visível na capa do site?"
-        itens_aplicaveis = ["disponibilidade"]
-    elif criterio_id == "1.4": # "O site e o portal de transparência contêm ferramenta de pesquisa de conteúdo que permita o acesso à informação?"
-        itens_aplicaveis = ["disponibilidade"]
-    elif criterio_id in ["3.1", "3.2", "4.1", "4.2"]:
-        itens_aplicaveis = ["disponibilidade", "atualidade", "serie_historica", "gravacao_relatorios", "filtro_pesquisa"]
-    elif criterio_id == "11.5":
-        itens_aplicaveis = ["disponibilidade", "atualidade"]
-    else:
-        itens_aplicaveis = ["disponibilidade"]  # Default para outros critérios
+def buscar_link(query):
+    """Primeiro resultado da busca, consultando o cache antes."""
+    # Verificar cache primeiro
+    cached_results = scraper.get_cached_results(query)
+    if cached_results and cached_results[0]:
+        return cached_results[0]
+    # Se não estiver em cache, fazer busca
+    links = scraper.buscar_no_google(query, 3)
+    if links:
+        return links[0]
+    return None
 
-    if not itens_aplicaveis:
-        print(f"Alerta: Nenhum item de verificação mapeado para o critério ID {criterio_id}.")
+def avaliar_criterio(unidade_gestora, criterio_id, criterio_descricao=None, store=None, links_ug=None):
+    """
+    Avalia um critério de uma unidade gestora: resolve o link e executa as
+    verificações aplicáveis ao critério.
+
+    Args:
+        unidade_gestora (str): Nome ou sigla da UG
+        criterio_id (str): ID do critério
+        criterio_descricao (str): Texto do critério, usado na busca (padrão: texto da matriz)
+        store (PageStore): Páginas compartilhadas entre avaliações (lote)
+        links_ug (dict): Links da planilha da UG já obtidos (lote)
+
+    Returns:
+        dict: resultados_verificacao, evidencia, link e reaproveitados
+    """
+    if not criterio_descricao:
+        criterio = registro_criterios.obter(criterio_id)
+        criterio_descricao = criterio["pergunta"] if criterio else criterio_id
+    
+    link_consultado = resolver_link_criterio(unidade_gestora, criterio_id, criterio_descricao, links_ug)
+
+    resultados_verificacao = {}
+    reaproveitados = []  # Verificações cujo veredito anterior foi reaproveitado
+    # Itens de verificação aplicáveis ao critério (tabela em data/criterios.json)
+    verificacoes = registro_criterios.verificacoes_de(criterio_id)
+    itens_aplicaveis = registro_criterios.itens_aplicaveis(criterio_id)
 
     if link_consultado:
         evidencia_texto = f"Evidência: {link_consultado}"
 
+        # A página do critério é baixada e interpretada uma única vez
+        # e compartilhada por todas as verificações abaixo
+        if store is None:
+            store = PageStore(timeout=8)
+        hoje = datetime.now().date()
+        
+        def verificar(funcao, *args, janela=None):
+            """
+            Executa funcao(documento, *args) sobre a página do critério, ou
+            reaproveita o veredito anterior se a página não mudou (e a janela
+            de tempo da verificação, quando houver, é a mesma).
+            """
+            pagina = store.obter(link_consultado)
+            resultado, reaproveitado = reavaliacao.verificar(
+                (funcao.__name__, link_consultado, *args), [pagina],
+                lambda: funcao(pagina.documento, *args), janela
+            )
+            if reaproveitado:
+                reaproveitados.append(funcao.__name__)
+            return resultado
+
         # Verificar disponibilidade
         if "disponibilidade" in itens_aplicaveis:
             # Tratamento especial para o TCE-AM
@@ -180,112 +153,252 @@ def avaliar_criterio_endpoint():
                 else:
                     # Para outros critérios, usar URL alternativa
                     alt_url = "https://transparencia.tce.am.gov.br/"
-                    resultados_verificacao["disponibilidade"] = "Atendido" if verificar_disponibilidade_simples(alt_url) else "Não Atendido"
+                    resultados_verificacao["disponibilidade"] = "Atendido" if verificar_disponibilidade_simples(alt_url, store) else "Não Atendido"
             else:
                 # Verificação normal para outros sites
-                resultados_verificacao["disponibilidade"] = "Atendido" if verificar_disponibilidade_simples(link_consultado) else "Não Atendido"
+                resultados_verificacao["disponibilidade"] = "Atendido" if verificar_disponibilidade_simples(link_consultado, store) else "Não Atendido"
 
-        # Verificar outros critérios
-        if "atualidade" in itens_aplicaveis:
+        # Demais itens: função de verificação de cada item, pela tabela do critério
+        for verificacao in verificacoes:
             try:
-                response = requests.get(link_consultado, timeout=8, headers={'User-Agent': 'Mozilla/5.0'})
-                soup = BeautifulSoup(response.text, 'html.parser')
-                
-                if criterio_id == "3.1":
-                    resultados_verificacao["atualidade"] = "Atendido" if scraper.check_atualidade(soup) else "Não Atendido"
-                elif criterio_id == "3.2":
-                    resultados_verificacao["atualidade"] = "Atendido" if scraper.check_recency(soup) else "Não Atendido"
-                elif criterio_id == "4.1":
-                    resultados_verificacao["atualidade"] = "Atendido" if scraper.check_atualidade(soup) else "Não Atendido"
-                elif criterio_id == "4.2":
-                    resultados_verificacao["atualidade"] = "Atendido" if scraper.check_atualidade(soup) else "Não Atendido"
-                elif criterio_id == "11.5":
-                    hoje = datetime.now().date()
+                if verificacao.janela == "quadrimestre":
+                    # Reverificado quando muda o quadrimestre exigível
                     quadr, ano_quad = scraper.ultimo_quadrimestre_exigivel(hoje)
-                    resultados_verificacao["atualidade"] = "Atendido" if scraper.pagina_tem_atualidade(link_consultado, quadr) else "Não Atendido"
+                    atende, reaproveitado = reavaliacao.verificar(
+                        (verificacao.funcao, link_consultado, quadr),
+                        [store.obter(link_consultado)],
+                        lambda: scraper.pagina_tem_atualidade(link_consultado, quadr, store),
+                        janela=f"{quadr}-{ano_quad}"
+                    )
+                    if reaproveitado:
+                        reaproveitados.append(verificacao.funcao)
                 else:
-                    resultados_verificacao["atualidade"] = "Não Atendido (verificação não implementada)"
+                    atende = verificar(getattr(scraper, verificacao.funcao), janela=criterios.valor_da_janela(verificacao.janela, hoje))
+                resultados_verificacao[verificacao.item] = "Atendido" if atende else "Não Atendido"
             except Exception as e:
-                print(f"Erro ao verificar atualidade: {e}")
-                resultados_verificacao["atualidade"] = "Não Atendido (erro na verificação)"
+                print(f"Erro ao verificar {verificacao.item}: {e}")
+                resultados_verificacao[verificacao.item] = "Não Atendido (erro na verificação)"
+
+    else: # Nenhum link encontrado
+        evidencia_texto = "Evidência: não há página contendo a divulgação exigida pelo critério"
+        for item in itens_aplicaveis:
+            resultados_verificacao[item] = "Não Atendido"
+
+    return {
+        "resultados_verificacao": resultados_verificacao,
+        "evidencia": evidencia_texto,
+        "link": link_consultado,
+        "reaproveitados": reaproveitados
+    }
+
+@app.route('/api/avaliar_criterio', methods=['POST'])
+def avaliar_criterio_endpoint():
+    dados_requisicao = request.get_json()
+    unidade_gestora = dados_requisicao.get('unidade_gestora')
+    criterio_descricao = dados_requisicao.get('criterio_descricao')
+    criterio_id = dados_requisicao.get('criterio_id') 
+
+    if not unidade_gestora or not criterio_id:
+        return jsonify({"erro": "Nome da Unidade Gestora e ID do Critério são obrigatórios."}), 400
+
+    return jsonify(avaliar_criterio(unidade_gestora, criterio_id, criterio_descricao))
+
+def resultado_para_historico(criterio_id, resultado):
+    """Resultado de avaliar_criterio no formato gravado por historico.GravadorResultados."""
+    if "erro" in resultado:
+        return {"id": criterio_id, "observacao": f"Erro na avaliação: {resultado['erro']}"}
+    itens = resultado["resultados_verificacao"]
+    
+    def atendido(item):
+        return itens[item] == "Atendido" if item in itens else None
+    
+    disponibilidade = atendido("disponibilidade")
+    if disponibilidade:
+        observacao = None
+    elif resultado["link"]:
+        observacao = f"Informação não encontrada em {resultado['link']}"
+    else:
+        observacao = resultado["evidencia"]
+    return {
+        "id": criterio_id,
+        "disponibilidade": disponibilidade,
+        "atualidade": atendido("atualidade"),
+        "serieHistorica": atendido("serie_historica"),
+        "gravacaoRelatorios": atendido("gravacao_relatorios"),
+        "filtroPesquisa": atendido("filtro_pesquisa"),
+        "linkEvidencia": resultado["link"] if disponibilidade else None,
+        "observacao": observacao
+    }
+
+def executar_avaliacao_criterios(job, pares):
+    """
+    Avalia pares (UG, critério) em paralelo e publica cada resultado no job
+    assim que fica pronto. Os links da planilha são obtidos uma vez por UG e
+    as páginas baixadas são compartilhadas por todos os pares do lote. Os
+    resultados são gravados no histórico, numa avaliação por UG.
+    """
+    gravadores = {}  # UG -> GravadorResultados
+    try:
+        store = PageStore(timeout=8)
+        links_por_ug = {}
+        for ug, _, _ in pares:
+            if ug not in links_por_ug:
+                links_por_ug[ug] = obter_links_da_planilha(ug)
+        total = len(pares)
         
-        # Verificar série histórica
-        if "serie_historica" in itens_aplicaveis:
-            try:
-                response = requests.get(link_consultado, timeout=8, headers={'User-Agent': 'Mozilla/5.0'})
-                soup = BeautifulSoup(response.text, 'html.parser')
+        executor = ThreadPoolExecutor(max_workers=config.AVALIACAO_MAX_WORKERS)
+        futuros = {}
+        try:
+            futuros = {
+                executor.submit(avaliar_criterio, ug, criterio_id, descricao, store, links_por_ug[ug]): (ug, criterio_id)
+                for ug, criterio_id, descricao in pares
+            }
+            for concluidos, futuro in enumerate(as_completed(futuros), 1):
+                if job.cancelado:
+                    job.publicar({
+                        "type": "status",
+                        "message": "Avaliação cancelada pelo usuário",
+                        "progress": 100
+                    })
+                    break
                 
-                if criterio_id in ["3.1", "3.2", "4.1", "4.2"]:
-                    resultados_verificacao["serie_historica"] = "Atendido" if scraper.check_serie_historica(soup) else "Não Atendido"
-                else:
-                    resultados_verificacao["serie_historica"] = "Não Atendido (verificação não implementada)"
-            except Exception as e:
-                print(f"Erro ao verificar série histórica: {e}")
-                resultados_verificacao["serie_historica"] = "Não Atendido (erro na verificação)"
-        
-        # Verificar gravação de relatórios
-        if "gravacao_relatorios" in itens_aplicaveis:
-            try:
-                response = requests.get(link_consultado, timeout=8, headers={'User-Agent': 'Mozilla/5.0'})
-                soup = BeautifulSoup(response.text, 'html.parser')
+                ug, criterio_id = futuros[futuro]
+                try:
+                    resultado = futuro.result()
+                except Exception as e:
+                    print(f"Erro ao avaliar o critério {criterio_id} de {ug}: {e}")
+                    resultado = {"erro": str(e)}
                 
-                if criterio_id in ["3.1", "3.2", "4.1", "4.2"]:
-                    resultados_verificacao["gravacao_relatorios"] = "Atendido" if scraper.check_gravacao_relatorios(soup) else "Não Atendido"
-                else:
-                    resultados_verificacao["gravacao_relatorios"] = "Não Atendido (verificação não implementada)"
+                job.publicar({
+                    "type": "status",
+                    "message": f"Avaliados {concluidos} de {total} critérios",
+                    "progress": (concluidos / total) * 100
+                })
+                job.publicar({"unidade_gestora": ug, "criterio_id": criterio_id, **resultado})
+                gravador = obter_gravador(gravadores, job, ug, pares)
+                if gravador:
+                    gravador.adicionar(resultado_para_historico(criterio_id, resultado))
+        finally:
+            # Descarta as avaliações que ainda não começaram
+            # (cancelamento um a um: shutdown(cancel_futures=True) exige Python 3.9)
+            for futuro in futuros:
+                futuro.cancel()
+            executor.shutdown(wait=False)
+    except Exception as e:
+        print(f"Erro durante a avaliação em lote: {e}")
+        job.status = 'erro'
+        job.publicar({
+            "type": "error",
+            "message": f"Ocorreu um erro durante a avaliação: {str(e)}",
+            "progress": 100
+        })
+    finally:
+        # Grava os resultados restantes e o status final no histórico
+        if job.status == 'erro':
+            status = 'erro'
+        else:
+            status = 'cancelado' if job.cancelado else 'concluido'
+        for gravador in gravadores.values():
+            if gravador is None:
+                continue
+            try:
+                gravador.finalizar(status)
             except Exception as e:
-                print(f"Erro ao verificar gravação de relatórios: {e}")
-                resultados_verificacao["gravacao_relatorios"] = "Não Atendido (erro na verificação)"
+                print(f"Erro ao gravar resultados no histórico: {e}")
         
-        # Verificar filtro de pesquisa
-        if "filtro_pesquisa" in itens_aplicaveis:
+        job.publicar({"type": "complete"})
+
+def obter_gravador(gravadores, job, ug, pares):
+    """Gravador do histórico da UG no lote, criado no primeiro resultado (None se desativado)."""
+    if ug not in gravadores:
+        gravadores[ug] = None
+        if historico.obter_historico():
             try:
-                response = requests.get(link_consultado, timeout=8, headers={'User-Agent': 'Mozilla/5.0'})
-                soup = BeautifulSoup(response.text, 'html.parser')
-                
-                if criterio_id in ["3.1", "3.2", "4.1", "4.2"]:
-                    resultados_verificacao["filtro_pesquisa"] = "Atendido" if scraper.check_filtro_pesquisa(soup) else "Não Atendido"
-                else:
-                    resultados_verificacao["filtro_pesquisa"] = "Não Atendido (verificação não implementada)"
+                gravadores[ug] = historico.GravadorResultados(
+                    historico.obter_historico(), job.id, ug, total_perguntas=sum(1 for par in pares if par[0] == ug)
+                )
             except Exception as e:
-                print(f"Erro ao verificar filtro de pesquisa: {e}")
-                resultados_verificacao["filtro_pesquisa"] = "Não Atendido (erro na verificação)"
+                print(f"Erro ao registrar avaliação no histórico: {e}")
+    return gravadores[ug]
 
-    else: # Nenhum link encontrado
-        evidencia_texto = "Evidência: não há página contendo a divulgação exigida pelo critério"
-        for item in itens_aplicaveis:
-            resultados_verificacao[item] = "Não Atendido"
+@app.route('/api/avaliar-criterios-lote', methods=['POST'])
+def avaliar_criterios_lote():
+    """
+    Inicia a avaliação de vários critérios de várias UGs como um job; os
+    resultados chegam por /api/stream-resultados/<jobId>.
 
+    Corpo: {"unidades_gestoras": ["TCE", ...],
+            "criterios": ["1.1", {"id": "3.1", "descricao": "..."}, ...]}
+    """
+    dados_requisicao = request.get_json(silent=True)
+    if not isinstance(dados_requisicao, dict):
+        return jsonify({"erro": "Corpo da requisição deve ser um objeto JSON."}), 400
+    unidades = dados_requisicao.get('unidades_gestoras')
+    criterios_pedidos = dados_requisicao.get('criterios')
+    
+    if not isinstance(unidades, list) or not isinstance(criterios_pedidos, list) or not unidades or not criterios_pedidos:
+        return jsonify({"erro": "Informe as unidades gestoras e os critérios (listas não vazias)."}), 400
+    if not all(isinstance(ug, str) and ug.strip() for ug in unidades):
+        return jsonify({"erro": "Cada unidade gestora deve ser um texto não vazio."}), 400
+    
+    lista_criterios = []
+    for criterio in criterios_pedidos:
+        if isinstance(criterio, dict):
+            criterio_id, descricao = criterio.get('id'), criterio.get('descricao')
+        else:
+            criterio_id, descricao = criterio, None
+        if not isinstance(criterio_id, str) or not criterio_id.strip():
+            return jsonify({"erro": "Cada critério deve ser um ID (texto) ou um objeto com \"id\"."}), 400
+        if descricao is not None and not isinstance(descricao, str):
+            return jsonify({"erro": f"Descrição inválida para o critério {criterio_id}."}), 400
+        criterio_id = criterio_id.strip()
+        if registro_criterios.obter(criterio_id) is None:
+            return jsonify({"erro": f"Critério desconhecido: {criterio_id}"}), 400
+        lista_criterios.append((criterio_id, descricao))
+    
+    # UGs e critérios repetidos são avaliados uma única vez
+    pares = list(dict.fromkeys(
+        (ug.strip(), criterio_id, descricao)
+        for ug in unidades
+        for criterio_id, descricao in lista_criterios
+    ))
+    if len(pares) > config.LOTE_CRITERIOS_MAX_PARES:
+        return jsonify({"erro": f"Máximo de {config.LOTE_CRITERIOS_MAX_PARES} pares (UG, critério) por lote."}), 400
+    
+    job = jobs.criar(", ".join(dict.fromkeys(ug for ug, _, _ in pares)), executar_avaliacao_criterios, pares,
+                     total_perguntas=len(pares))
+    
     return jsonify({
-        "resultados_verificacao": resultados_verificacao,
-        "evidencia": evidencia_texto
+        "message": "Avaliação em lote iniciada com sucesso",
+        "jobId": job.id,
+        "total": len(pares)
     })
 
 @app.route('/api/criteria')
 def get_criteria():
-    return jsonify(criteria_data)
+    return jsonify(registro_criterios.criterios_api)
 
-@app.route('/api/cancelar-avaliacao', methods=['POST'])
-def cancelar_avaliacao():
+@app.route('/api/cancelar-avaliacao/<job_id>', methods=['POST'])
+def cancelar_avaliacao(job_id):
     """Cancela uma avaliação em andamento"""
-    global scraping_em_andamento, cancelamento_solicitado
+    job = jobs.obter(job_id)
     
-    if not scraping_em_andamento:
+    if job is None or not job.ativo:
         return jsonify({"error": "Não há avaliação em andamento para cancelar"}), 400
     
     # Marcar para cancelamento
-    cancelamento_solicitado = True
+    job.cancelar()
     
     return jsonify({"message": "Solicitação de cancelamento recebida"})
 
+@app.route('/api/avaliacoes')
+def listar_avaliacoes():
+    """Lista as avaliações registradas no servidor"""
+    return jsonify({"avaliacoes": [job.resumo() for job in jobs.listar()]})
+
 @app.route('/api/avaliar-transparencia', methods=['POST'])
 def avaliar_transparencia():
-    """Inicia o processo de avaliação em uma thread separada"""
-    global scraping_em_andamento, cancelamento_solicitado
-    
-    if scraping_em_andamento:
-        return jsonify({"error": "Já existe uma avaliação em andamento"}), 400
-    
+    """Inicia o processo de avaliação como um job e retorna seu identificador"""
     data = request.json
     orgao = data.get('orgao')
     tipo_orgao = data.get('tipo_orgao', 'todos')  # Novo parâmetro para tipo de órgão
@@ -293,357 +406,116 @@ def avaliar_transparencia():
     if not orgao:
         return jsonify({"error": "O nome do órgão é obrigatório"}), 400
     
-    # Limpa a fila de resultados anteriores
-    while not resultados_queue.empty():
-        resultados_queue.get()
-    
-    # Resetar flag de cancelamento
-    cancelamento_solicitado = False
-    
     # Obtém o total de perguntas para cálculo de progresso
-    perguntas = scraper.obter_perguntas_padrao()
-    
-    # Adiciona perguntas específicas com base no tipo de órgão
-    if tipo_orgao == 'executivo':
-        perguntas.extend(scraper.obter_perguntas_especificas('executivo'))
-        perguntas.extend(scraper.obter_perguntas_especificas('executivo-consorcios'))
-    elif tipo_orgao == 'legislativo':
-        perguntas.extend(scraper.obter_perguntas_especificas('legislativo'))
-    elif tipo_orgao == 'judiciario':
-        perguntas.extend(scraper.obter_perguntas_especificas('judiciario'))
-    elif tipo_orgao == 'tribunal-contas':
-        perguntas.extend(scraper.obter_perguntas_especificas('tribunal-contas'))
-    elif tipo_orgao == 'ministerio-publico':
-        perguntas.extend(scraper.obter_perguntas_especificas('ministerio-publico'))
-    elif tipo_orgao == 'defensoria':
-        perguntas.extend(scraper.obter_perguntas_especificas('defensoria'))
-    elif tipo_orgao == 'consorcio':
-        perguntas.extend(scraper.obter_perguntas_especificas('consorcios'))
-    elif tipo_orgao == 'estatal':
-        perguntas.extend(scraper.obter_perguntas_especificas('estatais'))
-    elif tipo_orgao == 'estatal-independente':
-        perguntas.extend(scraper.obter_perguntas_especificas('estatais'))
-        perguntas.extend(scraper.obter_perguntas_especificas('estatais-independentes'))
+    perguntas = montar_perguntas(tipo_orgao)
     
     total_perguntas = len(perguntas)
     
-    # Inicia o scraping em uma thread separada
-    scraping_em_andamento = True
-    threading.Thread(target=executar_scraping, args=(orgao, perguntas)).start()
+    # Registra o job; ele começa assim que houver vaga entre os jobs simultâneos
+    job = jobs.criar(orgao, executar_scraping, orgao, perguntas, tipo_orgao, total_perguntas=total_perguntas)
     
     return jsonify({
         "message": "Avaliação iniciada com sucesso",
+        "jobId": job.id,
         "totalPerguntas": total_perguntas
     })
 
-def executar_scraping(orgao, perguntas):
-    """Executa o scraping e coloca os resultados na fila"""
-    global scraping_em_andamento, cancelamento_solicitado
+@app.route('/api/historico')
+def get_historico():
+    """
+    Resultados gravados das avaliações, filtrados por órgão, critério e
+    período (?orgao=...&criterio=...&desde=AAAA-MM-DD&ate=AAAA-MM-DD&limite=100)
+    """
+    registro = historico.obter_historico()
+    if registro is None:
+        return jsonify({"error": "Histórico desativado"}), 404
     
     try:
-        # Obtém o total de perguntas
-        total_perguntas = len(perguntas)
-        
-        # Envia mensagem de status: iniciando busca
-        resultados_queue.put({
-            "type": "status",
-            "message": "Buscando site oficial...",
-            "progress": 5
-        })
-        
-        # Busca o site oficial
-        site_oficial = None
-        
-        # 1. Primeiro, tentar URL conhecida do dicionário ou da planilha
-        site_oficial = get_known_url(orgao, "site_oficial")
-        if site_oficial:
-            print(f"Usando URL conhecida para {orgao}: {site_oficial}")
-        
-        # 2. Se não encontrou em URLs conhecidas, tentar URLs diretas
-        if not site_oficial:
-            orgao_simplificado = scraper.normalize(orgao.lower().replace("prefeitura de ", "").replace("câmara municipal de ", ""))
-            dominios_diretos = [
-                f"https://www.{orgao_simplificado}.am.gov.br",
-                f"https://{orgao_simplificado}.am.gov.br",
-                f"https://www.prefeitura{orgao_simplificado}.am.gov.br",
-                f"https://prefeitura{orgao_simplificado}.am.gov.br"
-            ]
-            
-            for url in dominios_diretos:
-                try:
-                    if verificar_disponibilidade_simples(url):
-                        site_oficial = url
-                        break
-                except:
-                    continue
-        
-        # 3. Se não encontrou diretamente, buscar no cache
-        if not site_oficial:
-            query = f"{orgao} site oficial"
-            cached_results = scraper.get_cached_results(query)
-            if cached_results and cached_results[0]:
-                site_oficial = cached_results[0]
-        
-        # 4. Por último, fazer busca na web
-        if not site_oficial:
-            links_site = scraper.buscar_no_google(f"{orgao} site oficial", 3)
-            if links_site:
-                site_oficial = links_site[0]
-        
-        # Verificar cancelamento
-        if cancelamento_solicitado:
-            resultados_queue.put({
-                "type": "status",
-                "message": "Avaliação cancelada pelo usuário",
-                "progress": 100
-            })
-            return
-        
-        if site_oficial:
-            resultados_queue.put({
-                "type": "status",
-                "message": f"Site oficial encontrado: {site_oficial}",
-                "progress": 10
-            })
-        else:
-            resultados_queue.put({
-                "type": "status",
-                "message": "Site oficial não encontrado",
-                "progress": 10
-            })
-        
-        # Busca o portal de transparência
-        resultados_queue.put({
-            "type": "status",
-            "message": "Buscando portal de transparência...",
-            "progress": 15
-        })
-        
-        portal_transparencia = None
-        
-        # 1. Primeiro, tentar URL conhecida do dicionário ou da planilha
-        portal_transparencia = get_known_url(orgao, "portal_transparencia")
-        if portal_transparencia:
-            print(f"Usando URL conhecida para portal de transparência de {orgao}: {portal_transparencia}")
-        
-        # 2. Se não encontrou em URLs conhecidas, tentar encontrar no site oficial
-        if not portal_transparencia and site_oficial:
-            try:
-                links_transparencia = scraper.find_transparency_links(site_oficial)
-                if links_transparencia:
-                    portal_transparencia = links_transparencia[0]['url']
-            except Exception as e:
-                print(f"Erro ao buscar links de transparência no site oficial: {e}")
-        
-        # 3. Se não encontrou no site oficial, tentar URLs diretas
-        if not portal_transparencia:
-            orgao_simplificado = scraper.normalize(orgao.lower().replace("prefeitura de ", "").replace("câmara municipal de ", ""))
-            dominios_transparencia = [
-                f"https://transparencia.{orgao_simplificado}.am.gov.br",
-                f"https://{orgao_simplificado}.am.gov.br/transparencia",
-                f"https://www.{orgao_simplificado}.am.gov.br/transparencia",
-                f"https://transparencia.{orgao_simplificado}.leg.br"
-            ]
-            
-            for url in dominios_transparencia:
-                try:
-                    if verificar_disponibilidade_simples(url):
-                        portal_transparencia = url
-                        break
-                except:
-                    continue
-        
-        # 4. Se ainda não encontrou, buscar no cache
-        if not portal_transparencia:
-            query = f"{orgao} portal transparência"
-            cached_results = scraper.get_cached_results(query)
-            if cached_results and cached_results[0]:
-                portal_transparencia = cached_results[0]
-        
-        # 5. Por último, fazer busca na web
-        if not portal_transparencia:
-            links_portal = scraper.buscar_no_google(f"{orgao} portal transparência", 3)
-            if links_portal:
-                portal_transparencia = links_portal[0]
-        
-        # Verificar cancelamento
-        if cancelamento_solicitado:
-            resultados_queue.put({
-                "type": "status",
-                "message": "Avaliação cancelada pelo usuário",
-                "progress": 100
-            })
-            return
-        
-        if portal_transparencia:
-            resultados_queue.put({
-                "type": "status",
-                "message": f"Portal de transparência encontrado: {portal_transparencia}",
-                "progress": 20
-            })
-        else:
-            resultados_queue.put({
-                "type": "status",
-                "message": "Portal de transparência não encontrado",
-                "progress": 20
-            })
-        
-        # Processa cada pergunta individualmente
-        for i, item in enumerate(perguntas):
-            # Verificar cancelamento
-            if cancelamento_solicitado:
-                resultados_queue.put({
-                    "type": "status",
-                    "message": "Avaliação cancelada pelo usuário",
-                    "progress": 100
-                })
-                break
-                
-            pergunta = item["pergunta"]
-            
-            # Envia mensagem de status: verificando pergunta atual
-            resultados_queue.put({
-                "type": "status",
-                "message": f"Verificando item {i+1} de {total_perguntas}",
-                "progress": 20 + ((i / total_perguntas) * 80),
-                "perguntaAtual": pergunta
-            })
-            
-            # Determinar qual URL usar para verificação
-            url_verificacao = None
-            if "sítio oficial" in pergunta.lower() and site_oficial:
-                url_verificacao = site_oficial
-            elif "portal da transparência" in pergunta.lower() and portal_transparencia:
-                url_verificacao = portal_transparencia
-            elif portal_transparencia:  # Para outras perguntas, verificar primeiro no portal de transparência
-                url_verificacao = portal_transparencia
-            elif site_oficial:  # Se não tiver portal, verificar no site oficial
-                url_verificacao = site_oficial
-            
-            # Se não temos uma URL específica, buscar no cache ou na web
-            if not url_verificacao:
-                query = f"{pergunta} {orgao}"
-                cached_results = scraper.get_cached_results(query)
-                if cached_results and cached_results[0]:
-                    url_verificacao = cached_results[0]
-                else:
-                    links = scraper.buscar_no_google(query, 3)
-                    if links:
-                        url_verificacao = links[0]
-            
-            # Verificar o item
-            resultado = None
-            if url_verificacao:
-                # Tratamento especial para o TCE-AM
-                if 'tce.am.gov.br' in url_verificacao.lower():
-                    # Para o TCE-AM, usamos URLs conhecidas em vez de tentar acessar diretamente
-                    if "sítio oficial" in pergunta.lower():
-                        disponibilidade = True
-                    elif "portal da transparência" in pergunta.lower():
-                        disponibilidade = True
-                    else:
-                        # Para outras perguntas, usamos a URL do portal de transparência
-                        url_verificacao = "https://transparencia.tce.am.gov.br/"
-                        disponibilidade = verificar_disponibilidade_simples(url_verificacao)
-                else:
-                    disponibilidade = scraper.verificar_item(url_verificacao, pergunta)
-                
-                resultado = {
-                    "id": item["id"],
-                    "pergunta": pergunta,
-                    "dimensao": item["dimensao"],
-                    "fundamentacao": item["fundamentacao"],
-                    "classificacao": item["classificacao"],
-                    "disponibilidade": disponibilidade,
-                    "atualidade": True if item["id"] in ["1.1", "1.2", "1.3", "1.4"] else None,
-                    "serieHistorica": None,
-                    "gravacaoRelatorios": None,
-                    "filtroPesquisa": None,
-                    "linkEvidencia": url_verificacao if disponibilidade else None,
-                    "observacao": None if disponibilidade else f"Informação não encontrada para {orgao} em {url_verificacao}"
-                }
-            else:
-                resultado = {
-                    "id": item["id"],
-                    "pergunta": pergunta,
-                    "dimensao": item["dimensao"],
-                    "fundamentacao": item["fundamentacao"],
-                    "classificacao": item["classificacao"],
-                    "disponibilidade": False,
-                    "atualidade": None,
-                    "serieHistorica": None,
-                    "gravacaoRelatorios": None,
-                    "filtroPesquisa": None,
-                    "linkEvidencia": None,
-                    "observacao": f"Não foi possível encontrar informações para {orgao}"
-                }
-            
-            # Adiciona o resultado à fila para streaming
-            resultados_queue.put(resultado)
-            
-            # Pequena pausa para não sobrecarregar o cliente
-            time.sleep(0.1)
-        
-        # Envia mensagem de conclusão
-        resultados_queue.put({
-            "type": "status",
-            "message": "Avaliação concluída!",
-            "progress": 100
-        })
-        
-    except Exception as e:
-        # Registrar erro
-        print(f"Erro durante o scraping: {e}")
-        # Enviar mensagem de erro para o cliente
-        resultados_queue.put({
-            "type": "error",
-            "message": f"Ocorreu um erro durante a avaliação: {str(e)}",
-            "progress": 100
-        })
-    finally:
-        # Resetar flags
-        cancelamento_solicitado = False
-        scraping_em_andamento = False
-        
-        # Envia evento de conclusão
-        resultados_queue.put({
-            "type": "complete"
-        })
+        desde = request.args.get('desde')
+        desde = datetime.fromisoformat(desde) if desde else None
+        ate = request.args.get('ate')
+        if ate:
+            fim = datetime.fromisoformat(ate)
+            if len(ate) == 10:  # Data sem hora inclui o dia inteiro
+                fim = fim.replace(hour=23, minute=59, second=59, microsecond=999999)
+            ate = fim
+        limite = int(request.args.get('limite', 100))
+        if limite < 1:  # limite negativo faria o SQLite devolver todas as linhas
+            raise ValueError(limite)
+        limite = min(limite, 1000)
+    except ValueError:
+        return jsonify({"error": "Parâmetros inválidos"}), 400
+    
+    resultados = registro.consultar(
+        orgao=request.args.get('orgao'),
+        criterio=request.args.get('criterio'),
+        desde=desde,
+        ate=ate,
+        limite=limite
+    )
+    return jsonify({"resultados": resultados, "total": len(resultados)})
 
-@app.route('/api/stream-resultados')
-def stream_resultados():
-    """Endpoint SSE para streaming de resultados"""
-    def generate():
+@app.route('/api/stream-resultados/<job_id>')
+def stream_resultados(job_id):
+    """
+    Endpoint SSE para streaming dos resultados de um job. Cada evento leva
+    um id; ao reconectar, o EventSource envia o cabeçalho Last-Event-ID e
+    recebe apenas os eventos que perdeu (também aceito em ?lastEventId=).
+    """
+    job = jobs.obter(job_id)
+    if job is None:
+        return jsonify({"error": "Avaliação não encontrada"}), 404
+    
+    try:
+        ultimo_id = int(request.headers.get('Last-Event-ID') or request.args.get('lastEventId') or 0)
+    except ValueError:
+        ultimo_id = 0
+    
+    def generate(ultimo_id):
+        yield f"retry: {config.SSE_RETRY_MS}\n\n"
         while True:
-            # Se não há mais scraping e a fila está vazia, termina o streaming
-            if not scraping_em_andamento and resultados_queue.empty():
-                yield f"event: complete\ndata: {{}}\n\n"
-                break
+            # Espera os próximos eventos; cada evento é enviado assim que é publicado
+            eventos = job.eventos_desde(ultimo_id, timeout=config.SSE_KEEPALIVE_SEGUNDOS)
+            if not eventos:
+                # Se o job terminou e não há eventos novos, termina o streaming
+                if not job.ativo and job.ultimo_id <= ultimo_id:
+                    yield "event: complete\ndata: {}\n\n"
+                    break
+                # Comentário SSE: mantém a conexão aberta através de proxies
+                yield ": keep-alive\n\n"
+                continue
             
-            # Tenta obter um resultado da fila
-            try:
-                resultado = resultados_queue.get(block=False)
-                
+            for ultimo_id, resultado in eventos:
                 # Se for uma mensagem de status
                 if isinstance(resultado, dict) and resultado.get("type") == "status":
-                    yield f"data: {json.dumps(resultado)}\n\n"
+                    yield f"id: {ultimo_id}\ndata: {json.dumps(resultado)}\n\n"
                 # Se for uma mensagem de erro
                 elif isinstance(resultado, dict) and resultado.get("type") == "error":
-                    yield f"event: error\ndata: {json.dumps(resultado)}\n\n"
+                    yield f"id: {ultimo_id}\nevent: error\ndata: {json.dumps(resultado)}\n\n"
                 # Se for uma mensagem de conclusão
                 elif isinstance(resultado, dict) and resultado.get("type") == "complete":
-                    yield f"event: complete\ndata: {{}}\n\n"
-                    break
+                    yield f"id: {ultimo_id}\nevent: complete\ndata: {{}}\n\n"
+                    return
                 # Se for um resultado normal
                 else:
-                    yield f"data: {json.dumps(resultado)}\n\n"
-                    
-            except queue.Empty:
-                # Se a fila está vazia mas o scraping ainda está em andamento, espera
-                time.sleep(0.5)
-                continue
+                    yield f"id: {ultimo_id}\ndata: {json.dumps(resultado)}\n\n"
     
-    return Response(generate(), mimetype='text/event-stream')
+    return Response(generate(ultimo_id), mimetype='text/event-stream', headers={
+        "Cache-Control": "no-cache",
+        "X-Accel-Buffering": "no"  # Impede que proxies (nginx) acumulem os eventos
+    })
+
+@app.route('/api/metricas')
+def get_metricas():
+    """Métricas de monitoramento dos caches, da deduplicação e das filas por host"""
+    return jsonify({
+        "cache_busca": scraper.cache_busca.estatisticas(),
+        "buscas_compartilhadas": scraper.buscas_em_andamento.estatisticas(),
+        "downloads_compartilhados": downloads_em_andamento.estatisticas(),
+        "cache_http": http_client.obter_cache().estatisticas() if http_client.obter_cache() else None,
+        "hosts": agendador.estatisticas(),
+        "reavaliacao": reavaliacao.obter_registro().estatisticas() if reavaliacao.obter_registro() else None
+    })
 
 @app.route('/api/municipios')
 def get_municipios():
@@ -662,4 +534,7 @@ def index():
     return jsonify({"message": "API do Sistema de Avaliação de Portais de Transparência"})
 
 if __name__ == '__main__':
+    # Abre o Chrome de antemão só no processo que atende (não no monitor do reloader)
+    if os.environ.get('WERKZEUG_RUN_MAIN') == 'true':
+        driver_pool.aquecer_em_segundo_plano()
     app.run(host='0.0.0.0', port=5000, debug=True)
\ No newline at end of file
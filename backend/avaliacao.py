@@ -0,0 +1,359 @@
+# avaliacao.py
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+import config
+import criterios
+import historico
+import reavaliacao
+import scraper
+from page_store import PageStore
+from known_urls import get_known_url
+
+def montar_perguntas(tipo_orgao='todos'):
+    """
+    Monta a lista de perguntas da avaliação: a matriz comum mais as
+    perguntas específicas do tipo de órgão.
+    """
+    return criterios.obter_registro().perguntas_do_tipo(tipo_orgao)
+
+def verificar_disponibilidade_simples(url, store=None):
+    """Verifica se uma URL está disponível, com timeout reduzido e tratamento de erros melhorado"""
+    if not url: 
+        return False
+    if store is None:
+        # Reduzir o timeout para 8 segundos para evitar esperas longas
+        store = PageStore(timeout=8)
+    return store.obter(url).disponivel
+
+def executar_scraping(job, orgao, perguntas, tipo_orgao=None):
+    """Executa o scraping e publica os resultados como eventos do job"""
+    gravador = None
+    try:
+        # Resultados gravados no histórico em lotes
+        if historico.obter_historico():
+            try:
+                gravador = historico.GravadorResultados(
+                    historico.obter_historico(), job.id, orgao, tipo_orgao, len(perguntas)
+                )
+            except Exception as e:
+                print(f"Erro ao registrar avaliação no histórico: {e}")
+        
+        # Obtém o total de perguntas
+        total_perguntas = len(perguntas)
+        
+        # Páginas baixadas nesta avaliação, compartilhadas por todas as verificações
+        store = PageStore()
+        
+        def disponivel(url):
+            return verificar_disponibilidade_simples(url, store)
+        
+        orgao_simplificado = scraper.normalize(orgao.lower().replace("prefeitura de ", "").replace("câmara municipal de ", ""))
+        
+        # Sem URL conhecida para o portal, os domínios candidatos são sondados
+        # em segundo plano enquanto o site oficial é procurado
+        portal_conhecido = get_known_url(orgao, "portal_transparencia")
+        descoberta = ThreadPoolExecutor(max_workers=1)
+        sondagem_portal = None
+        if not portal_conhecido:
+            dominios_transparencia = [
+                f"https://transparencia.{orgao_simplificado}.am.gov.br",
+                f"https://{orgao_simplificado}.am.gov.br/transparencia",
+                f"https://www.{orgao_simplificado}.am.gov.br/transparencia",
+                f"https://transparencia.{orgao_simplificado}.leg.br"
+            ]
+            sondagem_portal = descoberta.submit(scraper.primeira_url_disponivel, dominios_transparencia, disponivel)
+        descoberta.shutdown(wait=False)
+        
+        # Envia mensagem de status: iniciando busca
+        job.publicar({
+            "type": "status",
+            "message": "Buscando site oficial...",
+            "progress": 5
+        })
+        
+        # Busca o site oficial
+        site_oficial = None
+        
+        # 1. Primeiro, tentar URL conhecida do dicionário ou da planilha
+        site_oficial = get_known_url(orgao, "site_oficial")
+        if site_oficial:
+            print(f"Usando URL conhecida para {orgao}: {site_oficial}")
+        
+        # 2. Se não encontrou em URLs conhecidas, tentar URLs diretas (em paralelo)
+        if not site_oficial:
+            dominios_diretos = [
+                f"https://www.{orgao_simplificado}.am.gov.br",
+                f"https://{orgao_simplificado}.am.gov.br",
+                f"https://www.prefeitura{orgao_simplificado}.am.gov.br",
+                f"https://prefeitura{orgao_simplificado}.am.gov.br"
+            ]
+            site_oficial = scraper.primeira_url_disponivel(dominios_diretos, disponivel)
+        
+        # 3. Se não encontrou diretamente, buscar no cache
+        if not site_oficial:
+            query = f"{orgao} site oficial"
+            cached_results = scraper.get_cached_results(query)
+            if cached_results and cached_results[0]:
+                site_oficial = cached_results[0]
+        
+        # 4. Por último, fazer busca na web
+        if not site_oficial:
+            links_site = scraper.buscar_no_google(f"{orgao} site oficial", 3)
+            if links_site:
+                site_oficial = links_site[0]
+        
+        # Verificar cancelamento
+        if job.cancelado:
+            job.publicar({
+                "type": "status",
+                "message": "Avaliação cancelada pelo usuário",
+                "progress": 100
+            })
+            return
+        
+        if site_oficial:
+            job.publicar({
+                "type": "status",
+                "message": f"Site oficial encontrado: {site_oficial}",
+                "progress": 10
+            })
+        else:
+            job.publicar({
+                "type": "status",
+                "message": "Site oficial não encontrado",
+                "progress": 10
+            })
+        
+        # Busca o portal de transparência
+        job.publicar({
+            "type": "status",
+            "message": "Buscando portal de transparência...",
+            "progress": 15
+        })
+        
+        portal_transparencia = None
+        
+        # 1. Primeiro, tentar URL conhecida do dicionário ou da planilha
+        portal_transparencia = portal_conhecido
+        if portal_transparencia:
+            print(f"Usando URL conhecida para portal de transparência de {orgao}: {portal_transparencia}")
+        
+        # 2. Se não encontrou em URLs conhecidas, tentar encontrar no site oficial
+        if not portal_transparencia and site_oficial:
+            try:
+                links_transparencia = scraper.find_transparency_links(site_oficial, store)
+                if links_transparencia:
+                    portal_transparencia = links_transparencia[0]['url']
+            except Exception as e:
+                print(f"Erro ao buscar links de transparência no site oficial: {e}")
+        
+        # 3. Se não encontrou no site oficial, usar a sondagem das URLs diretas
+        if not portal_transparencia and sondagem_portal:
+            try:
+                portal_transparencia = sondagem_portal.result()
+            except Exception as e:
+                print(f"Erro ao sondar domínios do portal de transparência: {e}")
+        
+        # 4. Se ainda não encontrou, buscar no cache
+        if not portal_transparencia:
+            query = f"{orgao} portal transparência"
+            cached_results = scraper.get_cached_results(query)
+            if cached_results and cached_results[0]:
+                portal_transparencia = cached_results[0]
+        
+        # 5. Por último, fazer busca na web
+        if not portal_transparencia:
+            links_portal = scraper.buscar_no_google(f"{orgao} portal transparência", 3)
+            if links_portal:
+                portal_transparencia = links_portal[0]
+        
+        # Verificar cancelamento
+        if job.cancelado:
+            job.publicar({
+                "type": "status",
+                "message": "Avaliação cancelada pelo usuário",
+                "progress": 100
+            })
+            return
+        
+        if portal_transparencia:
+            job.publicar({
+                "type": "status",
+                "message": f"Portal de transparência encontrado: {portal_transparencia}",
+                "progress": 20
+            })
+        else:
+            job.publicar({
+                "type": "status",
+                "message": "Portal de transparência não encontrado",
+                "progress": 20
+            })
+        
+        # Verifica as perguntas em paralelo; cada resultado é publicado
+        # assim que fica pronto, na ordem em que as verificações terminam
+        executor = ThreadPoolExecutor(max_workers=config.AVALIACAO_MAX_WORKERS)
+        futuros = {}
+        try:
+            futuros = {
+                executor.submit(verificar_pergunta, job, orgao, item, site_oficial, portal_transparencia, store): item
+                for item in perguntas
+            }
+            for concluidas, futuro in enumerate(as_completed(futuros), 1):
+                # Verificar cancelamento
+                if job.cancelado:
+                    job.publicar({
+                        "type": "status",
+                        "message": "Avaliação cancelada pelo usuário",
+                        "progress": 100
+                    })
+                    break
+                
+                resultado = futuro.result()
+                if resultado is None:
+                    continue
+                
+                # Envia mensagem de status: pergunta concluída
+                job.publicar({
+                    "type": "status",
+                    "message": f"Verificados {concluidas} de {total_perguntas} itens",
+                    "progress": 20 + ((concluidas / total_perguntas) * 80),
+                    "perguntaAtual": futuros[futuro]["pergunta"]
+                })
+                
+                # Publica o resultado para streaming
+                job.publicar(resultado)
+                if gravador:
+                    gravador.adicionar(resultado)
+        finally:
+            # Descarta as verificações que ainda não começaram
+            # (cancelamento um a um: shutdown(cancel_futures=True) exige Python 3.9)
+            for futuro in futuros:
+                futuro.cancel()
+            executor.shutdown(wait=False)
+        
+        # Envia mensagem de conclusão
+        job.publicar({
+            "type": "status",
+            "message": "Avaliação concluída!",
+            "progress": 100
+        })
+        
+    except Exception as e:
+        # Registrar erro
+        print(f"Erro durante o scraping: {e}")
+        job.status = 'erro'
+        # Enviar mensagem de erro para o cliente
+        job.publicar({
+            "type": "error",
+            "message": f"Ocorreu um erro durante a avaliação: {str(e)}",
+            "progress": 100
+        })
+    finally:
+        # Grava os resultados restantes e o status final no histórico
+        if gravador:
+            if job.status == 'erro':
+                status = 'erro'
+            else:
+                status = 'cancelado' if job.cancelado else 'concluido'
+            try:
+                gravador.finalizar(status)
+            except Exception as e:
+                print(f"Erro ao gravar resultados no histórico: {e}")
+        
+        # Envia evento de conclusão
+        job.publicar({
+            "type": "complete"
+        })
+
+def verificar_pergunta(job, orgao, item, site_oficial, portal_transparencia, store):
+    """
+    Verifica uma pergunta da matriz e monta o resultado enviado ao cliente.
+    Executada pelas threads de executar_scraping; retorna None se a avaliação
+    foi cancelada antes de a verificação começar.
+    """
+    if job.cancelado:
+        return None
+    
+    pergunta = item["pergunta"]
+    
+    # Determinar qual URL usar para verificação
+    url_verificacao = None
+    if "sítio oficial" in pergunta.lower() and site_oficial:
+        url_verificacao = site_oficial
+    elif "portal da transparência" in pergunta.lower() and portal_transparencia:
+        url_verificacao = portal_transparencia
+    elif portal_transparencia:  # Para outras perguntas, verificar primeiro no portal de transparência
+        url_verificacao = portal_transparencia
+    elif site_oficial:  # Se não tiver portal, verificar no site oficial
+        url_verificacao = site_oficial
+    
+    # Se não temos uma URL específica, buscar no cache ou na web
+    if not url_verificacao:
+        query = f"{pergunta} {orgao}"
+        cached_results = scraper.get_cached_results(query)
+        if cached_results and cached_results[0]:
+            url_verificacao = cached_results[0]
+        else:
+            links = scraper.buscar_no_google(query, 3)
+            if links:
+                url_verificacao = links[0]
+    
+    # Verificar o item
+    if url_verificacao:
+        reaproveitado = False
+        trechos = []
+        # Tratamento especial para o TCE-AM
+        if 'tce.am.gov.br' in url_verificacao.lower():
+            # Para o TCE-AM, usamos URLs conhecidas em vez de tentar acessar diretamente
+            if "sítio oficial" in pergunta.lower():
+                disponibilidade = True
+            elif "portal da transparência" in pergunta.lower():
+                disponibilidade = True
+            else:
+                # Para outras perguntas, usamos a URL do portal de transparência
+                url_verificacao = "https://transparencia.tce.am.gov.br/"
+                disponibilidade = verificar_disponibilidade_simples(url_verificacao, store)
+        else:
+            # Se a página não mudou desde a última avaliação, reaproveita o veredito
+            disponibilidade, reaproveitado = reavaliacao.verificar(
+                ("verificar_item", url_verificacao, pergunta),
+                [store.obter(url_verificacao)],
+                lambda: scraper.verificar_item(url_verificacao, pergunta, store)
+            )
+            if disponibilidade:
+                # Onde as palavras-chave da pergunta aparecem na página
+                trechos = scraper.trechos_do_item(url_verificacao, pergunta, store)
+        
+        return {
+            "id": item["id"],
+            "pergunta": pergunta,
+            "dimensao": item["dimensao"],
+            "fundamentacao": item["fundamentacao"],
+            "classificacao": item["classificacao"],
+            "disponibilidade": disponibilidade,
+            "atualidade": True if item["id"] in ["1.1", "1.2", "1.3", "1.4"] else None,
+            "serieHistorica": None,
+            "gravacaoRelatorios": None,
+            "filtroPesquisa": None,
+            "linkEvidencia": url_verificacao if disponibilidade else None,
+            "trechosEvidencia": trechos,
+            "observacao": None if disponibilidade else f"Informação não encontrada para {orgao} em {url_verificacao}",
+            "reaproveitado": reaproveitado
+        }
+    
+    return {
+        "id": item["id"],
+        "pergunta": pergunta,
+        "dimensao": item["dimensao"],
+        "fundamentacao": item["fundamentacao"],
+        "classificacao": item["classificacao"],
+        "disponibilidade": False,
+        "atualidade": None,
+        "serieHistorica": None,
+        "gravacaoRelatorios": None,
+        "filtroPesquisa": None,
+        "linkEvidencia": None,
+        "trechosEvidencia": [],
+        "observacao": f"Não foi possível encontrar informações para {orgao}",
+        "reaproveitado": False
+    }
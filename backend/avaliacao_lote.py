@@ -0,0 +1,218 @@
+# avaliacao_lote.py
+import argparse
+import json
+import os
+import re
+import time
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import datetime
+from multiprocessing.managers import BaseManager
+from urllib.parse import urlsplit
+
+from amazonas_portals import get_all_amazonas_municipalities
+from known_urls import KNOWN_URLS, get_known_url
+from texto import normalize
+
+# Tipo de matriz de cada órgão estadual, identificado por palavras do nome
+TIPOS_POR_PALAVRA = [
+    ('tribunal de contas', 'tribunal-contas'),
+    ('tce', 'tribunal-contas'),
+    ('assembleia', 'legislativo'),
+    ('camara', 'legislativo'),
+    ('tribunal de justica', 'judiciario'),
+    ('ministerio publico', 'ministerio-publico'),
+    ('defensoria', 'defensoria'),
+]
+
+def tipo_do_orgao(orgao):
+    """Deduz o tipo de matriz a partir do nome do órgão (padrão: executivo)."""
+    nome = normalize(orgao)
+    for palavra, tipo in TIPOS_POR_PALAVRA:
+        if palavra in nome:
+            return tipo
+    return 'executivo'
+
+def host_do_orgao(orgao):
+    """Host provável do órgão, usado para agrupar órgãos que compartilham servidor."""
+    url = get_known_url(orgao, "site_oficial")
+    if url:
+        host = urlsplit(url).netloc.lower()
+        return host[4:] if host.startswith('www.') else host
+    simplificado = normalize(orgao).replace("prefeitura de ", "").replace("camara municipal de ", "")
+    return f"{simplificado}.am.gov.br"
+
+def listar_orgaos():
+    """
+    Lista as prefeituras do Amazonas e os órgãos estaduais conhecidos.
+
+    Returns:
+        list: Tuplas (orgao, tipo_orgao)
+    """
+    orgaos = OrderedDict()
+    for municipio in get_all_amazonas_municipalities():
+        orgaos[f"Prefeitura de {municipio.strip()}"] = 'executivo'
+    for nome in KNOWN_URLS:
+        orgaos.setdefault(nome, tipo_do_orgao(nome))
+    return list(orgaos.items())
+
+def agrupar_por_host(orgaos):
+    """
+    Agrupa os órgãos pelo host do site oficial. Cada grupo é avaliado em
+    sequência por um único processo, para que dois processos nunca
+    sobrecarreguem o mesmo servidor (os buscadores, usados por todos, ficam
+    com o BuscadorCoordenado). Órgãos com o mesmo site (ex.: "TCE-AM"
+    e "Tribunal de Contas do Estado do Amazonas") são avaliados uma vez só.
+    """
+    grupos = OrderedDict()
+    sites_vistos = set()
+    for orgao, tipo in orgaos:
+        site = get_known_url(orgao, "site_oficial")
+        if site and site in sites_vistos:
+            continue
+        if site:
+            sites_vistos.add(site)
+        grupos.setdefault(host_do_orgao(orgao), []).append((orgao, tipo))
+    return list(grupos.values())
+
+class BuscadorCoordenado:
+    """
+    Buscas na web do lote, executadas no processo coordenador.
+
+    Os limites por host (agendador_hosts) e o pool de navegadores do Selenium
+    valem por processo. Se cada processo do pool buscasse por conta própria,
+    DuckDuckGo e Bing receberiam N vezes a taxa configurada e N pools de
+    navegadores seriam abertos; passando todas as buscas por aqui, os limites
+    e o pool são os de um único processo.
+    """
+
+    def buscar(self, query, num_results):
+        import scraper
+        return scraper.buscar_no_google(query, num_results)
+
+class CoordenadorBuscas(BaseManager):
+    """Processo que executa as buscas de todos os processos do lote."""
+
+CoordenadorBuscas.register('BuscadorCoordenado', BuscadorCoordenado)
+
+def iniciar_processo(buscador):
+    """Inicializa um processo do pool: as buscas na web vão para o coordenador."""
+    import scraper
+    scraper.usar_buscador(buscador.buscar)
+
+def nome_arquivo(orgao):
+    return re.sub(r'[^a-z0-9]+', '_', normalize(orgao)).strip('_') + '.json'
+
+def avaliar_orgao(orgao, tipo_orgao, pasta_saida):
+    """
+    Avalia um órgão e grava o resultado em `pasta_saida`.
+
+    Returns:
+        dict: Resumo da avaliação (órgão, itens, duração, erros, arquivo)
+    """
+    # Importado aqui para que cada processo carregue o scraper apenas uma vez
+    from avaliacao import executar_scraping, montar_perguntas
+    from jobs import Job
+
+    perguntas = montar_perguntas(tipo_orgao)
+    job = Job(orgao, len(perguntas))
+    inicio = time.time()
+    executar_scraping(job, orgao, perguntas, tipo_orgao)
+    duracao = time.time() - inicio
+
+    resultados = []
+    erros = []
+    for _, evento in job.eventos_desde(0):
+        if evento.get("type") == "error":
+            erros.append(evento["message"])
+        elif "type" not in evento:
+            resultados.append(evento)
+
+    caminho = os.path.join(pasta_saida, nome_arquivo(orgao))
+    with open(caminho, 'w', encoding='utf-8') as f:
+        json.dump({
+            "orgao": orgao,
+            "tipo_orgao": tipo_orgao,
+            "data_avaliacao": datetime.now().isoformat(),
+            "duracao_segundos": round(duracao, 1),
+            "erros": erros,
+            "resultados": resultados
+        }, f, ensure_ascii=False, indent=2)
+
+    return {
+        "orgao": orgao,
+        "itens": len(resultados),
+        "atendidos": sum(1 for r in resultados if r.get("disponibilidade")),
+        "duracao": duracao,
+        "erros": erros,
+        "arquivo": caminho
+    }
+
+def avaliar_grupo(grupo, pasta_saida):
+    """Avalia, em sequência, os órgãos de um mesmo host."""
+    resumos = []
+    for orgao, tipo_orgao in grupo:
+        try:
+            resumos.append(avaliar_orgao(orgao, tipo_orgao, pasta_saida))
+        except Exception as e:
+            resumos.append({"orgao": orgao, "itens": 0, "atendidos": 0, "duracao": 0, "erros": [str(e)], "arquivo": None})
+    return resumos
+
+def executar_lote(orgaos=None, processos=None, pasta_saida=None):
+    """
+    Avalia os órgãos em um pool de processos, gravando o resultado de cada
+    órgão assim que ele termina. As buscas na web de todos os processos são
+    feitas por um único processo coordenador (BuscadorCoordenado).
+
+    Args:
+        orgaos (list): Tuplas (orgao, tipo_orgao); padrão: listar_orgaos()
+        processos (int): Tamanho do pool (padrão: número de CPUs)
+        pasta_saida (str): Pasta dos resultados (padrão: relatorios/lote_<data>)
+
+    Returns:
+        list: Resumos de todas as avaliações
+    """
+    orgaos = orgaos if orgaos is not None else listar_orgaos()
+    pasta_saida = pasta_saida or os.path.join('relatorios', f"lote_{datetime.now().strftime('%Y%m%d_%H%M%S')}")
+    os.makedirs(pasta_saida, exist_ok=True)
+
+    grupos = agrupar_por_host(orgaos)
+    total_orgaos = sum(len(g) for g in grupos)
+    print(f"Avaliando {total_orgaos} órgãos em {len(grupos)} hosts com {processos or os.cpu_count()} processos")
+
+    inicio = time.time()
+    resumos = []
+    with CoordenadorBuscas() as coordenador:
+        buscador = coordenador.BuscadorCoordenado()
+        with ProcessPoolExecutor(max_workers=processos, initializer=iniciar_processo, initargs=(buscador,)) as executor:
+            futuros = [executor.submit(avaliar_grupo, grupo, pasta_saida) for grupo in grupos]
+            for futuro in as_completed(futuros):
+                for resumo in futuro.result():
+                    resumos.append(resumo)
+                    situacao = "ERRO" if resumo["erros"] else f"{resumo['atendidos']}/{resumo['itens']} atendidos"
+                    print(f"[{len(resumos)}/{total_orgaos}] {resumo['orgao']}: {situacao} ({resumo['duracao']:.1f}s)")
+
+    duracao = time.time() - inicio
+    total_itens = sum(r["itens"] for r in resumos)
+    com_erro = sum(1 for r in resumos if r["erros"])
+    print("\n=== Resumo do lote ===")
+    print(f"Órgãos avaliados: {len(resumos)} ({com_erro} com erro)")
+    print(f"Itens verificados: {total_itens}")
+    print(f"Tempo total: {duracao / 60:.1f} min")
+    if duracao > 0:
+        print(f"Vazão: {len(resumos) / (duracao / 60):.2f} órgãos/min, {total_itens / duracao:.2f} itens/s")
+    print(f"Resultados em: {pasta_saida}")
+
+    return resumos
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Avaliação em lote dos órgãos do Amazonas")
+    parser.add_argument('--processos', type=int, default=None, help="Tamanho do pool de processos")
+    parser.add_argument('--saida', default=None, help="Pasta para os resultados")
+    parser.add_argument('--limite', type=int, default=None, help="Avaliar apenas os N primeiros órgãos")
+    args = parser.parse_args()
+
+    orgaos = listar_orgaos()
+    if args.limite:
+        orgaos = orgaos[:args.limite]
+    executar_lote(orgaos, processos=args.processos, pasta_saida=args.saida)
@@ -0,0 +1,213 @@
+# cache_busca.py
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime
+
+import config
+
+class CacheLRU:
+    """
+    Cache em memória com política LRU, tamanho máximo e validade por entrada.
+
+    Thread-safe. Mantém contadores de acertos e falhas para monitoramento.
+    """
+
+    def __init__(self, tamanho_maximo=None, ttl_segundos=None):
+        self.tamanho_maximo = tamanho_maximo or config.CACHE_LRU_TAMANHO
+        self.ttl_segundos = ttl_segundos or config.CACHE_LRU_TTL_SEGUNDOS
+        self._entradas = OrderedDict()
+        self._lock = threading.Lock()
+        self.acertos = 0
+        self.falhas = 0
+        self.expirados = 0
+
+    def obter(self, chave):
+        """Retorna o valor da chave, ou None se ausente ou expirado."""
+        agora = time.monotonic()
+        with self._lock:
+            entrada = self._entradas.get(chave)
+            if entrada is None:
+                self.falhas += 1
+                return None
+            valor, expira_em = entrada
+            if expira_em < agora:
+                del self._entradas[chave]
+                self.expirados += 1
+                self.falhas += 1
+                return None
+            self._entradas.move_to_end(chave)
+            self.acertos += 1
+            return valor
+
+    def salvar(self, chave, valor, ttl_segundos=None):
+        expira_em = time.monotonic() + (ttl_segundos or self.ttl_segundos)
+        with self._lock:
+            self._entradas[chave] = (valor, expira_em)
+            self._entradas.move_to_end(chave)
+            while len(self._entradas) > self.tamanho_maximo:
+                self._entradas.popitem(last=False)
+
+    def remover(self, chave):
+        with self._lock:
+            self._entradas.pop(chave, None)
+
+    def limpar(self):
+        with self._lock:
+            self._entradas.clear()
+
+    def estatisticas(self):
+        with self._lock:
+            consultas = self.acertos + self.falhas
+            return {
+                "tamanho": len(self._entradas),
+                "tamanho_maximo": self.tamanho_maximo,
+                "ttl_segundos": self.ttl_segundos,
+                "acertos": self.acertos,
+                "falhas": self.falhas,
+                "expirados": self.expirados,
+                "taxa_acerto": round(self.acertos / consultas, 4) if consultas else 0.0
+            }
+
+class CacheBusca:
+    """
+    Cache persistente de resultados de busca em uma tabela SQLite indexada.
+
+    Cada consulta é uma linha (chave primária = texto da consulta), então
+    leituras e gravações não dependem do tamanho do cache. O banco usa WAL,
+    permitindo leituras concorrentes enquanto outra thread grava. Um CacheLRU
+    na frente do banco atende as consultas repetidas sem acessar o disco.
+    """
+
+    def __init__(self, caminho, caminho_json=None, expiracao_dias=None):
+        """
+        Args:
+            caminho (str): Arquivo do banco SQLite
+            caminho_json (str): Cache JSON antigo, importado uma única vez
+            expiracao_dias (int): Validade das entradas (padrão: config.CACHE_EXPIRY_DAYS)
+        """
+        self.caminho = caminho
+        self.expiracao_dias = expiracao_dias or config.CACHE_EXPIRY_DAYS
+        self.memoria = CacheLRU()
+        self.acertos_disco = 0
+        self.falhas_disco = 0
+        self._local = threading.local()
+
+        conexao = self._conexao()
+        with conexao:
+            conexao.execute("""
+                CREATE TABLE IF NOT EXISTS buscas (
+                    query TEXT PRIMARY KEY,
+                    resultados TEXT NOT NULL,
+                    timestamp REAL NOT NULL
+                )
+            """)
+            conexao.execute("CREATE INDEX IF NOT EXISTS idx_buscas_timestamp ON buscas (timestamp)")
+            conexao.execute("CREATE TABLE IF NOT EXISTS metadados (chave TEXT PRIMARY KEY, valor TEXT)")
+
+        if caminho_json:
+            self._migrar_json(caminho_json)
+        self.remover_expirados()
+
+    def _conexao(self):
+        """Conexão da thread atual (conexões SQLite não são compartilhadas entre threads)."""
+        conexao = getattr(self._local, 'conexao', None)
+        if conexao is None:
+            diretorio = os.path.dirname(self.caminho)
+            if diretorio:
+                os.makedirs(diretorio, exist_ok=True)
+            conexao = sqlite3.connect(self.caminho, timeout=30)
+            conexao.execute("PRAGMA journal_mode=WAL")
+            conexao.execute("PRAGMA synchronous=NORMAL")
+            self._local.conexao = conexao
+        return conexao
+
+    def obter(self, query, max_age_days=None):
+        """
+        Retorna os resultados em cache para a consulta, ou None se não houver
+        entrada ou se ela for mais antiga que `max_age_days`.
+        """
+        max_age_days = max_age_days if max_age_days is not None else self.expiracao_dias
+        limite = time.time() - max_age_days * 86400
+
+        # 1. Memória
+        entrada = self.memoria.obter(query)
+        if entrada is not None:
+            resultados, timestamp = entrada
+            if timestamp >= limite:
+                return list(resultados)
+
+        # 2. Disco
+        linha = self._conexao().execute(
+            "SELECT resultados, timestamp FROM buscas WHERE query = ? AND timestamp >= ?",
+            (query, limite)
+        ).fetchone()
+        if not linha:
+            self.falhas_disco += 1
+            return None
+        self.acertos_disco += 1
+        resultados = json.loads(linha[0])
+        self.memoria.salvar(query, (tuple(resultados), linha[1]))
+        return resultados
+
+    def salvar(self, query, resultados, timestamp=None):
+        """Grava (ou substitui) os resultados de uma consulta."""
+        timestamp = timestamp or time.time()
+        conexao = self._conexao()
+        with conexao:
+            conexao.execute(
+                "INSERT OR REPLACE INTO buscas (query, resultados, timestamp) VALUES (?, ?, ?)",
+                (query, json.dumps(resultados, ensure_ascii=False), timestamp)
+            )
+        self.memoria.salvar(query, (tuple(resultados), timestamp))
+
+    def estatisticas(self):
+        """Contadores de acertos e falhas da memória e do disco."""
+        return {
+            "memoria": self.memoria.estatisticas(),
+            "disco": {
+                "acertos": self.acertos_disco,
+                "falhas": self.falhas_disco
+            }
+        }
+
+    def remover_expirados(self):
+        """Apaga as entradas mais antigas que o prazo de expiração."""
+        limite = time.time() - self.expiracao_dias * 86400
+        conexao = self._conexao()
+        with conexao:
+            return conexao.execute("DELETE FROM buscas WHERE timestamp < ?", (limite,)).rowcount
+
+    def _migrar_json(self, caminho_json):
+        """Importa o cache JSON antigo na primeira execução."""
+        conexao = self._conexao()
+        if conexao.execute("SELECT 1 FROM metadados WHERE chave = 'migracao_json'").fetchone():
+            return
+        if os.path.exists(caminho_json):
+            try:
+                with open(caminho_json, 'r', encoding='utf-8') as f:
+                    antigo = json.load(f)
+            except (OSError, ValueError) as e:
+                print(f"Não foi possível migrar o cache JSON: {e}")
+                antigo = {}
+            linhas = []
+            for query, entrada in antigo.items():
+                try:
+                    timestamp = datetime.fromisoformat(entrada['timestamp']).timestamp()
+                    linhas.append((query, json.dumps(entrada['results'], ensure_ascii=False), timestamp))
+                except (KeyError, TypeError, ValueError):
+                    continue
+            with conexao:
+                conexao.executemany(
+                    "INSERT OR IGNORE INTO buscas (query, resultados, timestamp) VALUES (?, ?, ?)",
+                    linhas
+                )
+            print(f"Cache JSON migrado para SQLite: {len(linhas)} consultas")
+        with conexao:
+            conexao.execute(
+                "INSERT OR REPLACE INTO metadados (chave, valor) VALUES ('migracao_json', ?)",
+                (datetime.now().isoformat(),)
+            )
@@ -7,4 +7,57 @@ TESSERACT_PATH = r'C:\Program Files\Tesseract-OCR\tesseract.exe'  # Ajuste confo
 DB_PATH = 'sqlite:///transparencia.db'
 
 # Configurações de cache
-CACHE_EXPIRY_DAYS = 7
\ No newline at end of file
+CACHE_EXPIRY_DAYS = 7
+CACHE_LRU_TAMANHO = 2048  # Consultas de busca mantidas em memória
+CACHE_LRU_TTL_SEGUNDOS = 3600  # Validade de cada consulta na memória
+NORMALIZE_CACHE_TAMANHO = 65536  # Textos curtos normalizados mantidos em memória
+NORMALIZE_MEMO_MAX_CARACTERES = 200  # Textos maiores são normalizados sem memorizar
+
+# Configurações do cliente HTTP
+HTTP_POOL_CONNECTIONS = 20  # Quantidade de hosts com pool de conexões mantido
+HTTP_POOL_MAXSIZE = 4  # Conexões por host; também limita as requisições simultâneas ao mesmo host
+HTTP_POOL_BLOCK = True  # Com o pool do host esgotado, espera uma conexão livre em vez de abrir outra
+HTTP_TIMEOUT = 15  # Timeout padrão das requisições (segundos)
+HTTP_USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+HTTP_CACHE_ATIVO = True  # Guarda as páginas baixadas e as revalida com If-None-Match/If-Modified-Since
+HTTP_CACHE_ARQUIVO = 'cache/http_cache.db'
+HTTP_CACHE_FRESCOR_SEGUNDOS = 0  # Validade de páginas sem Cache-Control/Expires, só para GETs com revalidar=False (0 = sempre revalidar)
+HTTP_CACHE_RETENCAO_DIAS = 30  # Páginas não revalidadas há mais tempo são apagadas
+HTTP_CACHE_TAMANHO_MAXIMO = 10 * 1024 * 1024  # Respostas maiores (bytes) não são guardadas
+
+# Limites por host (agendador_hosts): token bucket e requisições simultâneas
+HOST_TAXA_PADRAO = 2.0  # Requisições por segundo a um mesmo host
+HOST_RAJADA_PADRAO = 4  # Requisições seguidas permitidas antes de aplicar a taxa
+HOST_MAX_CONCORRENTES_PADRAO = 4  # Requisições simultâneas a um mesmo host
+LIMITES_POR_HOST = {  # Host ou domínio pai -> limites próprios
+    'duckduckgo.com': {'taxa': 0.5, 'rajada': 2, 'max_concorrentes': 1},
+    'bing.com': {'taxa': 0.5, 'rajada': 2, 'max_concorrentes': 1},
+    'google.com': {'taxa': 0.2, 'rajada': 1, 'max_concorrentes': 1},
+}
+
+# Configurações da avaliação
+AVALIACAO_MAX_WORKERS = 8  # Perguntas verificadas em paralelo em cada avaliação
+MAX_JOBS_SIMULTANEOS = 3  # Avaliações executadas ao mesmo tempo; as demais aguardam na fila
+JOB_RETENCAO_MINUTOS = 60  # Tempo que um job finalizado continua disponível para consulta
+LOTE_CRITERIOS_MAX_PARES = 500  # Pares (UG, critério) aceitos por avaliação em lote
+SSE_KEEPALIVE_SEGUNDOS = 15  # Sem eventos por este tempo, o stream envia um comentário para manter a conexão
+SSE_REPLAY_MAXIMO = 2000  # Eventos guardados por job para reenviar a um stream que reconecta
+SSE_RETRY_MS = 3000  # Intervalo de reconexão sugerido ao EventSource do navegador
+REAVALIACAO_ATIVA = True  # Reaproveita o veredito de verificações cujas páginas não mudaram
+REAVALIACAO_ARQUIVO = 'cache/verificacoes.db'
+REAVALIACAO_RETENCAO_DIAS = 90  # Vereditos mais antigos são descartados
+HISTORICO_ATIVO = True  # Grava as avaliações e seus resultados no banco (DB_PATH)
+HISTORICO_TAMANHO_LOTE = 50  # Resultados acumulados antes de cada inserção em lote
+
+# Planilha de links por UG e critério (planilha_links)
+PLANILHA_LINKS_ARQUIVO = 'lista_criterios.csv'
+PLANILHA_LINKS_VERIFICACAO_SEGUNDOS = 2  # Intervalo mínimo entre verificações do mtime do arquivo
+
+# Resolução de nomes de órgãos (resolvedor_orgaos)
+RESOLVEDOR_SCORE_MINIMO = 0.65  # Semelhança mínima (Dice dos trigramas) para aceitar um nome aproximado
+
+# Configurações do Selenium
+SELENIUM_POOL_TAMANHO = 2  # Navegadores Chrome abertos ao mesmo tempo
+SELENIUM_POOL_AQUECIDOS = 1  # Navegadores abertos na inicialização do servidor
+SELENIUM_MAX_USOS_POR_DRIVER = 25  # Buscas antes de reciclar o navegador (limita vazamento de memória)
+SELENIUM_DIGITACAO_FALLBACK = False  # Se a busca direta pela URL for bloqueada, digitar a consulta como humano
@@ -0,0 +1,134 @@
+# criterios.py
+import json
+import os
+import threading
+from collections import namedtuple
+
+# Matrizes de perguntas, matrizes de cada tipo de órgão e verificações de cada critério
+ARQUIVO_CRITERIOS = os.path.join(os.path.dirname(__file__), 'data', 'criterios.json')
+# Lista de critérios servida em /api/criteria
+ARQUIVO_CRITERIOS_API = os.path.join(os.path.dirname(__file__), 'data', 'criteria.json')
+
+# Período de que depende o veredito de cada função de verificação
+# (dia: "atualizado nos últimos 30 dias"; ano: série histórica; quadrimestre: RGF)
+JANELAS = {
+    "check_atualidade": "dia",
+    "check_recency": "dia",
+    "check_serie_historica": "ano",
+    "pagina_tem_atualidade": "quadrimestre",
+}
+
+# Item de verificação de um critério: função do scraper que o verifica e
+# janela de tempo de que o veredito depende (None se não depende da data)
+Verificacao = namedtuple('Verificacao', ['item', 'funcao', 'janela'])
+
+class Criterio(dict):
+    """
+    Pergunta da matriz (id, pergunta, dimensao, fundamentacao, classificacao).
+    Somente leitura: as mesmas instâncias são compartilhadas por todas as avaliações.
+    """
+
+    def _somente_leitura(self, *args, **kwargs):
+        raise TypeError("Critério é somente leitura")
+
+    __setitem__ = __delitem__ = _somente_leitura
+    clear = pop = popitem = setdefault = update = _somente_leitura
+
+    def __reduce__(self):
+        return (Criterio, (dict(self),))
+
+class RegistroCriterios:
+    """
+    Critérios do PNTP, carregados uma única vez de data/criterios.json.
+
+    Indexa as perguntas por matriz, por tipo de órgão (matriz comum mais as
+    específicas), por id e por dimensão, e guarda a tabela de verificações de
+    cada critério: os itens aplicáveis e a função do scraper que verifica
+    cada item.
+    """
+
+    def __init__(self, caminho=None, caminho_api=None):
+        """
+        Args:
+            caminho (str): Arquivo dos critérios (padrão: data/criterios.json)
+            caminho_api (str): Lista de critérios de /api/criteria (padrão: data/criteria.json)
+        """
+        with open(caminho or ARQUIVO_CRITERIOS, encoding='utf-8') as f:
+            dados = json.load(f)
+        with open(caminho_api or ARQUIVO_CRITERIOS_API, encoding='utf-8') as f:
+            self.criterios_api = json.load(f)
+
+        self.matrizes = {
+            matriz: tuple(Criterio(pergunta) for pergunta in perguntas)
+            for matriz, perguntas in dados['matrizes'].items()
+        }
+        self.por_tipo_orgao = {
+            tipo: tuple(criterio for matriz in matrizes for criterio in self.matrizes[matriz])
+            for tipo, matrizes in dados['tipos_orgao'].items()
+        }
+
+        # O mesmo id pode aparecer em mais de uma matriz, com textos diferentes
+        self.por_id = {}
+        self.por_matriz_e_id = {}
+        self.por_dimensao = {}
+        for nome_matriz, matriz in self.matrizes.items():
+            for criterio in matriz:
+                self.por_matriz_e_id[(nome_matriz, criterio["id"])] = criterio
+                self.por_id.setdefault(criterio["id"], []).append(criterio)
+                # As perguntas do verificador (matriz "verificador") não têm dimensão
+                if "dimensao" in criterio:
+                    self.por_dimensao.setdefault(criterio["dimensao"], []).append(criterio)
+        self.por_id = {id_: tuple(lista) for id_, lista in self.por_id.items()}
+        self.por_dimensao = {dimensao: tuple(lista) for dimensao, lista in self.por_dimensao.items()}
+
+        # A disponibilidade é verificada em todos os critérios; os demais itens
+        # dependem do critério
+        self.verificacoes = {
+            criterio_id: tuple(Verificacao(item, funcao, JANELAS.get(funcao)) for item, funcao in itens.items())
+            for criterio_id, itens in dados['verificacoes'].items()
+        }
+
+    def perguntas(self, matriz):
+        """Perguntas de uma matriz (lista vazia se a matriz não existe)."""
+        return list(self.matrizes.get(matriz, ()))
+
+    def perguntas_do_tipo(self, tipo_orgao):
+        """Perguntas da avaliação de um tipo de órgão (padrão: só a matriz comum)."""
+        return list(self.por_tipo_orgao.get(tipo_orgao, self.matrizes['comum']))
+
+    def obter(self, criterio_id, matriz=None):
+        """Critério com o id (na matriz indicada ou na primeira em que aparece)."""
+        if matriz is not None:
+            return self.por_matriz_e_id.get((matriz, criterio_id))
+        criterios = self.por_id.get(criterio_id)
+        return criterios[0] if criterios else None
+
+    def da_dimensao(self, dimensao):
+        return list(self.por_dimensao.get(dimensao, ()))
+
+    def verificacoes_de(self, criterio_id):
+        """Verificações de página do critério, além da disponibilidade."""
+        return self.verificacoes.get(criterio_id, ())
+
+    def itens_aplicaveis(self, criterio_id):
+        return ["disponibilidade"] + [v.item for v in self.verificacoes_de(criterio_id)]
+
+def valor_da_janela(janela, data):
+    """Valor da janela "dia" ou "ano" na data da verificação (None sem janela)."""
+    if janela == "dia":
+        return data.isoformat()
+    if janela == "ano":
+        return str(data.year)
+    return None
+
+_registro = None
+_lock = threading.Lock()
+
+def obter_registro():
+    """Retorna o registro compartilhado, carregado no primeiro uso."""
+    global _registro
+    if _registro is None:
+        with _lock:
+            if _registro is None:
+                _registro = RegistroCriterios()
+    return _registro
@@ -0,0 +1,94 @@
+# documento.py
+import re
+
+from bs4 import BeautifulSoup
+from bs4.element import CData, NavigableString, Tag
+
+from texto import TextoNormalizado, normalize
+
+# Tipos de texto considerados por soup.get_text() (exclui comentários, scripts e estilos)
+TIPOS_TEXTO = (NavigableString, CData)
+
+ANO_RE = re.compile(r'\b(20\d{2})\b')
+
+class Documento:
+    """
+    Visão pré-processada de uma página para os critérios do PNTP.
+
+    Percorre a árvore uma única vez e guarda o que as verificações consultam:
+    os textos (originais e normalizados), o texto completo normalizado, os
+    links, os botões, os campos de formulário, as opções dos selects e os
+    anos citados. As funções check_* do scraper consultam estes atributos em
+    vez de percorrer o DOM novamente.
+    """
+
+    def __init__(self, soup):
+        """
+        Args:
+            soup (BeautifulSoup): DOM da página
+        """
+        self.textos = []  # Textos não vazios, na ordem do documento
+        self.textos_normalizados = []
+        self.links = []  # (href em minúsculas, texto normalizado) de cada <a href>
+        self.clicaveis = []  # (texto direto, texto normalizado) de cada <a> e <button>
+        self.inputs = []  # Atributos de cada <input>
+        self.selects = []  # (name, valores das opções) de cada <select>
+        self.anos = set()
+
+        for no in soup.descendants:
+            if isinstance(no, Tag):
+                self._registrar_elemento(no)
+            elif type(no) in TIPOS_TEXTO:
+                texto = no.strip()
+                if texto:
+                    self.textos.append(texto)
+                    self.textos_normalizados.append(normalize(texto))
+                    self.anos.update(int(ano) for ano in ANO_RE.findall(texto))
+
+        self.texto = " ".join(self.textos_normalizados)
+        self._indice = None
+
+    def _registrar_elemento(self, elemento):
+        nome = elemento.name
+        if nome in ('a', 'button'):
+            texto_normalizado = normalize(elemento.get_text())
+            self.clicaveis.append((elemento.string, texto_normalizado))
+            if nome == 'a' and elemento.get('href') is not None:
+                self.links.append((elemento['href'].lower(), texto_normalizado))
+        elif nome == 'input':
+            self.inputs.append(elemento.attrs)
+        elif nome == 'select':
+            valores = [opcao.get('value', '') for opcao in elemento.find_all('option')]
+            self.selects.append((elemento.get('name', ''), valores))
+
+    @property
+    def indice(self):
+        """Texto do documento normalizado de uma vez, com posições no original."""
+        if self._indice is None:
+            self._indice = TextoNormalizado("\n".join(self.textos))
+        return self._indice
+
+    def trechos(self, buscador, contexto=40, limite=5):
+        """
+        Trechos do texto original (com acentos) em torno das ocorrências dos
+        termos de um BuscadorTermos, para uso como evidência.
+        """
+        indice = self.indice
+        trechos = []
+        for posicao, termo in buscador.ocorrencias(indice.texto):
+            # Textos de elementos diferentes ficam separados por um espaço
+            trecho = " ".join(indice.trecho(posicao, posicao + len(termo), contexto).split())
+            if trecho not in trechos:
+                trechos.append(trecho)
+                if len(trechos) >= limite:
+                    break
+        return trechos
+
+    @classmethod
+    def de(cls, origem):
+        """Aceita um Documento, um BeautifulSoup ou HTML e retorna um Documento."""
+        if isinstance(origem, cls):
+            return origem
+        if isinstance(origem, str):
+            origem = BeautifulSoup(origem, 'html.parser')
+        return cls(origem)
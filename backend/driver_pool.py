@@ -0,0 +1,321 @@
+# driver_pool.py
+import atexit
+import queue
+import random
+import shutil
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+
+import undetected_chromedriver as uc
+from selenium import webdriver
+from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.chrome.service import Service
+from selenium.webdriver.common.keys import Keys
+from selenium.webdriver.support.ui import WebDriverWait
+from webdriver_manager.chrome import ChromeDriverManager
+
+import config
+
+# User agents para rotação (usados pelos drivers Selenium padrão)
+USER_AGENTS = [
+    'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
+    'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/92.0.4515.107 Safari/537.36',
+    'Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:90.0) Gecko/20100101 Firefox/90.0',
+    'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/14.1.1 Safari/605.1.15',
+    'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36 Edg/91.0.864.59'
+]
+
+# Chrome abertos em todos os pools: config.SELENIUM_POOL_TAMANHO vale para o
+# processo inteiro, qualquer que seja a configuração de navegador de cada pool
+_chromes = threading.BoundedSemaphore(config.SELENIUM_POOL_TAMANHO)
+
+# Intervalo, em segundos, entre as tentativas de abrir um driver quando o
+# limite global está ocupado (e os drivers ociosos de outros pools são revistos)
+ESPERA_VAGA_CHROME = 0.5
+
+class DriverPooled:
+    """Um driver do pool, com seu diretório de perfil temporário e contagem de usos."""
+
+    def __init__(self, driver, perfil):
+        self.driver = driver
+        self.perfil = perfil
+        self.usos = 0
+
+class DriverPool:
+    """
+    Pool de drivers do Chrome mantidos abertos entre as buscas.
+
+    Cada driver usa um perfil temporário próprio (nunca o chrome_profile
+    compartilhado), então drivers diferentes podem ser usados em paralelo.
+    Drivers que falham na verificação de saúde, que terminam um uso com erro
+    ou que atingem `max_usos` são encerrados e substituídos.
+
+    Além do limite do próprio pool, todos os pools dividem o limite global de
+    Chromes abertos: com ele atingido, um pool que precisa de um driver novo
+    encerra um driver ocioso de outro pool ou espera algum ser encerrado.
+    """
+
+    def __init__(self, tamanho=None, headless=True, use_undetected=True, max_usos=None):
+        """
+        Args:
+            tamanho (int): Máximo de drivers abertos ao mesmo tempo neste pool
+            headless (bool): Se True, executa o Chrome em modo headless
+            use_undetected (bool): Se True, usa undetected_chromedriver
+            max_usos (int): Usos (buscas) antes de reciclar o driver
+        """
+        self.tamanho = tamanho or config.SELENIUM_POOL_TAMANHO
+        self.headless = headless
+        self.use_undetected = use_undetected
+        self.max_usos = max_usos or config.SELENIUM_MAX_USOS_POR_DRIVER
+        self._livres = queue.LifoQueue()
+        self._vagas = threading.BoundedSemaphore(self.tamanho)  # Drivers em uso
+        self._abertos = 0  # Drivers abertos (livres e em uso) ou sendo abertos
+        self._contagem = threading.Lock()
+        self._fechado = False
+
+    def _criar(self):
+        """Abre um novo Chrome com perfil temporário."""
+        perfil = tempfile.mkdtemp(prefix='sapt_chrome_')
+        try:
+            if self.use_undetected:
+                options = uc.ChromeOptions()
+            else:
+                options = Options()
+            if self.headless:
+                options.add_argument('--headless')
+
+            options.add_argument('--no-sandbox')
+            options.add_argument('--disable-dev-shm-usage')
+            options.add_argument('--disable-gpu')
+            options.add_argument('--window-size=1920,1080')
+            options.add_argument('--disable-notifications')
+
+            # Adicionar argumentos para parecer mais humano
+            options.add_argument('--disable-blink-features=AutomationControlled')
+            options.add_argument(f'--user-data-dir={perfil}')
+
+            if self.use_undetected:
+                driver = uc.Chrome(options=options)
+            else:
+                options.add_argument('--disable-extensions')
+                options.add_argument('--disable-infobars')
+                options.add_experimental_option('excludeSwitches', ['enable-automation'])
+                options.add_experimental_option('useAutomationExtension', False)
+                options.add_argument(f'--user-agent={random.choice(USER_AGENTS)}')
+                driver = webdriver.Chrome(
+                    service=Service(ChromeDriverManager().install()),
+                    options=options
+                )
+                # Modificar o navigator.webdriver para evitar detecção
+                driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+        except Exception:
+            shutil.rmtree(perfil, ignore_errors=True)
+            raise
+        return DriverPooled(driver, perfil)
+
+    def _abrir(self):
+        """
+        Abre um driver já contado em _abertos e no limite global de Chromes
+        (ambos são devolvidos se a abertura falhar).
+        """
+        try:
+            return self._criar()
+        except Exception:
+            with self._contagem:
+                self._abertos -= 1
+            _chromes.release()
+            raise
+
+    def _reservar_chrome(self, prazo):
+        """
+        Reserva uma vaga no limite global de Chromes, encerrando um driver
+        ocioso de outro pool se todas estiverem ocupadas. Sem nenhum ocioso,
+        espera por ESPERA_VAGA_CHROME segundos (no máximo até `prazo`).
+
+        Returns:
+            bool: True se a vaga foi reservada
+        """
+        if _chromes.acquire(blocking=False):
+            return True
+        if _fechar_ocioso(excluir=self) and _chromes.acquire(blocking=False):
+            return True
+        espera = ESPERA_VAGA_CHROME
+        if prazo is not None:
+            espera = min(espera, prazo - time.monotonic())
+            if espera <= 0:
+                raise TimeoutError("Limite global de drivers abertos atingido")
+        return _chromes.acquire(timeout=espera)
+
+    def _saudavel(self, item):
+        """Verifica se o navegador ainda responde."""
+        try:
+            return item.driver.execute_script("return 1") == 1
+        except Exception:
+            return False
+
+    def _descartar(self, item):
+        with self._contagem:
+            self._abertos -= 1
+        try:
+            item.driver.quit()
+        except Exception:
+            pass
+        finally:
+            _chromes.release()
+        shutil.rmtree(item.perfil, ignore_errors=True)
+
+    def checkout(self, timeout=None):
+        """
+        Retira um driver do pool (ou abre um novo, se houver vaga).
+        Bloqueia enquanto todos os drivers estiverem em uso.
+
+        Returns:
+            DriverPooled: Driver reservado; devolva com checkin()
+        """
+        prazo = None if timeout is None else time.monotonic() + timeout
+        if not self._vagas.acquire(timeout=timeout):
+            raise TimeoutError("Nenhum driver disponível no pool")
+        try:
+            while True:
+                try:
+                    item = self._livres.get_nowait()
+                except queue.Empty:
+                    # Sem driver livre, todos os abertos estão em uso e cabem nas
+                    # vagas do pool; falta a vaga no limite global (enquanto ela
+                    # não vem, um driver devolvido a este pool também serve)
+                    if self._reservar_chrome(prazo):
+                        with self._contagem:
+                            self._abertos += 1
+                        return self._abrir()
+                    continue
+                if self._saudavel(item):
+                    return item
+                self._descartar(item)
+        except Exception:
+            self._vagas.release()
+            raise
+
+    def checkin(self, item, com_erro=False):
+        """Devolve o driver ao pool, reciclando-o se necessário."""
+        try:
+            item.usos += 1
+            if self._fechado or com_erro or item.usos >= self.max_usos or not self._saudavel(item):
+                self._descartar(item)
+            else:
+                self._livres.put(item)
+        finally:
+            self._vagas.release()
+
+    @contextmanager
+    def driver(self):
+        """Context manager que empresta um driver e o devolve ao final."""
+        item = self.checkout()
+        com_erro = False
+        try:
+            yield item.driver
+        except Exception:
+            com_erro = True
+            raise
+        finally:
+            self.checkin(item, com_erro=com_erro)
+
+    def aquecer(self, quantidade=None):
+        """
+        Abre drivers antecipadamente para que as primeiras buscas não esperem o
+        Chrome iniciar. Só completa até `tamanho` drivers abertos, somando os
+        livres e os em uso, e sem passar do limite global; cada driver
+        aquecido ocupa uma vaga enquanto abre.
+        """
+        quantidade = min(quantidade or config.SELENIUM_POOL_AQUECIDOS, self.tamanho)
+        while self._livres.qsize() < quantidade:
+            if not self._vagas.acquire(blocking=False):
+                break  # Todos os drivers estão em uso
+            try:
+                if not _chromes.acquire(blocking=False):
+                    break  # Limite global atingido
+                with self._contagem:
+                    if self._abertos >= self.tamanho:
+                        _chromes.release()
+                        break
+                    self._abertos += 1
+                try:
+                    self._livres.put(self._abrir())
+                except Exception as e:
+                    print(f"Erro ao aquecer o pool de drivers: {e}")
+                    break
+            finally:
+                self._vagas.release()
+
+    def fechar_ocioso(self):
+        """
+        Encerra um driver livre (liberando sua vaga no limite global).
+
+        Returns:
+            bool: False se não havia driver livre
+        """
+        try:
+            item = self._livres.get_nowait()
+        except queue.Empty:
+            return False
+        self._descartar(item)
+        return True
+
+    def esvaziar(self):
+        """Encerra todos os drivers livres; o pool continua em uso e abre outros quando preciso."""
+        while self.fechar_ocioso():
+            pass
+
+    def fechar(self):
+        """Encerra todos os drivers livres; os em uso são encerrados ao serem devolvidos."""
+        self._fechado = True
+        self.esvaziar()
+
+def aguardar_carregamento(driver, timeout=10):
+    """Espera o documento terminar de carregar (no lugar de pausas fixas)."""
+    WebDriverWait(driver, timeout).until(
+        lambda d: d.execute_script("return document.readyState") == "complete"
+    )
+
+def digitar_como_humano(campo, texto):
+    """
+    Digita o texto caractere a caractere, com pausas aleatórias, e envia.
+    Lento (cerca de 0,1 s por caractere): usado apenas como alternativa quando
+    a navegação direta é bloqueada e config.SELENIUM_DIGITACAO_FALLBACK está ativo.
+    """
+    campo.clear()
+    for char in texto:
+        campo.send_keys(char)
+        time.sleep(random.uniform(0.05, 0.15))
+    time.sleep(random.uniform(0.5, 1.0))
+    campo.send_keys(Keys.RETURN)
+
+_pools = {}
+_lock = threading.Lock()
+
+def obter_pool(headless=True, use_undetected=True):
+    """Retorna o pool compartilhado para a configuração de navegador informada."""
+    chave = (headless, use_undetected)
+    with _lock:
+        pool = _pools.get(chave)
+        if pool is None:
+            pool = DriverPool(headless=headless, use_undetected=use_undetected)
+            _pools[chave] = pool
+    return pool
+
+def _fechar_ocioso(excluir=None):
+    """Encerra um driver livre de algum pool compartilhado (exceto `excluir`); False se não havia."""
+    with _lock:
+        pools = [pool for pool in _pools.values() if pool is not excluir]
+    return any(pool.fechar_ocioso() for pool in pools)
+
+def aquecer_em_segundo_plano(headless=True, use_undetected=True):
+    """Aquece o pool padrão em uma thread, sem atrasar a inicialização do servidor."""
+    pool = obter_pool(headless, use_undetected)
+    threading.Thread(target=pool.aquecer, daemon=True).start()
+
+@atexit.register
+def _fechar_pools():
+    for pool in list(_pools.values()):
+        pool.fechar()
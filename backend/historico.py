@@ -0,0 +1,163 @@
+# historico.py
+import threading
+from datetime import datetime
+
+from sqlalchemy import create_engine, insert, select, update
+from sqlalchemy.orm import sessionmaker
+
+import config
+from models import Base, Avaliacao, ResultadoCriterio
+
+# Campos do resultado enviado ao cliente -> colunas de ResultadoCriterio
+CAMPOS_RESULTADO = {
+    "disponibilidade": "disponibilidade",
+    "atualidade": "atualidade",
+    "serieHistorica": "serie_historica",
+    "gravacaoRelatorios": "gravacao_relatorios",
+    "filtroPesquisa": "filtro_pesquisa",
+    "linkEvidencia": "link_evidencia",
+    "observacao": "observacao",
+}
+
+class Historico:
+    """
+    Histórico das avaliações no banco de dados (tabelas avaliacoes e
+    resultados_criterio).
+
+    Os resultados de cada avaliação são acumulados por um GravadorResultados
+    e inseridos em lote, de modo que uma avaliação faz poucas transações em
+    vez de uma por item. As consultas usam o índice (orgao, criterio, data).
+    """
+
+    def __init__(self, db_path=None):
+        """
+        Args:
+            db_path (str): URL do banco (padrão: config.DB_PATH)
+        """
+        self.engine = create_engine(db_path or config.DB_PATH, connect_args={'timeout': 30})
+        Base.metadata.create_all(self.engine)
+        self.Session = sessionmaker(bind=self.engine)
+
+    def iniciar_avaliacao(self, job_id, orgao, tipo_orgao=None, total_perguntas=None):
+        """Registra o início de uma avaliação e retorna seu id."""
+        with self.Session() as session:
+            avaliacao = Avaliacao(
+                job_id=job_id,
+                orgao=orgao,
+                tipo_orgao=tipo_orgao,
+                status='em_andamento',
+                total_perguntas=total_perguntas,
+                iniciada_em=datetime.now()
+            )
+            session.add(avaliacao)
+            session.commit()
+            return avaliacao.id
+
+    def inserir_resultados(self, linhas):
+        """Insere, numa única transação, as linhas de ResultadoCriterio (dicts)."""
+        if not linhas:
+            return
+        with self.Session() as session:
+            session.execute(insert(ResultadoCriterio), linhas)
+            session.commit()
+
+    def finalizar_avaliacao(self, avaliacao_id, status):
+        with self.Session() as session:
+            session.execute(
+                update(Avaliacao)
+                .where(Avaliacao.id == avaliacao_id)
+                .values(status=status, finalizada_em=datetime.now())
+            )
+            session.commit()
+
+    def consultar(self, orgao=None, criterio=None, desde=None, ate=None, limite=100):
+        """
+        Resultados gravados, do mais recente para o mais antigo.
+
+        Args:
+            orgao (str): Nome exato do órgão
+            criterio (str): ID do item da matriz
+            desde (datetime): Data mínima da avaliação
+            ate (datetime): Data máxima da avaliação
+            limite (int): Quantidade máxima de resultados
+
+        Returns:
+            list: Resultados (dicts)
+        """
+        consulta = select(ResultadoCriterio)
+        if orgao:
+            consulta = consulta.where(ResultadoCriterio.orgao == orgao)
+        if criterio:
+            consulta = consulta.where(ResultadoCriterio.criterio == criterio)
+        if desde:
+            consulta = consulta.where(ResultadoCriterio.data >= desde)
+        if ate:
+            consulta = consulta.where(ResultadoCriterio.data <= ate)
+        consulta = consulta.order_by(ResultadoCriterio.data.desc(), ResultadoCriterio.id.desc()).limit(limite)
+
+        with self.Session() as session:
+            return [
+                {
+                    "avaliacaoId": r.avaliacao_id,
+                    "orgao": r.orgao,
+                    "criterio": r.criterio,
+                    "data": r.data.isoformat(),
+                    "disponibilidade": r.disponibilidade,
+                    "atualidade": r.atualidade,
+                    "serieHistorica": r.serie_historica,
+                    "gravacaoRelatorios": r.gravacao_relatorios,
+                    "filtroPesquisa": r.filtro_pesquisa,
+                    "linkEvidencia": r.link_evidencia,
+                    "observacao": r.observacao
+                }
+                for r in session.scalars(consulta)
+            ]
+
+class GravadorResultados:
+    """
+    Acumula os resultados de uma avaliação e os grava em lotes de
+    `tamanho_lote` itens; finalizar() grava o restante e o status final.
+    Usado pela thread que consome os resultados da avaliação.
+    """
+
+    def __init__(self, historico, job_id, orgao, tipo_orgao=None, total_perguntas=None, tamanho_lote=None):
+        self.historico = historico
+        self.orgao = orgao
+        self.tamanho_lote = tamanho_lote or config.HISTORICO_TAMANHO_LOTE
+        self.avaliacao_id = historico.iniciar_avaliacao(job_id, orgao, tipo_orgao, total_perguntas)
+        self.data = datetime.now()
+        self._pendentes = []
+
+    def adicionar(self, resultado):
+        linha = {
+            "avaliacao_id": self.avaliacao_id,
+            "orgao": self.orgao,
+            "criterio": str(resultado.get("id")),
+            "data": self.data
+        }
+        for campo, coluna in CAMPOS_RESULTADO.items():
+            linha[coluna] = resultado.get(campo)
+        self._pendentes.append(linha)
+        if len(self._pendentes) >= self.tamanho_lote:
+            self.gravar()
+
+    def gravar(self):
+        """Insere os resultados pendentes."""
+        pendentes, self._pendentes = self._pendentes, []
+        self.historico.inserir_resultados(pendentes)
+
+    def finalizar(self, status):
+        self.gravar()
+        self.historico.finalizar_avaliacao(self.avaliacao_id, status)
+
+_historico = None
+_lock = threading.Lock()
+
+def obter_historico():
+    """Retorna o histórico compartilhado (None se desativado em config.HISTORICO_ATIVO)."""
+    global _historico
+    if _historico is None and config.HISTORICO_ATIVO:
+        with _lock:
+            if _historico is None:
+                _historico = Historico()
+    return _historico
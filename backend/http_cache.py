@@ -0,0 +1,211 @@
+# http_cache.py
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+import zlib
+from email.utils import parsedate_to_datetime
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+import config
+
+MAX_AGE_RE = re.compile(r'max-age\s*=\s*"?(\d+)', re.I)
+
+# Cabeçalhos da resposta guardados junto com o corpo
+CABECALHOS_GUARDADOS = (
+    'Content-Type', 'ETag', 'Last-Modified', 'Cache-Control', 'Expires', 'Date', 'Vary'
+)
+
+def diretivas_cache(response):
+    """Diretivas do Cache-Control da resposta, em minúsculas."""
+    valor = response.headers.get('Cache-Control', '')
+    return {d.strip().split('=')[0].lower() for d in valor.split(',') if d.strip()}
+
+def validade_segundos(response, frescor_padrao):
+    """
+    Por quanto tempo a resposta pode ser usada sem revalidar: max-age do
+    Cache-Control, senão o Expires, senão a janela de frescor configurada.
+    """
+    diretivas = diretivas_cache(response)
+    if 'no-cache' in diretivas:
+        return 0
+    m = MAX_AGE_RE.search(response.headers.get('Cache-Control', ''))
+    if m:
+        return int(m.group(1))
+    expires = response.headers.get('Expires')
+    if expires:
+        try:
+            return max(0, parsedate_to_datetime(expires).timestamp() - time.time())
+        except (TypeError, ValueError):
+            return 0
+    return frescor_padrao
+
+class CacheHTTP:
+    """
+    Cache HTTP persistente (SQLite) para os downloads de páginas.
+
+    Guarda o corpo e os validadores (ETag, Last-Modified) de cada resposta
+    200. A página é revalidada com If-None-Match/If-Modified-Since e um 304
+    reaproveita o corpo guardado. Só com revalidar=False, e dentro da validade
+    (Cache-Control/Expires ou, na falta deles, a janela de frescor
+    configurada), a página é servida do disco sem acessar a rede: uma
+    resposta servida assim não diz se o site ainda está no ar. Respostas com
+    no-store ou `Vary: *` não são guardadas.
+    """
+
+    def __init__(self, caminho, frescor_segundos=None, retencao_dias=None, tamanho_maximo=None):
+        """
+        Args:
+            caminho (str): Arquivo do banco SQLite
+            frescor_segundos (int): Validade de respostas sem Cache-Control/Expires
+            retencao_dias (int): Entradas sem uso por mais tempo são apagadas
+            tamanho_maximo (int): Respostas maiores (em bytes) não são guardadas
+        """
+        self.caminho = caminho
+        self.frescor_segundos = frescor_segundos if frescor_segundos is not None else config.HTTP_CACHE_FRESCOR_SEGUNDOS
+        self.retencao_dias = retencao_dias or config.HTTP_CACHE_RETENCAO_DIAS
+        self.tamanho_maximo = tamanho_maximo or config.HTTP_CACHE_TAMANHO_MAXIMO
+        self.acertos = 0
+        self.revalidados = 0
+        self.baixados = 0
+        self._contadores = threading.Lock()
+        self._local = threading.local()
+
+        conexao = self._conexao()
+        with conexao:
+            conexao.execute("""
+                CREATE TABLE IF NOT EXISTS respostas (
+                    url TEXT PRIMARY KEY,
+                    url_final TEXT NOT NULL,
+                    cabecalhos TEXT NOT NULL,
+                    encoding TEXT,
+                    corpo BLOB NOT NULL,
+                    armazenado_em REAL NOT NULL,
+                    expira_em REAL NOT NULL
+                )
+            """)
+            conexao.execute("CREATE INDEX IF NOT EXISTS idx_respostas_armazenado ON respostas (armazenado_em)")
+        self.remover_antigos()
+
+    def _conexao(self):
+        """Conexão da thread atual (conexões SQLite não são compartilhadas entre threads)."""
+        conexao = getattr(self._local, 'conexao', None)
+        if conexao is None:
+            diretorio = os.path.dirname(self.caminho)
+            if diretorio:
+                os.makedirs(diretorio, exist_ok=True)
+            conexao = sqlite3.connect(self.caminho, timeout=30)
+            conexao.execute("PRAGMA journal_mode=WAL")
+            conexao.execute("PRAGMA synchronous=NORMAL")
+            self._local.conexao = conexao
+        return conexao
+
+    def _contar(self, contador):
+        with self._contadores:
+            setattr(self, contador, getattr(self, contador) + 1)
+
+    def get(self, baixar, url, revalidar=True, **kwargs):
+        """
+        GET com cache: serve do disco, revalida ou baixa, conforme o caso.
+
+        Args:
+            baixar (callable): baixar(url, **kwargs) faz o GET quando é preciso ir à rede
+            url (str): URL da página
+            revalidar (bool): Se True, sempre consulta o servidor (requisição
+                condicional), mesmo com a entrada dentro da validade; use
+                False só quando importa o conteúdo, não a disponibilidade
+
+        Returns:
+            requests.Response: Resposta (com `from_cache=True` se veio do disco)
+        """
+        entrada = self._conexao().execute(
+            "SELECT url_final, cabecalhos, encoding, corpo, expira_em FROM respostas WHERE url = ?",
+            (url,)
+        ).fetchone()
+
+        if entrada is not None and not revalidar and entrada[4] > time.time():
+            self._contar('acertos')
+            return self._montar_resposta(entrada)
+
+        if entrada is not None:
+            cabecalhos = json.loads(entrada[1])
+            condicionais = {}
+            if cabecalhos.get('ETag'):
+                condicionais['If-None-Match'] = cabecalhos['ETag']
+            if cabecalhos.get('Last-Modified'):
+                condicionais['If-Modified-Since'] = cabecalhos['Last-Modified']
+            if condicionais:
+                kwargs['headers'] = {**(kwargs.get('headers') or {}), **condicionais}
+
+        response = baixar(url, **kwargs)
+
+        if response.status_code == 304 and entrada is not None:
+            self._contar('revalidados')
+            cabecalhos = json.loads(entrada[1])
+            cabecalhos.update({k: v for k, v in response.headers.items() if k in CABECALHOS_GUARDADOS})
+            expira_em = time.time() + validade_segundos(response, self.frescor_segundos)
+            conexao = self._conexao()
+            with conexao:
+                conexao.execute(
+                    "UPDATE respostas SET cabecalhos = ?, armazenado_em = ?, expira_em = ? WHERE url = ?",
+                    (json.dumps(cabecalhos), time.time(), expira_em, url)
+                )
+            return self._montar_resposta((entrada[0], json.dumps(cabecalhos), entrada[2], entrada[3], expira_em))
+
+        self._contar('baixados')
+        if response.status_code == 200:
+            self._guardar(url, response)
+        return response
+
+    def _guardar(self, url, response):
+        diretivas = diretivas_cache(response)
+        if 'no-store' in diretivas or response.headers.get('Vary', '').strip() == '*':
+            return
+        corpo = response.content
+        if len(corpo) > self.tamanho_maximo:
+            return
+        cabecalhos = {k: v for k, v in response.headers.items() if k in CABECALHOS_GUARDADOS}
+        agora = time.time()
+        conexao = self._conexao()
+        with conexao:
+            conexao.execute(
+                "INSERT OR REPLACE INTO respostas "
+                "(url, url_final, cabecalhos, encoding, corpo, armazenado_em, expira_em) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (url, response.url, json.dumps(cabecalhos), response.encoding,
+                 zlib.compress(corpo), agora, agora + validade_segundos(response, self.frescor_segundos))
+            )
+
+    def _montar_resposta(self, entrada):
+        url_final, cabecalhos, encoding, corpo, _ = entrada
+        response = requests.Response()
+        response.status_code = 200
+        response.reason = 'OK'
+        response.url = url_final
+        response.headers = CaseInsensitiveDict(json.loads(cabecalhos))
+        response.encoding = encoding
+        response._content = zlib.decompress(corpo)
+        response.from_cache = True
+        return response
+
+    def estatisticas(self):
+        """Respostas servidas do disco, revalidadas (304) e baixadas por completo."""
+        with self._contadores:
+            consultas = self.acertos + self.revalidados + self.baixados
+            return {
+                "acertos": self.acertos,
+                "revalidados": self.revalidados,
+                "baixados": self.baixados,
+                "taxa_reaproveitamento": round((self.acertos + self.revalidados) / consultas, 4) if consultas else 0.0
+            }
+
+    def remover_antigos(self):
+        """Apaga as respostas sem uso há mais que o prazo de retenção."""
+        limite = time.time() - self.retencao_dias * 86400
+        conexao = self._conexao()
+        with conexao:
+            return conexao.execute("DELETE FROM respostas WHERE armazenado_em < ?", (limite,)).rowcount
@@ -0,0 +1,102 @@
+# http_client.py
+import threading
+
+import requests
+from requests.adapters import HTTPAdapter
+
+import config
+from agendador_hosts import agendador
+from http_cache import CacheHTTP
+
+# Cabeçalhos aplicados a todas as requisições
+HEADERS_PADRAO = {
+    'User-Agent': config.HTTP_USER_AGENT,
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+    'Accept-Language': 'pt-BR,pt;q=0.9,en-US;q=0.8,en;q=0.7',
+}
+
+_sessao = None
+_cache = None
+_lock = threading.Lock()
+
+def criar_sessao(pool_connections=None, pool_maxsize=None, headers=None):
+    """
+    Cria uma sessão HTTP com pool de conexões keep-alive por host.
+
+    As conexões (e as sessões TLS) são reaproveitadas entre requisições ao
+    mesmo host, evitando um novo handshake a cada download. Com
+    HTTP_POOL_BLOCK, pool_maxsize também é o máximo de requisições
+    simultâneas a um mesmo host quando a avaliação roda em paralelo.
+
+    Args:
+        pool_connections (int): Quantidade de hosts com pool mantido
+        pool_maxsize (int): Conexões reaproveitáveis por host
+        headers (dict): Cabeçalhos padrão (padrão: HEADERS_PADRAO)
+
+    Returns:
+        requests.Session: Sessão configurada
+    """
+    adapter = HTTPAdapter(
+        pool_connections=pool_connections or config.HTTP_POOL_CONNECTIONS,
+        pool_maxsize=pool_maxsize or config.HTTP_POOL_MAXSIZE,
+        pool_block=config.HTTP_POOL_BLOCK
+    )
+    sessao = requests.Session()
+    sessao.mount('http://', adapter)
+    sessao.mount('https://', adapter)
+    sessao.headers.update(headers or HEADERS_PADRAO)
+    return sessao
+
+def obter_sessao():
+    """Retorna a sessão compartilhada, criando-a no primeiro uso."""
+    global _sessao
+    if _sessao is None:
+        with _lock:
+            if _sessao is None:
+                _sessao = criar_sessao()
+    return _sessao
+
+def configurar(pool_connections=None, pool_maxsize=None, headers=None):
+    """Substitui a sessão compartilhada por uma nova com os parâmetros informados."""
+    global _sessao
+    nova = criar_sessao(pool_connections, pool_maxsize, headers)
+    with _lock:
+        antiga, _sessao = _sessao, nova
+    if antiga is not None:
+        antiga.close()
+
+def obter_cache():
+    """Retorna o cache HTTP compartilhado (None se desativado em config.HTTP_CACHE_ATIVO)."""
+    global _cache
+    if _cache is None and config.HTTP_CACHE_ATIVO:
+        with _lock:
+            if _cache is None:
+                _cache = CacheHTTP(config.HTTP_CACHE_ARQUIVO)
+    return _cache
+
+def get(url, usar_cache=True, revalidar=True, **kwargs):
+    """
+    GET pela sessão compartilhada. Cabeçalhos extras são somados aos padrão.
+
+    Passa pelo cache HTTP (com revalidação condicional), exceto com
+    usar_cache=False ou em requisições com params/stream. Só as idas à rede
+    passam pelo agendador de hosts. Com revalidar=False, uma página dentro da
+    validade é servida do disco sem acessar a rede (e portanto sem confirmar
+    que o site continua no ar).
+    """
+    kwargs.setdefault('timeout', config.HTTP_TIMEOUT)
+    cache = obter_cache() if usar_cache and not kwargs.get('params') and not kwargs.get('stream') else None
+    if cache is None:
+        return _requisitar('get', url, **kwargs)
+    return cache.get(lambda u, **kw: _requisitar('get', u, **kw), url, revalidar=revalidar, **kwargs)
+
+def head(url, **kwargs):
+    """HEAD pela sessão compartilhada. Cabeçalhos extras são somados aos padrão."""
+    kwargs.setdefault('timeout', config.HTTP_TIMEOUT)
+    return _requisitar('head', url, **kwargs)
+
+def _requisitar(metodo, url, **kwargs):
+    """Faz a requisição respeitando os limites de taxa e concorrência do host."""
+    with agendador.reservar(url):
+        # get()/head() da sessão, que mantêm o padrão de allow_redirects de cada método
+        return getattr(obter_sessao(), metodo)(url, **kwargs)
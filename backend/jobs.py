@@ -0,0 +1,159 @@
+# jobs.py
+import threading
+import uuid
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+
+import config
+
+class Job:
+    """
+    Uma avaliação submetida ao servidor.
+
+    Cada job tem seu próprio registro de eventos e seu próprio sinal de
+    cancelamento, de modo que várias avaliações podem correr ao mesmo tempo
+    sem interferir umas nas outras. Os eventos são numerados e os mais
+    recentes ficam guardados: ler um evento não o remove, e um stream SSE que
+    reconecta retoma a partir do último id recebido.
+    """
+
+    def __init__(self, orgao, total_perguntas=0):
+        self.id = uuid.uuid4().hex
+        self.orgao = orgao
+        self.total_perguntas = total_perguntas
+        self.status = 'na_fila'  # na_fila, em_andamento, concluido, cancelado, erro
+        self.criado_em = datetime.now()
+        self.finalizado_em = None
+        self.eventos = deque(maxlen=config.SSE_REPLAY_MAXIMO)  # (id, evento) mais recentes
+        self.ultimo_id = 0
+        self._novos_eventos = threading.Condition()
+        self._cancelamento = threading.Event()
+
+    @property
+    def cancelado(self):
+        return self._cancelamento.is_set()
+
+    @property
+    def ativo(self):
+        return self.status in ('na_fila', 'em_andamento')
+
+    def cancelar(self):
+        """Sinaliza o cancelamento; a avaliação para na próxima verificação."""
+        self._cancelamento.set()
+
+    def publicar(self, evento):
+        """Numera o evento e o envia para os streams do job."""
+        with self._novos_eventos:
+            self.ultimo_id += 1
+            self.eventos.append((self.ultimo_id, evento))
+            self._novos_eventos.notify_all()
+
+    def eventos_desde(self, ultimo_id, timeout=None):
+        """
+        Eventos publicados depois de `ultimo_id` que ainda estão guardados.
+
+        Args:
+            ultimo_id (int): Id do último evento recebido (0 = desde o início)
+            timeout (float): Se não houver eventos novos, espera até este tempo
+
+        Returns:
+            list: Tuplas (id, evento), em ordem
+        """
+        with self._novos_eventos:
+            if timeout and self.ultimo_id <= ultimo_id:
+                self._novos_eventos.wait(timeout)
+            if self.ultimo_id <= ultimo_id:
+                return []
+            # Os ids são consecutivos: a posição do próximo evento é calculada
+            primeiro_id = self.eventos[0][0]
+            inicio = max(0, ultimo_id + 1 - primeiro_id)
+            return list(self.eventos)[inicio:]
+
+    def resumo(self):
+        return {
+            "jobId": self.id,
+            "orgao": self.orgao,
+            "status": self.status,
+            "totalPerguntas": self.total_perguntas,
+            "criadoEm": self.criado_em.isoformat(),
+            "finalizadoEm": self.finalizado_em.isoformat() if self.finalizado_em else None
+        }
+
+class JobRegistry:
+    """
+    Registro dos jobs de avaliação do processo.
+
+    No máximo `max_jobs` avaliações executam ao mesmo tempo; as demais
+    aguardam na fila do executor. Jobs finalizados são mantidos por
+    `retencao_minutos` para que o cliente ainda possa ler seus eventos.
+    """
+
+    def __init__(self, max_jobs=None, retencao_minutos=None):
+        self.max_jobs = max_jobs or config.MAX_JOBS_SIMULTANEOS
+        self.retencao = timedelta(minutes=retencao_minutos or config.JOB_RETENCAO_MINUTOS)
+        self._executor = ThreadPoolExecutor(max_workers=self.max_jobs, thread_name_prefix='avaliacao')
+        self._jobs = {}
+        self._lock = threading.Lock()
+
+    def criar(self, orgao, alvo, *args, total_perguntas=0):
+        """
+        Registra um job e agenda sua execução.
+
+        Args:
+            orgao (str): Nome do órgão avaliado
+            alvo (callable): Função executada como alvo(job, *args)
+            total_perguntas (int): Total de perguntas, para cálculo de progresso
+
+        Returns:
+            Job: Job criado
+        """
+        self._remover_expirados()
+        job = Job(orgao, total_perguntas)
+        with self._lock:
+            em_execucao = sum(1 for j in self._jobs.values() if j.ativo)
+            self._jobs[job.id] = job
+        if em_execucao >= self.max_jobs:
+            job.publicar({
+                "type": "status",
+                "message": "Aguardando outras avaliações terminarem...",
+                "progress": 0
+            })
+        self._executor.submit(self._executar, job, alvo, args)
+        return job
+
+    def _executar(self, job, alvo, args):
+        if job.cancelado:
+            # Cancelado enquanto aguardava na fila: apenas encerra o stream
+            job.status = 'cancelado'
+            job.finalizado_em = datetime.now()
+            job.publicar({"type": "complete"})
+            return
+
+        job.status = 'em_andamento'
+        try:
+            alvo(job, *args)
+        except Exception as e:
+            print(f"Erro no job {job.id}: {e}")
+            job.status = 'erro'
+        if job.status == 'em_andamento':
+            job.status = 'cancelado' if job.cancelado else 'concluido'
+        job.finalizado_em = datetime.now()
+
+    def obter(self, job_id):
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def listar(self):
+        with self._lock:
+            return list(self._jobs.values())
+
+    def _remover_expirados(self):
+        limite = datetime.now() - self.retencao
+        with self._lock:
+            expirados = [
+                job_id for job_id, job in self._jobs.items()
+                if job.finalizado_em and job.finalizado_em < limite
+            ]
+            for job_id in expirados:
+                del self._jobs[job_id]
@@ -1,5 +1,6 @@
 # known_urls.py (versão atualizada)
 from amazonas_portals import get_amazonas_url
+from resolvedor_orgaos import obter_resolvedor
 
 # Dicionário de URLs conhecidas para órgãos importantes
 KNOWN_URLS = {
@@ -68,8 +69,21 @@ def get_known_url(orgao, tipo="site_oficial"):
         return url_from_sheet
     
     # 3. Se for uma câmara municipal, tentar buscar o site da câmara
-    if "câmara" in orgao_norm or "camara" in orgao_norm:
-        return get_amazonas_url(orgao, 'site_camara')
+    camara = "câmara" in orgao_norm or "camara" in orgao_norm
+    if camara:
+        url_camara = get_amazonas_url(orgao, 'site_camara')
+        if url_camara:
+            return url_camara
+    
+    # 4. Nome com erro de digitação ou grafia diferente: correspondência
+    # aproximada com os nomes de todas as fontes
+    # (só entre os cadastros que têm a URL procurada: uma câmara não pode
+    # ficar com o cadastro da prefeitura de mesmo nome)
+    tipo_url = 'site_camara' if camara else tipo
+    correspondencia = obter_resolvedor().resolver(orgao, aceitar=lambda dados: dados.get(tipo_url))
+    if correspondencia:
+        print(f"'{orgao}' resolvido como '{correspondencia.nome}' ({correspondencia.fonte}, score {correspondencia.score:.2f})")
+        return correspondencia.dados[tipo_url]
     
     # Não encontrou em nenhuma fonte
     return None
\ No newline at end of file
@@ -2,20 +2,19 @@
 import time
 import re
 import random
-from selenium import webdriver
+from urllib.parse import quote_plus, unquote
 from selenium.webdriver.common.by import By
-from selenium.webdriver.common.keys import Keys
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
+from selenium.common.exceptions import TimeoutException
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from webdriver_manager.chrome import ChromeDriverManager
-import requests
+import config
+import driver_pool
+import http_client
+from agendador_hosts import agendador
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 from models import Base, Orgao, Link, TipoLink
-import os
-import undetected_chromedriver as uc  # Precisará instalar: pip install undetected-chromedriver
+from resolvedor_orgaos import ResolvedorOrgaos
 
 class LinkFinder:
     def __init__(self, db_path='sqlite:///transparencia.db', headless=True, use_undetected=True):
@@ -31,10 +30,13 @@ class LinkFinder:
         Base.metadata.create_all(self.engine)
         self.Session = sessionmaker(bind=self.engine)
         
-        # Configurar o Chrome
+        # Drivers do Chrome emprestados do pool compartilhado
         self.headless = headless
         self.use_undetected = use_undetected
-        self.setup_driver()
+        self.pool = driver_pool.obter_pool(headless, use_undetected)
+        
+        # Índice aproximado dos nomes de órgãos do banco (montado no primeiro uso)
+        self.resolvedor_banco = None
         
         # Padrões de URL para identificar portais de transparência
         self.patterns = [
@@ -44,89 +46,17 @@ class LinkFinder:
             r'portal.*transparencia',
             r'transparencia\..*\.org\.br'
         ]
-        
-        # User agents para rotação
-        self.user_agents = [
-            'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
-            'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/92.0.4515.107 Safari/537.36',
-            'Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:90.0) Gecko/20100101 Firefox/90.0',
-            'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/14.1.1 Safari/605.1.15',
-            'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36 Edg/91.0.864.59'
-        ]
-    
-    def setup_driver(self):
-        """Configura o driver do Selenium."""
-        if self.use_undetected:
-            # Usar undetected_chromedriver para evitar detecção
-            options = uc.ChromeOptions()
-            if self.headless:
-                options.add_argument('--headless')
-            
-            options.add_argument('--no-sandbox')
-            options.add_argument('--disable-dev-shm-usage')
-            options.add_argument('--disable-gpu')
-            options.add_argument('--window-size=1920,1080')
-            options.add_argument('--disable-notifications')
-            
-            # Adicionar argumentos para parecer mais humano
-            options.add_argument('--disable-blink-features=AutomationControlled')
-            
-            # Pasta de perfil persistente para manter cookies
-            profile_path = os.path.join(os.getcwd(), 'chrome_profile')
-            if not os.path.exists(profile_path):
-                os.makedirs(profile_path)
-            options.add_argument(f'--user-data-dir={profile_path}')
-            
-            # Inicializar o driver
-            self.driver = uc.Chrome(options=options)
-        else:
-            # Configuração padrão com Selenium
-            options = Options()
-            if self.headless:
-                options.add_argument('--headless')
-            
-            options.add_argument('--no-sandbox')
-            options.add_argument('--disable-dev-shm-usage')
-            options.add_argument('--disable-gpu')
-            options.add_argument('--window-size=1920,1080')
-            options.add_argument('--disable-notifications')
-            options.add_argument('--disable-extensions')
-            options.add_argument('--disable-infobars')
-            
-            # Adicionar argumentos para parecer mais humano
-            options.add_argument('--disable-blink-features=AutomationControlled')
-            options.add_experimental_option('excludeSwitches', ['enable-automation'])
-            options.add_experimental_option('useAutomationExtension', False)
-            
-            # Escolher um user agent aleatório
-            user_agent = random.choice(self.user_agents)
-            options.add_argument(f'--user-agent={user_agent}')
-            
-            # Pasta de perfil persistente para manter cookies
-            profile_path = os.path.join(os.getcwd(), 'chrome_profile')
-            if not os.path.exists(profile_path):
-                os.makedirs(profile_path)
-            options.add_argument(f'--user-data-dir={profile_path}')
-            
-            # Inicializar o driver
-            self.driver = webdriver.Chrome(
-                service=Service(ChromeDriverManager().install()),
-                options=options
-            )
-            
-            # Modificar o navigator.webdriver para evitar detecção
-            self.driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
     
-    def simular_comportamento_humano(self):
+    def simular_comportamento_humano(self, driver):
         """Simula comportamento humano para evitar detecção."""
         # Rolar a página aleatoriamente
         for _ in range(random.randint(1, 3)):
             scroll_amount = random.randint(300, 700)
-            self.driver.execute_script(f"window.scrollBy(0, {scroll_amount})")
+            driver.execute_script(f"window.scrollBy(0, {scroll_amount})")
             time.sleep(random.uniform(0.5, 1.5))
         
         # Rolar de volta para o topo
-        self.driver.execute_script("window.scrollTo(0, 0)")
+        driver.execute_script("window.scrollTo(0, 0)")
         time.sleep(random.uniform(0.5, 1.0))
     
     def buscar_no_banco(self, nome_orgao, tipo_link='portal_transparencia'):
@@ -150,12 +80,24 @@ class LinkFinder:
         
         # Buscar órgão e link
         orgao = session.query(Orgao).filter(Orgao.nome.like(f'%{nome_orgao}%')).first()
-        if not orgao:
+        orgao_id = orgao.id if orgao else None
+        
+        # Nome com grafia diferente da cadastrada: correspondência aproximada
+        if orgao_id is None:
+            if self.resolvedor_banco is None:
+                self.resolvedor_banco = ResolvedorOrgaos()
+                for id_orgao, nome in session.query(Orgao.id, Orgao.nome):
+                    self.resolvedor_banco.adicionar(nome, {'orgao_id': id_orgao}, 'banco')
+            correspondencia = self.resolvedor_banco.resolver(nome_orgao)
+            if correspondencia:
+                orgao_id = correspondencia.dados['orgao_id']
+        
+        if orgao_id is None:
             session.close()
             return None
         
         link = session.query(Link).filter(
-            Link.orgao_id == orgao.id,
+            Link.orgao_id == orgao_id,
             Link.tipo_id == tipo.id,
             Link.ativo == True
         ).first()
@@ -166,9 +108,77 @@ class LinkFinder:
             return link.url
         return None
     
+    def filtrar_urls(self, urls_brutas, tipo_busca, dominio_buscador):
+        """Mantém apenas as URLs compatíveis com o tipo de busca."""
+        urls = []
+        for url in urls_brutas:
+            if not url or dominio_buscador in url:
+                continue
+            if tipo_busca == 'portal transparência':
+                # Verificar se é um portal de transparência
+                for pattern in self.patterns:
+                    if re.search(pattern, url, re.IGNORECASE):
+                        urls.append(url)
+                        break
+            else:
+                # Para outros tipos, apenas verificar se é do domínio gov.br ou leg.br
+                if '.gov.br' in url or '.leg.br' in url:
+                    urls.append(url)
+        return urls
+    
+    def extrair_links(self, driver, seletor, limite=5):
+        """Lê o href dos primeiros resultados da página atual."""
+        urls = []
+        for result in driver.find_elements(By.CSS_SELECTOR, seletor)[:limite]:
+            try:
+                href = result.get_attribute('href')
+            except Exception:
+                continue
+            # O DuckDuckGo usa redirecionamento, extrair a URL real
+            match = re.search(r'uddg=([^&]+)', href or '')
+            urls.append(unquote(match.group(1)) if match else href)
+        return urls
+    
+    def buscar_resultados(self, driver, consulta, url_busca, seletor, url_inicial, id_caixa):
+        """
+        Abre diretamente a página de resultados do buscador (`url_busca` tem
+        "{}" no lugar da consulta). Se ela for bloqueada e
+        config.SELENIUM_DIGITACAO_FALLBACK estiver ativo, repete a busca
+        digitando a consulta na página inicial, como um humano.
+        
+        Returns:
+            bool: True se a página de resultados carregou
+        """
+        with agendador.reservar(url_busca):
+            driver.get(url_busca.format(quote_plus(consulta)))
+        try:
+            WebDriverWait(driver, 10).until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, seletor))
+            )
+            return True
+        except TimeoutException:
+            if not config.SELENIUM_DIGITACAO_FALLBACK:
+                return False
+        
+        print(f"Busca direta bloqueada, digitando a consulta em {url_inicial}...")
+        with agendador.reservar(url_inicial):
+            driver.get(url_inicial)
+        search_box = WebDriverWait(driver, 10).until(
+            EC.presence_of_element_located((By.ID, id_caixa))
+        )
+        driver_pool.digitar_como_humano(search_box, consulta)
+        try:
+            WebDriverWait(driver, 10).until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, seletor))
+            )
+        except TimeoutException:
+            return False
+        self.simular_comportamento_humano(driver)
+        return True
+    
     def buscar_no_google(self, nome_orgao, tipo_busca='portal transparência'):
         """
-        Busca um link usando o Selenium para acessar o Google.
+        Busca um link usando o Selenium (DuckDuckGo e, como alternativa, Bing).
         
         Args:
             nome_orgao (str): Nome do órgão
@@ -178,102 +188,22 @@ class LinkFinder:
             list: Lista de URLs encontradas
         """
         urls = []
+        query = f"{nome_orgao} {tipo_busca}"
         
         try:
-            # Usar DuckDuckGo em vez do Google para evitar captcha
-            # O DuckDuckGo é menos propenso a bloquear automação
-            self.driver.get('https://duckduckgo.com/')
-            
-            # Esperar um tempo aleatório para parecer humano
-            time.sleep(random.uniform(1.0, 3.0))
-            
-            # Realizar a busca
-            query = f"{nome_orgao} {tipo_busca}"
-            search_box = WebDriverWait(self.driver, 10).until(
-                EC.presence_of_element_located((By.ID, 'search_form_input_homepage'))
-            )
-            
-            # Digitar lentamente como um humano
-            for char in query:
-                search_box.send_keys(char)
-                time.sleep(random.uniform(0.05, 0.15))
-            
-            time.sleep(random.uniform(0.5, 1.0))
-            search_box.send_keys(Keys.RETURN)
-            
-            # Esperar pelos resultados
-            WebDriverWait(self.driver, 10).until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, '.result__body'))
-            )
-            
-            # Simular comportamento humano
-            self.simular_comportamento_humano()
-            
-            # Extrair os links dos resultados
-            results = self.driver.find_elements(By.CSS_SELECTOR, '.result__a')
-            
-            for result in results[:5]:  # Pegar os primeiros 5 resultados
-                try:
-                    url = result.get_attribute('href')
-                    if url and 'duckduckgo.com' not in url:
-                        # Verificar se é um portal de transparência
-                        if tipo_busca == 'portal transparência':
-                            for pattern in self.patterns:
-                                if re.search(pattern, url, re.IGNORECASE):
-                                    urls.append(url)
-                                    break
-                        else:
-                            # Para outros tipos, apenas verificar se é do domínio gov.br ou leg.br
-                            if '.gov.br' in url or '.leg.br' in url:
-                                urls.append(url)
-                except:
-                    continue
-            
-            # Se não encontrou resultados no DuckDuckGo, tentar Bing como fallback
-            if not urls:
-                print("Tentando busca no Bing...")
-                self.driver.get('https://www.bing.com/')
-                
-                time.sleep(random.uniform(1.0, 3.0))
-                
-                search_box = WebDriverWait(self.driver, 10).until(
-                    EC.presence_of_element_located((By.ID, 'sb_form_q'))
-                )
+            with self.pool.driver() as driver:
+                # Usar DuckDuckGo em vez do Google para evitar captcha
+                # O DuckDuckGo é menos propenso a bloquear automação
+                if self.buscar_resultados(driver, query, 'https://html.duckduckgo.com/html/?q={}',
+                                          '.result__a', 'https://duckduckgo.com/', 'search_form_input_homepage'):
+                    urls = self.filtrar_urls(self.extrair_links(driver, '.result__a'), tipo_busca, 'duckduckgo.com')
                 
-                # Digitar lentamente
-                search_box.clear()
-                for char in query:
-                    search_box.send_keys(char)
-                    time.sleep(random.uniform(0.05, 0.15))
-                
-                time.sleep(random.uniform(0.5, 1.0))
-                search_box.send_keys(Keys.RETURN)
-                
-                # Esperar pelos resultados
-                WebDriverWait(self.driver, 10).until(
-                    EC.presence_of_element_located((By.ID, 'b_results'))
-                )
-                
-                # Simular comportamento humano
-                self.simular_comportamento_humano()
-                
-                # Extrair os links
-                results = self.driver.find_elements(By.CSS_SELECTOR, '#b_results h2 a')
-                
-                for result in results[:5]:
-                    try:
-                        url = result.get_attribute('href')
-                        if url and 'bing.com' not in url:
-                            if tipo_busca == 'portal transparência':
-                                for pattern in self.patterns:
-                                    if re.search(pattern, url, re.IGNORECASE):
-                                        urls.append(url)
-                                        break
-                            else:
-                                if '.gov.br' in url or '.leg.br' in url:
-                                    urls.append(url)
-                    except:
-                        continue
+                # Se não encontrou resultados no DuckDuckGo, tentar Bing como fallback
+                if not urls:
+                    print("Tentando busca no Bing...")
+                    if self.buscar_resultados(driver, query, 'https://www.bing.com/search?q={}',
+                                              '#b_results h2 a', 'https://www.bing.com/', 'sb_form_q'):
+                        urls = self.filtrar_urls(self.extrair_links(driver, '#b_results h2 a'), tipo_busca, 'bing.com')
             
             # Remover duplicatas
             urls = list(dict.fromkeys(urls))
@@ -294,11 +224,11 @@ class LinkFinder:
             bool: True se o link estiver funcionando
         """
         try:
-            response = requests.head(url, timeout=10)
+            response = http_client.head(url, timeout=10)
             return response.status_code < 400
         except:
             try:
-                response = requests.get(url, timeout=10)
+                response = http_client.get(url, timeout=10)
                 return response.status_code < 400
             except:
                 return False
@@ -401,6 +331,8 @@ class LinkFinder:
             orgao = Orgao(nome=nome_orgao, uf='AM', tipo_id=1)  # tipo_id=1 assume que é município
             session.add(orgao)
             session.flush()
+            if self.resolvedor_banco is not None:
+                self.resolvedor_banco.adicionar(nome_orgao, {'orgao_id': orgao.id}, 'banco')
         
         # Verificar se já existe este link
         link_existente = session.query(Link).filter(
@@ -428,6 +360,10 @@ class LinkFinder:
         session.close()
     
     def fechar(self):
-        """Fecha o driver do Selenium."""
-        if hasattr(self, 'driver'):
-            self.driver.quit()
\ No newline at end of file
+        """
+        Encerra os drivers ociosos do pool usado pelo buscador e as conexões do
+        banco. Drivers em uso por outras buscas continuam abertos, e o pool
+        abre outros se voltar a ser usado.
+        """
+        self.pool.esvaziar()
+        self.engine.dispose()
\ No newline at end of file
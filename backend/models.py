@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Boolean, ForeignKey, create_engine
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, Text, ForeignKey, Index, create_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship, sessionmaker
 
@@ -52,5 +52,49 @@ class Link(Base):
     def __repr__(self):
         return f"<Link(url='{self.url}')>"
 
+class Avaliacao(Base):
+    __tablename__ = 'avaliacoes'
+    
+    id = Column(Integer, primary_key=True)
+    job_id = Column(String(32), index=True)  # Identificador do job que executou a avaliação
+    orgao = Column(String(200), nullable=False)
+    tipo_orgao = Column(String(50))  # Matriz aplicada (executivo, legislativo, ...)
+    status = Column(String(20), nullable=False)  # em_andamento, concluido, cancelado, erro
+    total_perguntas = Column(Integer)
+    iniciada_em = Column(DateTime, nullable=False)
+    finalizada_em = Column(DateTime)
+    
+    resultados = relationship("ResultadoCriterio", back_populates="avaliacao")
+    
+    def __repr__(self):
+        return f"<Avaliacao(orgao='{self.orgao}', status='{self.status}')>"
+
+class ResultadoCriterio(Base):
+    __tablename__ = 'resultados_criterio'
+    
+    id = Column(Integer, primary_key=True)
+    avaliacao_id = Column(Integer, ForeignKey('avaliacoes.id'), nullable=False)
+    # Órgão e data repetidos da avaliação para que o histórico seja
+    # consultado pelo índice sem junção
+    orgao = Column(String(200), nullable=False)
+    criterio = Column(String(20), nullable=False)  # ID do item da matriz (ex: 3.1)
+    data = Column(DateTime, nullable=False)
+    disponibilidade = Column(Boolean)
+    atualidade = Column(Boolean)
+    serie_historica = Column(Boolean)
+    gravacao_relatorios = Column(Boolean)
+    filtro_pesquisa = Column(Boolean)
+    link_evidencia = Column(String(500))
+    observacao = Column(Text)
+    
+    avaliacao = relationship("Avaliacao", back_populates="resultados")
+    
+    __table_args__ = (
+        Index('idx_resultados_orgao_criterio_data', 'orgao', 'criterio', 'data'),
+    )
+    
+    def __repr__(self):
+        return f"<ResultadoCriterio(orgao='{self.orgao}', criterio='{self.criterio}')>"
+
 # Adicionar relacionamentos reversos
 TipoOrgao.orgaos = relationship("Orgao", back_populates="tipo")
\ No newline at end of file
@@ -0,0 +1,195 @@
+# page_store.py
+import hashlib
+import re
+import threading
+from urllib.parse import urlsplit, urlunsplit
+
+from bs4 import BeautifulSoup
+
+import http_client
+from documento import Documento
+from single_flight import SingleFlight
+from texto import normalize
+
+# Trechos que mudam a cada acesso sem mudar o conteúdo (scripts, tokens em
+# campos ocultos, comentários) e ficam fora da impressão digital da página
+VOLATEIS_RE = re.compile(rb'<script\b.*?</script>|<input\b[^>]*type=["\']?hidden[^>]*>|<!--.*?-->', re.S | re.I)
+
+# Downloads em andamento em todos os PageStores do processo: avaliações
+# simultâneas que pedem a mesma URL compartilham um único download
+downloads_em_andamento = SingleFlight()
+
+def canonicalizar_url(url):
+    """
+    Normaliza uma URL para uso como chave do armazenamento de páginas.
+
+    Esquema e host ficam em minúsculas, o fragmento é descartado e o
+    caminho vazio vira '/'. URLs sem esquema são mantidas como estão.
+    """
+    url = url.strip()
+    if not url.startswith(('http://', 'https://')):
+        return url
+    partes = urlsplit(url)
+    return urlunsplit((
+        partes.scheme.lower(),
+        partes.netloc.lower(),
+        partes.path or '/',
+        partes.query,
+        ''
+    ))
+
+class Pagina:
+    """
+    Uma página baixada durante a avaliação.
+
+    Guarda a resposta HTTP (ou o erro do download) e calcula sob demanda,
+    uma única vez, o texto decodificado, o DOM, o Documento e o texto normalizado.
+    """
+
+    def __init__(self, url, response=None, erro=None):
+        self.url = url
+        self.response = response
+        self.erro = erro
+        self._text = None
+        self._soup = None
+        self._documento = None
+        self._impressao_digital = None
+        self._texto_normalizado = None
+        self._corpo_normalizado = None
+        self._lock = threading.Lock()
+
+    @property
+    def status_code(self):
+        return self.response.status_code if self.response is not None else None
+
+    @property
+    def disponivel(self):
+        """True se a página respondeu com status 200."""
+        return self.status_code == 200
+
+    @property
+    def ok(self):
+        """True se a página respondeu sem erro HTTP (status < 400)."""
+        return self.response is not None and self.response.ok
+
+    @property
+    def text(self):
+        """Conteúdo decodificado da resposta ("" se o download falhou)."""
+        if self.response is None:
+            return ""
+        if self._text is None:
+            self._text = self.response.text
+        return self._text
+
+    @property
+    def impressao_digital(self):
+        """
+        Hash do status e do conteúdo da página (sem scripts, campos ocultos e
+        comentários). Muda quando a página muda; calculado sem interpretar o HTML.
+        """
+        if self.response is None:
+            return f"erro:{type(self.erro).__name__}"
+        if self._impressao_digital is None:
+            conteudo = VOLATEIS_RE.sub(b'', self.response.content)
+            self._impressao_digital = f"{self.status_code}:{hashlib.sha256(conteudo).hexdigest()}"
+        return self._impressao_digital
+
+    @property
+    def soup(self):
+        """DOM da página. Relança o erro do download, se houve."""
+        if self.response is None:
+            raise self.erro
+        if self._soup is None:
+            with self._lock:
+                if self._soup is None:
+                    self._soup = BeautifulSoup(self.text, 'html.parser')
+        return self._soup
+
+    @property
+    def documento(self):
+        """Documento pré-processado para as verificações dos critérios."""
+        if self._documento is None:
+            soup = self.soup
+            with self._lock:
+                if self._documento is None:
+                    self._documento = Documento(soup)
+        return self._documento
+
+    @property
+    def texto_normalizado(self):
+        """Texto completo da página, sem acentos e em minúsculas."""
+        if self._texto_normalizado is None:
+            self._texto_normalizado = normalize(self.soup.get_text())
+        return self._texto_normalizado
+
+    @property
+    def corpo_normalizado(self):
+        """Texto do <body> da página, sem acentos e em minúsculas."""
+        if self._corpo_normalizado is None:
+            soup = self.soup
+            self._corpo_normalizado = normalize(soup.body.get_text() if soup.body else "")
+        return self._corpo_normalizado
+
+class PageStore:
+    """
+    Armazenamento de páginas de uma avaliação, indexado pela URL canônica.
+
+    Cada URL é baixada e interpretada no máximo uma vez, mesmo quando várias
+    verificações (ou várias threads) pedem a mesma página. Falhas de download
+    também ficam registradas, para não repetir tentativas em sites fora do ar.
+    """
+
+    def __init__(self, timeout=15, headers=None):
+        """
+        Args:
+            timeout (int): Timeout, em segundos, de cada download
+            headers (dict): Cabeçalhos somados aos padrão do http_client
+        """
+        self.timeout = timeout
+        self.headers = headers
+        self._paginas = {}
+        self._locks = {}
+        self._lock = threading.Lock()
+
+    def obter(self, url):
+        """
+        Retorna a página da URL, baixando-a apenas na primeira solicitação.
+
+        Args:
+            url (str): URL da página
+
+        Returns:
+            Pagina: Página baixada (ou com o erro do download)
+        """
+        chave = canonicalizar_url(url)
+        with self._lock:
+            pagina = self._paginas.get(chave)
+            if pagina is not None:
+                return pagina
+            lock_url = self._locks.setdefault(chave, threading.Lock())
+
+        with lock_url:
+            pagina = self._paginas.get(chave)
+            if pagina is None:
+                pagina = downloads_em_andamento.executar(
+                    (chave, self.timeout), self._baixar, url
+                )
+                with self._lock:
+                    self._paginas[chave] = pagina
+        return pagina
+
+    def _baixar(self, url):
+        try:
+            response = http_client.get(url, timeout=self.timeout, headers=self.headers)
+            return Pagina(url, response=response)
+        except Exception as e:
+            # Não só erros de rede: o cache HTTP (SQLite) ou a decodificação
+            # também podem falhar, e isso vale como página indisponível
+            print(f"Erro ao acessar {url}: {e}")
+            return Pagina(url, erro=e)
+
+    def __contains__(self, url):
+        return canonicalizar_url(url) in self._paginas
+
+    def __len__(self):
+        return len(self._paginas)
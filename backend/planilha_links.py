@@ -0,0 +1,109 @@
+# planilha_links.py
+import os
+import threading
+import time
+
+import pandas as pd
+
+import config
+
+COLUNAS = ['sigla_UG', 'ID_criterio', 'link']
+
+class PlanilhaLinks:
+    """
+    Links da planilha lista_criterios.csv (sigla_UG;ID_criterio;link),
+    indexados por (UG normalizada, ID do critério).
+
+    A planilha é recompilada quando o mtime do arquivo muda, de modo que os
+    links podem ser editados sem reiniciar o servidor. O índice novo é montado
+    à parte e trocado numa única atribuição: consultas em andamento continuam
+    com o índice anterior. Se a leitura falhar, o índice anterior é mantido.
+    """
+
+    def __init__(self, caminho=None, intervalo_verificacao=None):
+        """
+        Args:
+            caminho (str): Arquivo CSV (padrão: config.PLANILHA_LINKS_ARQUIVO)
+            intervalo_verificacao (float): Segundos entre verificações do mtime
+        """
+        self.caminho = caminho or config.PLANILHA_LINKS_ARQUIVO
+        if intervalo_verificacao is None:
+            intervalo_verificacao = config.PLANILHA_LINKS_VERIFICACAO_SEGUNDOS
+        self.intervalo_verificacao = intervalo_verificacao
+        self.por_ug = {}  # UG normalizada -> {ID do critério: link ou None}
+        self._versao = None  # (mtime, tamanho) do arquivo compilado ou que falhou
+        self._proxima_verificacao = 0
+        self._lock = threading.Lock()
+        self.recarregar()
+
+    def recarregar(self):
+        """Recompila a planilha se o arquivo mudou desde a última leitura."""
+        with self._lock:
+            self._recarregar()
+
+    def _recarregar(self):
+        self._proxima_verificacao = time.monotonic() + self.intervalo_verificacao
+        try:
+            if not os.path.exists(self.caminho):
+                print(f"Aviso: Arquivo CSV não encontrado em {self.caminho}. Será criado um arquivo vazio.")
+                pd.DataFrame(columns=COLUNAS).to_csv(self.caminho, sep=';', index=False)
+            info = os.stat(self.caminho)
+        except Exception as e:
+            print(f"Erro ao acessar a planilha de links {self.caminho}: {e}")
+            return
+        versao = (info.st_mtime_ns, info.st_size)
+        if versao == self._versao:
+            return
+        # Uma versão com erro só é lida de novo quando o arquivo muda
+        self._versao = versao
+        try:
+            por_ug = compilar(pd.read_csv(self.caminho, delimiter=';'))
+        except Exception as e:
+            print(f"Erro ao carregar a planilha de links {self.caminho}: {e}")
+            return
+        self.por_ug = por_ug
+        print(f"Planilha de links carregada: {sum(len(l) for l in por_ug.values())} links de {len(por_ug)} UGs.")
+
+    def _atualizar(self):
+        # Enquanto outra thread recompila, as consultas usam o índice atual
+        if time.monotonic() >= self._proxima_verificacao and self._lock.acquire(blocking=False):
+            try:
+                self._recarregar()
+            finally:
+                self._lock.release()
+
+    def links_da_ug(self, sigla_UG):
+        """Links de uma UG, por ID do critério (não deve ser alterado)."""
+        self._atualizar()
+        return self.por_ug.get(sigla_UG.strip().lower(), {})
+
+    def obter(self, sigla_UG, ID_criterio):
+        """Link do critério para a UG (None se não houver)."""
+        return self.links_da_ug(sigla_UG).get(str(ID_criterio))
+
+def compilar(df):
+    """{UG normalizada: {ID do critério: link}}; vale a primeira linha de cada par."""
+    por_ug = {}
+    for sigla, criterio, link in zip(df['sigla_UG'], df['ID_criterio'].astype(str), df['link']):
+        if not isinstance(sigla, str):
+            continue
+        links = por_ug.setdefault(sigla.strip().lower(), {})
+        if criterio in links:
+            continue
+        if pd.isna(link) or not str(link).strip():
+            links[criterio] = None
+        else:
+            links[criterio] = str(link).strip()
+    return por_ug
+
+_planilha = None
+_lock = threading.Lock()
+
+def obter_planilha_links():
+    """Retorna a planilha compartilhada, carregada no primeiro uso."""
+    global _planilha
+    if _planilha is None:
+        with _lock:
+            if _planilha is None:
+                _planilha = PlanilhaLinks()
+    return _planilha
@@ -0,0 +1,158 @@
+# reavaliacao.py
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+
+import config
+
+# Incrementar quando a lógica das verificações mudar, para não reaproveitar
+# vereditos calculados pela versão anterior
+VERSAO_VERIFICACOES = 1
+
+def impressao_das_paginas(paginas):
+    """Impressão digital combinada das páginas usadas por uma verificação."""
+    if len(paginas) == 1:
+        return paginas[0].impressao_digital
+    return hashlib.sha256("|".join(p.impressao_digital for p in paginas).encode()).hexdigest()
+
+class RegistroVerificacoes:
+    """
+    Vereditos das verificações, guardados com a impressão digital do
+    conteúdo das páginas que usaram (SQLite).
+
+    Numa reavaliação, a verificação cujas páginas não mudaram, e cuja
+    janela de tempo continua a mesma, reaproveita o veredito anterior em vez
+    de interpretar a página de novo. A janela identifica o período de que
+    dependem as verificações sensíveis à data (ex.: o dia, para "atualizado
+    nos últimos 30 dias"; o quadrimestre exigível, para o RGF).
+    """
+
+    def __init__(self, caminho, retencao_dias=None):
+        """
+        Args:
+            caminho (str): Arquivo do banco SQLite
+            retencao_dias (int): Vereditos não confirmados há mais tempo são apagados
+        """
+        self.caminho = caminho
+        self.retencao_dias = retencao_dias or config.REAVALIACAO_RETENCAO_DIAS
+        self.reaproveitadas = 0
+        self.executadas = 0
+        self._contadores = threading.Lock()
+        self._local = threading.local()
+
+        conexao = self._conexao()
+        with conexao:
+            conexao.execute("""
+                CREATE TABLE IF NOT EXISTS verificacoes (
+                    chave TEXT PRIMARY KEY,
+                    impressao TEXT NOT NULL,
+                    janela TEXT NOT NULL,
+                    resultado TEXT NOT NULL,
+                    verificado_em REAL NOT NULL
+                )
+            """)
+            conexao.execute("CREATE INDEX IF NOT EXISTS idx_verificacoes_data ON verificacoes (verificado_em)")
+        self.remover_antigos()
+
+    def _conexao(self):
+        """Conexão da thread atual (conexões SQLite não são compartilhadas entre threads)."""
+        conexao = getattr(self._local, 'conexao', None)
+        if conexao is None:
+            diretorio = os.path.dirname(self.caminho)
+            if diretorio:
+                os.makedirs(diretorio, exist_ok=True)
+            conexao = sqlite3.connect(self.caminho, timeout=30)
+            conexao.execute("PRAGMA journal_mode=WAL")
+            conexao.execute("PRAGMA synchronous=NORMAL")
+            self._local.conexao = conexao
+        return conexao
+
+    def verificar(self, chave, paginas, verificacao, janela=None):
+        """
+        Reaproveita o veredito anterior ou executa a verificação.
+
+        Args:
+            chave (tuple): Identifica a verificação (nome, URL, parâmetros)
+            paginas (list): Páginas (page_store.Pagina) de que o veredito depende
+            verificacao (callable): Calcula o veredito (valor serializável em JSON)
+            janela (str): Período de que a verificação depende (None se não depende da data)
+
+        Returns:
+            tuple: (veredito, reaproveitado)
+        """
+        chave = json.dumps([VERSAO_VERIFICACOES, *chave], ensure_ascii=False)
+        impressao = impressao_das_paginas(paginas)
+        janela = janela or ""
+
+        # Falhas do banco não interrompem a avaliação: a verificação é executada
+        try:
+            linha = self._conexao().execute(
+                "SELECT resultado FROM verificacoes WHERE chave = ? AND impressao = ? AND janela = ?",
+                (chave, impressao, janela)
+            ).fetchone()
+        except sqlite3.Error as e:
+            print(f"Erro ao consultar vereditos anteriores: {e}")
+            linha = None
+        if linha:
+            with self._contadores:
+                self.reaproveitadas += 1
+            return json.loads(linha[0]), True
+
+        resultado = verificacao()
+        with self._contadores:
+            self.executadas += 1
+        try:
+            conexao = self._conexao()
+            with conexao:
+                conexao.execute(
+                    "INSERT OR REPLACE INTO verificacoes (chave, impressao, janela, resultado, verificado_em) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    (chave, impressao, janela, json.dumps(resultado), time.time())
+                )
+        except sqlite3.Error as e:
+            print(f"Erro ao gravar veredito: {e}")
+        return resultado, False
+
+    def estatisticas(self):
+        with self._contadores:
+            total = self.reaproveitadas + self.executadas
+            return {
+                "reaproveitadas": self.reaproveitadas,
+                "executadas": self.executadas,
+                "taxa_reaproveitamento": round(self.reaproveitadas / total, 4) if total else 0.0
+            }
+
+    def remover_antigos(self):
+        """Apaga os vereditos calculados há mais que o prazo de retenção."""
+        limite = time.time() - self.retencao_dias * 86400
+        conexao = self._conexao()
+        with conexao:
+            return conexao.execute("DELETE FROM verificacoes WHERE verificado_em < ?", (limite,)).rowcount
+
+_registro = None
+_lock = threading.Lock()
+
+def obter_registro():
+    """Retorna o registro compartilhado (None se desativado em config.REAVALIACAO_ATIVA)."""
+    global _registro
+    if _registro is None and config.REAVALIACAO_ATIVA:
+        with _lock:
+            if _registro is None:
+                _registro = RegistroVerificacoes(config.REAVALIACAO_ARQUIVO)
+    return _registro
+
+def verificar(chave, paginas, verificacao, janela=None):
+    """
+    RegistroVerificacoes.verificar() no registro compartilhado; com a
+    reavaliação incremental desativada, apenas executa a verificação.
+
+    Returns:
+        tuple: (veredito, reaproveitado)
+    """
+    registro = obter_registro()
+    if registro is None:
+        return verificacao(), False
+    return registro.verificar(chave, paginas, verificacao, janela)
@@ -0,0 +1,172 @@
+# resolvedor_orgaos.py
+import re
+import threading
+from collections import Counter
+
+import config
+from texto import normalize
+
+# Prefixos ignorados na comparação ("Prefeitura de Tefé" e "Tefé" são o mesmo nome)
+PREFIXOS = ('prefeitura municipal de ', 'prefeitura de ', 'camara municipal de ', 'camara de ')
+
+# Palavras comuns a quase todos os nomes, que não distinguem um órgão de outro
+# ("Universidade do Estado do Amazonas" e "Governo do Estado do Amazonas")
+PALAVRAS_COMUNS = frozenset({'de', 'do', 'da', 'dos', 'das', 'e', 'estado', 'amazonas', 'am'})
+
+SEPARADORES_RE = re.compile(r'[^a-z0-9]+')
+
+def chave_do_nome(nome):
+    """
+    Forma canônica de um nome: sem acentos, pontuação, prefixos, palavras
+    comuns e letras soltas (mantidas se o nome só tiver essas palavras).
+    """
+    chave = SEPARADORES_RE.sub(' ', normalize(nome)).strip()
+    for prefixo in PREFIXOS:
+        if chave.startswith(prefixo):
+            chave = chave[len(prefixo):]
+            break
+    distintivas = [palavra for palavra in chave.split() if len(palavra) > 1 and palavra not in PALAVRAS_COMUNS]
+    return ' '.join(distintivas) if distintivas else chave
+
+def trigramas(chave):
+    """Trigramas da chave, com as bordas marcadas (o início pesa mais que o fim)."""
+    texto = f"  {chave} "
+    return {texto[i:i + 3] for i in range(len(texto) - 2)}
+
+class Correspondencia:
+    """Nome encontrado pelo resolvedor e o quanto ele se parece com o buscado."""
+
+    def __init__(self, nome, dados, fonte, score):
+        """
+        Args:
+            nome (str): Nome cadastrado
+            dados (dict): Dados do cadastro (ex: {tipo: URL})
+            fonte (str): Origem do cadastro (known_urls, planilha, ug, banco)
+            score (float): Semelhança entre 0 e 1 (1 = mesmo nome)
+        """
+        self.nome = nome
+        self.dados = dados
+        self.fonte = fonte
+        self.score = score
+
+    def __repr__(self):
+        return f"<Correspondencia(nome='{self.nome}', fonte='{self.fonte}', score={self.score:.2f})>"
+
+class ResolvedorOrgaos:
+    """
+    Índice de nomes de órgãos para correspondência aproximada.
+
+    Os nomes (e apelidos) de todas as fontes são reduzidos a uma chave
+    canônica e indexados por trigramas. resolver() encontra o nome mais
+    parecido pelo coeficiente de Dice dos trigramas, de modo que variações de
+    acentuação, pontuação, prefixo ou pequenos erros de digitação ("Tefe",
+    "Tefé", "Prefeitura Municipal de Tefe") chegam ao mesmo cadastro sem
+    recorrer a uma busca na web.
+    """
+
+    def __init__(self, score_minimo=None):
+        """
+        Args:
+            score_minimo (float): Semelhança mínima para aceitar uma correspondência
+        """
+        self.score_minimo = score_minimo if score_minimo is not None else config.RESOLVEDOR_SCORE_MINIMO
+        self.entradas = []  # (nome, dados, fonte, trigramas, palavras)
+        self.por_chave = {}  # Chave canônica -> índices das entradas, na ordem de cadastro
+        self.por_trigrama = {}  # Trigrama -> índices das entradas
+
+    def adicionar(self, nome, dados, fonte):
+        """Indexa um nome; entre entradas de mesmo score, a cadastrada primeiro tem prioridade."""
+        chave = chave_do_nome(nome)
+        if not chave:
+            return
+        indice = len(self.entradas)
+        grams = trigramas(chave)
+        self.entradas.append((nome, dados, fonte, grams, frozenset(chave.split())))
+        self.por_chave.setdefault(chave, []).append(indice)
+        for gram in grams:
+            self.por_trigrama.setdefault(gram, []).append(indice)
+
+    def resolver(self, nome, score_minimo=None, aceitar=None):
+        """
+        Nome cadastrado mais parecido com `nome`.
+
+        Args:
+            nome (str): Nome buscado
+            score_minimo (float): Semelhança mínima (padrão: a do resolvedor)
+            aceitar (callable): Recebe os dados de uma entrada e diz se ela
+                serve (ex: se tem a URL procurada); as recusadas são puladas
+                em favor da próxima mais parecida
+
+        Returns:
+            Correspondencia or None: Melhor correspondência aceita, se atingir o score mínimo
+        """
+        if score_minimo is None:
+            score_minimo = self.score_minimo
+        chave = chave_do_nome(nome)
+        if not chave:
+            return None
+
+        exatas = self.por_chave.get(chave, ())
+        for indice in exatas:
+            nome_cadastrado, dados, fonte, _, _ = self.entradas[indice]
+            if aceitar is None or aceitar(dados):
+                return Correspondencia(nome_cadastrado, dados, fonte, 1.0)
+
+        grams = trigramas(chave)
+        palavras = frozenset(chave.split())
+        comuns = Counter()
+        for gram in grams:
+            comuns.update(self.por_trigrama.get(gram, ()))
+
+        candidatos = []
+        for indice, quantidade in comuns.items():
+            score = 2 * quantidade / (len(grams) + len(self.entradas[indice][3]))
+            if score < score_minimo or indice in exatas:
+                continue
+            # Uma palavra inteira a mais ou a menos é outro órgão, não um erro
+            # de digitação ("Careiro" e "Careiro da Várzea")
+            palavras_entrada = self.entradas[indice][4]
+            if palavras < palavras_entrada or palavras_entrada < palavras:
+                continue
+            candidatos.append((score, indice))
+        # Do mais parecido ao menos parecido; empate: vale a entrada cadastrada primeiro
+        candidatos.sort(key=lambda candidato: (-candidato[0], candidato[1]))
+
+        for score, indice in candidatos:
+            nome_cadastrado, dados, fonte, _, _ = self.entradas[indice]
+            if aceitar is None or aceitar(dados):
+                return Correspondencia(nome_cadastrado, dados, fonte, score)
+        return None
+
+    def __len__(self):
+        return len(self.entradas)
+
+_resolvedor = None
+_lock = threading.Lock()
+
+def obter_resolvedor():
+    """
+    Retorna o resolvedor compartilhado, montado no primeiro uso com os nomes
+    de known_urls, da planilha de portais do Amazonas e das UGs.
+    """
+    global _resolvedor
+    if _resolvedor is None:
+        with _lock:
+            if _resolvedor is None:
+                _resolvedor = montar_resolvedor()
+    return _resolvedor
+
+def montar_resolvedor():
+    # Importados aqui porque known_urls e ug_config usam este módulo
+    from amazonas_portals import amazonas_portals
+    from known_urls import KNOWN_URLS
+    from ug_config import LINKS_UG
+
+    resolvedor = ResolvedorOrgaos()
+    for nome, urls in KNOWN_URLS.items():
+        resolvedor.adicionar(nome, urls, 'known_urls')
+    for nome, urls in amazonas_portals.registros:
+        resolvedor.adicionar(nome, urls, 'planilha')
+    for sigla, urls in LINKS_UG.items():
+        resolvedor.adicionar(sigla, urls, 'ug')
+    return resolvedor
@@ -0,0 +1,63 @@
+# single_flight.py
+import threading
+
+class _Chamada:
+    def __init__(self):
+        self.concluida = threading.Event()
+        self.resultado = None
+        self.erro = None
+
+class SingleFlight:
+    """
+    Deduplica operações concorrentes idênticas.
+
+    Enquanto uma operação com determinada chave está em andamento, as demais
+    chamadas com a mesma chave não a repetem: esperam a primeira terminar e
+    recebem o mesmo resultado (ou a mesma exceção).
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._em_andamento = {}
+        self.executadas = 0
+        self.compartilhadas = 0
+
+    def executar(self, chave, funcao, *args, **kwargs):
+        """
+        Executa `funcao(*args, **kwargs)`, ou aguarda a execução em andamento
+        com a mesma chave e retorna o resultado dela.
+        """
+        with self._lock:
+            chamada = self._em_andamento.get(chave)
+            lider = chamada is None
+            if lider:
+                chamada = _Chamada()
+                self._em_andamento[chave] = chamada
+                self.executadas += 1
+            else:
+                self.compartilhadas += 1
+
+        if not lider:
+            chamada.concluida.wait()
+            if chamada.erro is not None:
+                raise chamada.erro
+            return chamada.resultado
+
+        try:
+            chamada.resultado = funcao(*args, **kwargs)
+            return chamada.resultado
+        except Exception as e:
+            chamada.erro = e
+            raise
+        finally:
+            with self._lock:
+                del self._em_andamento[chave]
+            chamada.concluida.set()
+
+    def estatisticas(self):
+        with self._lock:
+            return {
+                "executadas": self.executadas,
+                "compartilhadas": self.compartilhadas,
+                "em_andamento": len(self._em_andamento)
+            }
@@ -0,0 +1,61 @@
+# test_agendador_hosts.py
+import threading
+import time
+
+from agendador_hosts import AgendadorHosts, LimiteHost
+
+def test_rajada_sai_sem_espera_e_depois_segue_a_taxa():
+    agendador = AgendadorHosts({}, LimiteHost(taxa=20, rajada=3, max_concorrentes=10))
+    inicio = time.monotonic()
+    for _ in range(3):
+        with agendador.reservar("https://a.am.gov.br/"):
+            pass
+    assert time.monotonic() - inicio < 0.05
+
+    # Mais 4 requisições com o bucket vazio: ~4/20 s
+    for _ in range(4):
+        with agendador.reservar("https://a.am.gov.br/"):
+            pass
+    assert time.monotonic() - inicio >= 0.18
+
+def test_hosts_diferentes_nao_dividem_o_bucket():
+    agendador = AgendadorHosts({}, LimiteHost(taxa=1, rajada=1, max_concorrentes=1))
+    inicio = time.monotonic()
+    for host in ("a.am.gov.br", "b.am.gov.br", "c.am.gov.br"):
+        with agendador.reservar(f"https://{host}/pagina"):
+            pass
+    assert time.monotonic() - inicio < 0.05
+    assert set(agendador.estatisticas()["hosts"]) == {"a.am.gov.br", "b.am.gov.br", "c.am.gov.br"}
+
+def test_limite_por_dominio_pai():
+    buscador = LimiteHost(taxa=0.5, rajada=1, max_concorrentes=1)
+    agendador = AgendadorHosts({"duckduckgo.com": buscador}, LimiteHost(10, 10, 10))
+    assert agendador.limite_de("html.duckduckgo.com") is buscador
+    assert agendador.limite_de("manaus.am.gov.br") is agendador.limite_padrao
+
+def test_max_concorrentes_por_host():
+    agendador = AgendadorHosts({}, LimiteHost(taxa=1000, rajada=100, max_concorrentes=2))
+    ativos = 0
+    maximo = 0
+    lock = threading.Lock()
+
+    def requisitar():
+        nonlocal ativos, maximo
+        with agendador.reservar("https://a.am.gov.br/"):
+            with lock:
+                ativos += 1
+                maximo = max(maximo, ativos)
+            time.sleep(0.05)
+            with lock:
+                ativos -= 1
+
+    threads = [threading.Thread(target=requisitar) for _ in range(6)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert maximo == 2
+    estatisticas = agendador.estatisticas()
+    assert estatisticas["em_andamento_total"] == 0
+    assert estatisticas["hosts"]["a.am.gov.br"]["requisicoes"] == 6
@@ -0,0 +1,36 @@
+# test_amazonas_portals.py
+import pandas as pd
+import pytest
+
+from amazonas_portals import AmazonasPortals
+
+LINHAS = [
+    ("Tefé", "www.tefe.am.gov.br", None),
+    ("São Gabriel da Cachoeira", "saogabrieldacachoeira.am.gov.br", "transparencia.sgc.am.gov.br"),
+    ("Careiro da Várzea", "careirodavarzea.am.gov.br", None),
+]
+
+@pytest.fixture
+def portais(monkeypatch):
+    def carregar(self):
+        self.data = pd.DataFrame(LINHAS, columns=["nome_municipio", "site_oficial", "portal_transparencia"])
+        self.data["nome_municipio_norm"] = self.data["nome_municipio"].apply(self.normalize)
+    monkeypatch.setattr(AmazonasPortals, "load_data", carregar)
+    return AmazonasPortals()
+
+def test_nome_exato_e_com_prefixo(portais):
+    assert portais.get_url("Tefe") == "https://www.tefe.am.gov.br"
+    assert portais.get_url("Prefeitura Municipal de São Gabriel da Cachoeira") == "https://saogabrieldacachoeira.am.gov.br"
+
+def test_palavra_digitada_pela_metade(portais):
+    assert portais.get_url("sao gab") == "https://saogabrieldacachoeira.am.gov.br"
+    assert portais.get_url("Careiro") == "https://careirodavarzea.am.gov.br"
+
+def test_trecho_do_meio_da_palavra(portais):
+    # Fora do índice de palavras: encontrado pela busca por substring
+    assert portais.get_url("abriel") == "https://saogabrieldacachoeira.am.gov.br"
+    assert portais.get_url("achoeira", "portal_transparencia") == "https://transparencia.sgc.am.gov.br"
+
+def test_sem_correspondencia(portais):
+    assert portais.get_url("Manaus") is None
+    assert portais.get_url("Careiro da Várzea", "portal_transparencia") is None
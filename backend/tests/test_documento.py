@@ -0,0 +1,50 @@
+# test_documento.py
+import requests
+
+import http_client
+from documento import Documento
+from page_store import PageStore
+from texto import BuscadorTermos, TextoNormalizado
+
+HTML = """
+<html><body>
+  <h1>Relatório de Gestão Fiscal</h1>
+  <p>Última atualização: 30/04/2024</p>
+  <ul><li>Licitações</li><li>Contratações diretas</li></ul>
+</body></html>
+"""
+
+def test_trecho_volta_ao_texto_original():
+    texto = TextoNormalizado("Relatório Fiscal – São Gabriel")
+    inicio = texto.texto.index("sao gabriel")
+    assert texto.trecho(inicio, inicio + len("sao gabriel")) == "São Gabriel"
+
+def test_trechos_com_acentos_e_contexto():
+    documento = Documento.de(HTML)
+    trechos = documento.trechos(BuscadorTermos(["atualizacao", "licitacoes"]), contexto=5)
+    assert trechos == ["tima atualização: 30/", "2024 Licitações Cont"]
+
+def test_trechos_respeitam_o_limite():
+    documento = Documento.de("<p>" + " ".join(f"portal {i}" for i in range(10)) + "</p>")
+    assert len(documento.trechos(BuscadorTermos(["portal"]), contexto=0, limite=3)) == 1
+    assert len(documento.trechos(BuscadorTermos(["portal"]), contexto=3, limite=3)) == 3
+
+def test_trechos_do_item(monkeypatch, tmp_path):
+    # O scraper cria o cache de buscas no diretório atual ao ser importado
+    monkeypatch.chdir(tmp_path)
+    import scraper
+
+    def servir(url, **kwargs):
+        response = requests.Response()
+        response.status_code = 200
+        response.url = url
+        response.encoding = "utf-8"
+        response._content = HTML.encode("utf-8")
+        return response
+    monkeypatch.setattr(http_client, "get", servir)
+    store = PageStore()
+
+    pergunta = "Divulga o Relatório de Gestão Fiscal?"
+    assert scraper.verificar_item("https://exemplo.am.gov.br/rgf", pergunta, store)
+    trechos = scraper.trechos_do_item("https://exemplo.am.gov.br/rgf", pergunta, store)
+    assert trechos and "Relatório de Gestão Fiscal" in trechos[0]
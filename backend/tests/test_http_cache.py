@@ -0,0 +1,80 @@
+# test_http_cache.py
+import time
+
+import requests
+
+from http_cache import CacheHTTP
+
+URL = "https://exemplo.am.gov.br/transparencia"
+
+def resposta(status, corpo=b"", cabecalhos=None):
+    response = requests.Response()
+    response.status_code = status
+    response.url = URL
+    response.headers.update(cabecalhos or {})
+    response.encoding = "utf-8"
+    response._content = corpo
+    return response
+
+class Servidor:
+    """Dublê de baixar(): devolve as respostas na ordem e guarda os pedidos."""
+
+    def __init__(self, *respostas):
+        self.respostas = list(respostas)
+        self.pedidos = []
+
+    def __call__(self, url, **kwargs):
+        self.pedidos.append(kwargs.get("headers") or {})
+        return self.respostas.pop(0)
+
+def expira_em(cache):
+    return cache._conexao().execute("SELECT expira_em FROM respostas WHERE url = ?", (URL,)).fetchone()[0]
+
+def test_304_renova_validade_e_devolve_corpo_guardado(tmp_path):
+    cache = CacheHTTP(str(tmp_path / "cache.sqlite"), frescor_segundos=0)
+    servidor = Servidor(
+        resposta(200, b"<html>portal</html>", {"ETag": '"v1"', "Cache-Control": "max-age=0"}),
+        resposta(304, cabecalhos={"ETag": '"v1"', "Cache-Control": "max-age=600"}),
+    )
+
+    primeira = cache.get(servidor, URL)
+    assert primeira.status_code == 200
+    anterior = expira_em(cache)
+
+    segunda = cache.get(servidor, URL)
+    assert servidor.pedidos[1]["If-None-Match"] == '"v1"'
+    assert segunda.status_code == 200
+    assert segunda.content == b"<html>portal</html>"
+    assert segunda.from_cache
+    assert expira_em(cache) > anterior
+    assert expira_em(cache) >= time.time() + 590
+    assert cache.estatisticas()["revalidados"] == 1
+
+def test_revalida_mesmo_dentro_da_validade(tmp_path):
+    cache = CacheHTTP(str(tmp_path / "cache.sqlite"), frescor_segundos=0)
+    servidor = Servidor(
+        resposta(200, b"v1", {"ETag": '"v1"', "Cache-Control": "max-age=600"}),
+        resposta(404),
+    )
+    cache.get(servidor, URL)
+
+    # Por padrão a disponibilidade é sempre conferida no servidor
+    assert cache.get(servidor, URL).status_code == 404
+    assert len(servidor.pedidos) == 2
+
+def test_sem_revalidar_serve_do_disco_ate_expirar(tmp_path):
+    cache = CacheHTTP(str(tmp_path / "cache.sqlite"), frescor_segundos=0)
+    servidor = Servidor(
+        resposta(200, b"v1", {"Cache-Control": "max-age=600"}),
+        resposta(200, b"v2"),
+    )
+    cache.get(servidor, URL)
+    assert cache.get(servidor, URL, revalidar=False).content == b"v1"
+    assert len(servidor.pedidos) == 1
+
+    # Entrada vencida: volta à rede mesmo com revalidar=False
+    conexao = cache._conexao()
+    with conexao:
+        conexao.execute("UPDATE respostas SET expira_em = ? WHERE url = ?", (time.time() - 1, URL))
+    assert cache.get(servidor, URL, revalidar=False).content == b"v2"
+    assert len(servidor.pedidos) == 2
@@ -0,0 +1,77 @@
+# test_page_store.py
+import threading
+import time
+
+import requests
+
+import http_client
+from page_store import PageStore
+
+URL = "https://exemplo.am.gov.br/transparencia"
+
+class ServidorLento:
+    """Dublê de http_client.get que conta os GETs e demora a responder."""
+
+    def __init__(self, demora=0.2):
+        self.demora = demora
+        self.gets = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, url, **kwargs):
+        with self._lock:
+            self.gets += 1
+        time.sleep(self.demora)
+        response = requests.Response()
+        response.status_code = 200
+        response.url = url
+        response._content = b"<html><body>Portal da Transparencia</body></html>"
+        return response
+
+def obter_em_paralelo(stores, urls):
+    inicio = threading.Barrier(len(urls))
+    paginas = [None] * len(urls)
+
+    def obter(i):
+        inicio.wait()
+        paginas[i] = stores[i % len(stores)].obter(urls[i])
+
+    threads = [threading.Thread(target=obter, args=(i,)) for i in range(len(urls))]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    return paginas
+
+def test_mesma_url_em_paralelo_faz_um_get(monkeypatch):
+    servidor = ServidorLento()
+    monkeypatch.setattr(http_client, "get", servidor)
+    store = PageStore()
+
+    paginas = obter_em_paralelo([store], [URL] * 8)
+
+    assert servidor.gets == 1
+    assert all(p is paginas[0] for p in paginas)
+    assert paginas[0].disponivel
+
+def test_stores_diferentes_compartilham_o_download(monkeypatch):
+    servidor = ServidorLento()
+    monkeypatch.setattr(http_client, "get", servidor)
+
+    # Grafias diferentes da mesma URL canônica, em avaliações diferentes
+    paginas = obter_em_paralelo(
+        [PageStore(), PageStore()],
+        [URL, URL.replace("exemplo", "EXEMPLO"), URL + "#inicio", URL]
+    )
+
+    assert servidor.gets == 1
+    assert all(p.disponivel for p in paginas)
+
+def test_falha_do_download_vira_pagina_indisponivel(monkeypatch):
+    def falhar(url, **kwargs):
+        raise requests.ConnectionError("fora do ar")
+    monkeypatch.setattr(http_client, "get", falhar)
+
+    pagina = PageStore().obter(URL)
+
+    assert not pagina.disponivel
+    assert isinstance(pagina.erro, requests.ConnectionError)
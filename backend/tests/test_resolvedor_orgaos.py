@@ -0,0 +1,35 @@
+# test_resolvedor_orgaos.py
+import pytest
+
+from resolvedor_orgaos import ResolvedorOrgaos, chave_do_nome
+
+@pytest.fixture
+def resolvedor():
+    resolvedor = ResolvedorOrgaos(score_minimo=0.6)
+    for nome in ("Tefé", "Careiro", "Careiro da Várzea", "São Gabriel da Cachoeira",
+                 "Universidade do Estado do Amazonas"):
+        resolvedor.adicionar(nome, {"site_oficial": f"https://{chave_do_nome(nome).replace(' ', '')}.am.gov.br"}, "teste")
+    resolvedor.adicionar("Câmara Municipal de Tefé", {}, "teste")
+    return resolvedor
+
+@pytest.mark.parametrize("nome", ["Tefe", "TEFÉ", "Prefeitura Municipal de Tefé", "Tefé."])
+def test_variacoes_do_nome_sao_exatas(resolvedor, nome):
+    correspondencia = resolvedor.resolver(nome)
+    assert correspondencia.nome == "Tefé"
+    assert correspondencia.score == 1.0
+
+def test_erro_de_digitacao(resolvedor):
+    assert resolvedor.resolver("Sao Gabriel da Cachoera").nome == "São Gabriel da Cachoeira"
+
+def test_palavra_a_mais_ou_a_menos_e_outro_orgao(resolvedor):
+    assert resolvedor.resolver("Careiro").nome == "Careiro"
+    assert resolvedor.resolver("Careiro da Várzea").nome == "Careiro da Várzea"
+    assert resolvedor.resolver("Careiro Castanho") is None
+
+def test_palavras_comuns_nao_bastam(resolvedor):
+    assert resolvedor.resolver("Governo do Estado do Amazonas") is None
+
+def test_aceitar_pula_entradas_recusadas(resolvedor):
+    correspondencia = resolvedor.resolver("Tefé", aceitar=lambda dados: "site_oficial" in dados)
+    assert correspondencia.dados["site_oficial"] == "https://tefe.am.gov.br"
+    assert resolvedor.resolver("Tefé", aceitar=lambda dados: "portal" in dados) is None
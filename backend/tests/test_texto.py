@@ -0,0 +1,42 @@
+# test_texto.py
+import pytest
+
+from texto import BuscadorTermos, normalize
+
+TERMOS = [
+    "atualizado", "atualizado em", "ultima atualizacao", "atualizacao",
+    "data", "data de atualizacao", "licitação", "licitações", "ação"
+]
+
+TEXTOS = [
+    "",
+    "Página atualizada em 10/05",
+    "Atualizado em 10/05/2024 - última atualização do portal",
+    "Data de atualização: ontem",
+    "Licitações e contratos; dispensa de licitação",
+    "dados abertos sem termo algum",
+    "atualizadoatualizado em",
+]
+
+def encontrar_termo_a_termo(termos, texto):
+    """Laço antigo: um teste `termo in texto` por palavra-chave."""
+    return {termo for termo in map(normalize, termos) if termo and termo in texto}
+
+@pytest.mark.parametrize("texto", TEXTOS)
+def test_encontrar_igual_ao_laco_por_termo(texto):
+    texto = normalize(texto)
+    buscador = BuscadorTermos(TERMOS)
+    assert buscador.encontrar(texto) == encontrar_termo_a_termo(TERMOS, texto)
+    assert buscador.algum(texto) == bool(encontrar_termo_a_termo(TERMOS, texto))
+
+def test_ocorrencias_sobrepostas():
+    buscador = BuscadorTermos(["data de atualizacao", "atualizacao", "data"])
+    ocorrencias = buscador.ocorrencias(normalize("Data de atualização"))
+    assert (0, "data de atualizacao") in ocorrencias
+    assert (0, "data") in ocorrencias
+    assert (8, "atualizacao") in ocorrencias
+
+def test_sem_termos():
+    buscador = BuscadorTermos(["", None])
+    assert buscador.encontrar("qualquer texto") == set()
+    assert not buscador.algum("qualquer texto")
@@ -0,0 +1,150 @@
+# texto.py
+import re
+import sys
+from array import array
+from functools import lru_cache
+
+from unidecode import unidecode
+
+import config
+
+NAO_ASCII_RE = re.compile(r'[^\x00-\x7f]+')
+
+class _TabelaNormalizacao(dict):
+    """
+    Tabela para str.translate: transliteração (unidecode) e minúsculas de
+    cada caractere, calculada na primeira vez em que ele aparece.
+    """
+
+    def __missing__(self, codigo):
+        valor = unidecode(chr(codigo)).lower()
+        self[codigo] = valor
+        return valor
+
+_TABELA = _TabelaNormalizacao()
+
+@lru_cache(maxsize=config.NORMALIZE_CACHE_TAMANHO)
+def _normalizar_curto(text):
+    # Rótulos curtos (menus, links, botões) se repetem entre páginas e órgãos:
+    # o resultado é memorizado e internado, para que as repetições compartilhem a string
+    return sys.intern(text.translate(_TABELA).strip())
+
+def normalize(text):
+    """Remove acentuação e converte para minúsculas."""
+    if text is None:
+        return ""
+    if type(text) is not str:
+        # Ex.: NavigableString, que manteria a árvore inteira viva no cache
+        text = str(text)
+    if len(text) <= config.NORMALIZE_MEMO_MAX_CARACTERES:
+        return _normalizar_curto(text)
+    return text.translate(_TABELA).strip()
+
+class TextoNormalizado:
+    """
+    Texto de um documento normalizado de uma só vez, com a posição de cada
+    caractere normalizado no texto original.
+
+    Permite procurar termos no texto normalizado e recortar a evidência
+    correspondente no texto original, com acentos e maiúsculas.
+    """
+
+    def __init__(self, original):
+        """
+        Args:
+            original (str): Texto original (não são removidos espaços das pontas,
+                para preservar as posições)
+        """
+        self.original = original
+        if original.isascii():
+            self.texto = original.lower()
+            self.posicoes = range(len(original))
+            return
+
+        partes = []
+        posicoes = array('l')
+        inicio = 0
+        for m in NAO_ASCII_RE.finditer(original):
+            partes.append(original[inicio:m.start()].lower())
+            posicoes.extend(range(inicio, m.start()))
+            for i in range(m.start(), m.end()):
+                convertido = _TABELA[ord(original[i])]
+                partes.append(convertido)
+                posicoes.extend([i] * len(convertido))
+            inicio = m.end()
+        partes.append(original[inicio:].lower())
+        posicoes.extend(range(inicio, len(original)))
+        self.texto = ''.join(partes)
+        self.posicoes = posicoes
+
+    def posicao_original(self, indice):
+        """Posição no texto original do caractere `indice` do texto normalizado."""
+        return self.posicoes[indice]
+
+    def trecho(self, inicio, fim, contexto=0):
+        """
+        Trecho do texto original correspondente a texto[inicio:fim], com
+        `contexto` caracteres extras de cada lado.
+        """
+        if fim <= inicio or inicio >= len(self.texto):
+            return ""
+        comeco = self.posicoes[inicio]
+        final = self.posicoes[min(fim, len(self.texto)) - 1] + 1
+        return self.original[max(0, comeco - contexto):final + contexto]
+
+class BuscadorTermos:
+    """
+    Procura várias palavras-chave de uma só vez em um texto normalizado.
+
+    Os termos são normalizados e compilados em uma única expressão regular.
+    algum() para na primeira ocorrência; ocorrencias() usa a mesma alternação
+    em um lookahead, testado em cada posição do texto, e encontra em uma
+    passada todas as ocorrências, inclusive sobrepostas. Termos que são
+    prefixo de outro (ex.: "atualizado" em "atualizado em") são informados
+    junto com o termo mais longo.
+    """
+
+    def __init__(self, termos):
+        """
+        Args:
+            termos (iterable): Palavras-chave (com ou sem acento)
+        """
+        self.termos = tuple(dict.fromkeys(t for t in map(normalize, termos) if t))
+        self._prefixos = {
+            termo: [outro for outro in self.termos if outro != termo and termo.startswith(outro)]
+            for termo in self.termos
+        }
+        if self.termos:
+            # Os mais longos primeiro, para que o prefixo não esconda o termo completo
+            alternativas = '|'.join(map(re.escape, sorted(self.termos, key=len, reverse=True)))
+            self._regex = re.compile(alternativas)
+            self._regex_sobreposto = re.compile(f'(?=({alternativas}))')
+        else:
+            self._regex = self._regex_sobreposto = None
+
+    def ocorrencias(self, texto):
+        """
+        Returns:
+            list: Tuplas (posição, termo) de todas as ocorrências, em ordem
+        """
+        if self._regex is None or not texto:
+            return []
+        resultado = []
+        for m in self._regex_sobreposto.finditer(texto):
+            termo = m.group(1)
+            resultado.append((m.start(), termo))
+            resultado.extend((m.start(), prefixo) for prefixo in self._prefixos[termo])
+        return resultado
+
+    def encontrar(self, texto):
+        """Conjunto dos termos presentes no texto."""
+        return {termo for _, termo in self.ocorrencias(texto)}
+
+    def algum(self, texto):
+        """True se ao menos um termo aparece no texto."""
+        return self._regex is not None and bool(texto) and self._regex.search(texto) is not None
+
+@lru_cache(maxsize=512)
+def compilar_termos(termos):
+    """BuscadorTermos compartilhado para uma tupla de termos (listas montadas em tempo de execução)."""
+    return BuscadorTermos(termos)
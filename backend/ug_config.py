@@ -1,4 +1,18 @@
 # ug_config.py
+from resolvedor_orgaos import obter_resolvedor
+
+# Links conhecidos por sigla de unidade gestora
+LINKS_UG = {
+    "tce": {
+        "site_oficial": "https://www2.tce.am.gov.br/",
+        "portal_transparencia": "https://transparencia.tce.am.gov.br/"
+    },
+    "sefaz": {
+        "site_oficial": "https://www.sefaz.am.gov.br/",
+        "portal_transparencia": "http://sistemas.sefaz.am.gov.br/transparencia/"
+    }
+    # Adicione mais UGs conforme necessário
+}
 
 def get_ug_link(ug, tipo="site_oficial"):
     """
@@ -11,21 +25,13 @@ def get_ug_link(ug, tipo="site_oficial"):
     Returns:
         str or None: URL se conhecida, None caso contrário
     """
-    # Dicionário de links conhecidos
-    links = {
-        "tce": {
-            "site_oficial": "https://www2.tce.am.gov.br/",
-            "portal_transparencia": "https://transparencia.tce.am.gov.br/"
-        },
-        "sefaz": {
-            "site_oficial": "https://www.sefaz.am.gov.br/",
-            "portal_transparencia": "http://sistemas.sefaz.am.gov.br/transparencia/"
-        }
-        # Adicione mais UGs conforme necessário
-    }
-    
     ug = ug.lower()
-    if ug in links and tipo in links[ug]:
-        return links[ug][tipo]
+    if ug in LINKS_UG and tipo in LINKS_UG[ug]:
+        return LINKS_UG[ug][tipo]
+    
+    # Sigla escrita de outra forma (ex: "TCE-AM") ou nome por extenso
+    correspondencia = obter_resolvedor().resolver(ug, aceitar=lambda dados: dados.get(tipo))
+    if correspondencia:
+        return correspondencia.dados[tipo]
     
     return None
\ No newline at end of file
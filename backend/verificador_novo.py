@@ -9,6 +9,11 @@ from bs4 import BeautifulSoup
 import time
 import re
 import random
+from urllib.parse import urlencode
+
+import config
+import criterios
+import driver_pool
 
 class VerificadorTransparencia:
     def __init__(self):
@@ -34,45 +39,8 @@ class VerificadorTransparencia:
         self.driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
         
     def obter_perguntas_padrao(self):
-        """Retorna a lista de perguntas padronizadas."""
-        return [
-            {
-                "id": "1.1",
-                "pergunta": "Possui sítio oficial próprio na internet?",
-                "classificacao": "Essencial"
-            },
-            {
-                "id": "1.2",
-                "pergunta": "Possui portal da transparência próprio ou compartilhado na internet?",
-                "classificacao": "Essencial"
-            },
-            {
-                "id": "2.1",
-                "pergunta": "Divulga a sua estrutura organizacional?",
-                "classificacao": "Obrigatória"
-            },
-            {
-                "id": "2.2",
-                "pergunta": "Divulga competências e/ou atribuições?",
-                "classificacao": "Obrigatória"
-            },
-            {
-                "id": "2.3",
-                "pergunta": "Identifica o nome dos atuais responsáveis pela gestão do Poder/Órgão?",
-                "classificacao": "Obrigatória"
-            },
-            {
-                "id": "2.4",
-                "pergunta": "Divulga os endereços e telefones atuais do Poder ou órgão e e-mails institucionais?",
-                "classificacao": "Obrigatória"
-            },
-            {
-                "id": "8.1",
-                "pergunta": "Divulga a relação das licitações em ordem sequencial?",
-                "classificacao": "Obrigatória"
-            }
-            # Adicione mais perguntas conforme necessário
-        ]
+        """Retorna a lista de perguntas padronizadas (matriz "verificador" de data/criterios.json)."""
+        return criterios.obter_registro().perguntas("verificador")
     
     def extrair_palavras_chave(self, pergunta):
         """Extrai palavras-chave da pergunta."""
@@ -194,13 +162,16 @@ class VerificadorTransparencia:
                     campos_busca = self.driver.find_elements(By.CSS_SELECTOR, seletor)
                     if campos_busca:
                         campo = campos_busca[0]
-                        campo.clear()
-                        for char in termos_busca:
-                            campo.send_keys(char)
-                            time.sleep(0.05)  # Digitar como humano
-                        time.sleep(0.5)
-                        campo.send_keys(Keys.RETURN)
-                        time.sleep(3)  # Aguardar resultados
+                        url_busca = self.url_da_busca_interna(campo, termos_busca)
+                        if url_busca:
+                            # Ir direto para a página de resultados
+                            self.driver.get(url_busca)
+                        elif config.SELENIUM_DIGITACAO_FALLBACK:
+                            driver_pool.digitar_como_humano(campo, termos_busca)
+                        else:
+                            campo.clear()
+                            campo.send_keys(termos_busca, Keys.RETURN)
+                        driver_pool.aguardar_carregamento(self.driver)
                         
                         # Avaliar página de resultados
                         pontuacao_busca = self.pontuar_pagina_atual(palavras_chave)
@@ -290,6 +261,29 @@ class VerificadorTransparencia:
             print(f"Erro ao verificar item: {e}")
             return {"atende": False, "pontuacao": 0, "url": url, "observacao": f"Erro: {str(e)}"}
     
+    def url_da_busca_interna(self, campo, termos):
+        """
+        Monta a URL de resultados da busca interna a partir do formulário do
+        campo (apenas formulários GET com campo nomeado). Retorna None quando
+        a busca precisa ser enviada pela página.
+        """
+        try:
+            nome = campo.get_attribute("name")
+            formulario = campo.find_element(By.XPATH, "./ancestor::form")
+            metodo = (formulario.get_attribute("method") or "get").lower()
+            acao = formulario.get_attribute("action") or self.driver.current_url
+            # Campos ocultos do formulário (ex.: option=com_search) também vão na URL
+            parametros = {
+                oculto.get_attribute("name"): oculto.get_attribute("value") or ""
+                for oculto in formulario.find_elements(By.CSS_SELECTOR, "input[type='hidden'][name]")
+            }
+        except Exception:
+            return None
+        if not nome or metodo != "get":
+            return None
+        parametros[nome] = termos
+        return f"{acao.split('?')[0]}?{urlencode(parametros)}"
+    
     def pontuar_pagina_atual(self, palavras_chave):
         """Avalia o conteúdo da página atual."""
         try:
@@ -1,5 +1,5 @@
 # verificador_site_oficial.py
-import requests
+import http_client
 from bs4 import BeautifulSoup
 import re
 import time
@@ -54,7 +54,7 @@ class VerificadorSiteOficial:
         
         # Verificar se o site está acessível
         try:
-            response = requests.get(url, timeout=10)
+            response = http_client.get(url, timeout=10)
             if response.status_code != 200:
                 resultado["observacoes"] = f"Site não acessível. Código de status: {response.status_code}"
                 return resultado
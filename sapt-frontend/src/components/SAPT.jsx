@@ -100,6 +100,7 @@ export default function SAPT() {
   const [totalPerguntas, setTotalPerguntas] = useState(0);
   const [perguntaAtual, setPerguntaAtual] = useState('');
   const [eventSource, setEventSource] = useState(null);
+  const [jobId, setJobId] = useState(null);
 
   // Atualiza Matrizes de acordo com a esfera
   useEffect(() => {
@@ -190,7 +191,8 @@ export default function SAPT() {
     
     // Enviar solicitação para o backend cancelar o processamento
     try {
-      const response = await fetch('http://localhost:5000/api/cancelar-avaliacao', {
+      if (!jobId) return;
+      const response = await fetch(`http://localhost:5000/api/cancelar-avaliacao/${jobId}`, {
         method: 'POST',
         headers: {
           'Content-Type': 'application/json'
@@ -234,11 +236,12 @@ async function handleBuscar() {
     }
     
     const initData = await initResponse.json();
+    setJobId(initData.jobId);
     setTotalPerguntas(initData.totalPerguntas || 60); // Fallback para 60 se não receber o total
     setStatusMessage('Buscando site oficial e portal de transparência...');
     
-    // Depois inicia o EventSource para receber os resultados
-    const newEventSource = new EventSource('http://localhost:5000/api/stream-resultados');
+    // Depois inicia o EventSource para receber os resultados deste job
+    const newEventSource = new EventSource(`http://localhost:5000/api/stream-resultados/${initData.jobId}`);
     setEventSource(newEventSource);
     
     newEventSource.onmessage = (event) => {
@@ -268,6 +271,12 @@ async function handleBuscar() {
     };
     
     newEventSource.onerror = (error) => {
+      // Enquanto o navegador tenta reconectar, o servidor reenvia apenas os
+      // eventos perdidos (Last-Event-ID); não é preciso refazer a avaliação
+      if (newEventSource.readyState === EventSource.CONNECTING) {
+        setStatusMessage('Conexão interrompida. Reconectando...');
+        return;
+      }
       console.error('Erro na conexão SSE:', error);
       newEventSource.close();
       setEventSource(null);
@@ -286,7 +295,9 @@ async function handleBuscar() {
     
     // Tratar erros específicos
     newEventSource.addEventListener('error', (event) => {
-      const data = JSON.parse(event.data || '{}');
+      // Erros de conexão (sem dados) são tratados em onerror
+      if (!event.data) return;
+      const data = JSON.parse(event.data);
       newEventSource.close();
       setEventSource(null);
       setIsLoading(false);
@@ -520,6 +531,7 @@ async function handleBuscar() {
                       {item.linkEvidencia
                         ? <a 
                             href={item.linkEvidencia} 
+                            title={(item.trechosEvidencia || []).join("\n")}
                             rel="noopener noreferrer" 
                             className="text-blue-600 hover:underline"
                           >